@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+from loguru import logger
+
+from constants import BACKUP_COMPRESS_LEVEL, BACKUP_KEEP
+from db_backup import Progress, backup_to_file
+
+# Snapshot files are named home_reminders-<timestamp>-<hash>.db.gz, where
+# hash is the start of the SHA-256 of the uncompressed database.
+SNAPSHOT_PREFIX = "home_reminders"
+_SNAPSHOT_NAME = re.compile(
+    rf"^{SNAPSHOT_PREFIX}-(\d{{8}}-\d{{6}}-\d{{6}})-([0-9a-f]{{16}})\.db\.gz$"
+)
+_TIMESTAMP = "%Y%m%d-%H%M%S-%f"
+# Bytes read at a time when hashing and compressing.
+_CHUNK = 1 << 20
+
+
+class Snapshot(NamedTuple):
+    """
+    A compressed backup of the database in a BackupStore.
+    """
+
+    path: str
+    created: datetime
+    digest: str
+    size: int
+
+    @property
+    def label(self) -> str:
+        """
+        The snapshot as shown in the restore picker.
+        """
+        return (
+            f"{self.created:%Y-%m-%d %H:%M:%S}  ({self.size / 1024:,.0f} KB)"
+        )
+
+
+def file_digest(path: str | os.PathLike) -> str:
+    """
+    Returns the SHA-256 of a file as a hex string.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackupStore:
+    """
+    Keeps timestamped, gzip-compressed snapshots of the database in a
+    directory.
+
+    A new snapshot is only written when the database has changed since the
+    latest one, which is detected by the content hash that is part of each
+    snapshot's file name. Only the newest keep snapshots are kept. Snapshots
+    are taken with the online backup API, so the database stays in use.
+    """
+
+    def __init__(self, directory: str, keep: int = BACKUP_KEEP):
+        self.directory = directory
+        self.keep = keep
+
+    def snapshots(self) -> List[Snapshot]:
+        """
+        Returns the snapshots in the store, newest first.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        snapshots = []
+        for entry in os.scandir(self.directory):
+            match = _SNAPSHOT_NAME.match(entry.name)
+            if match and entry.is_file():
+                snapshots.append(
+                    Snapshot(
+                        entry.path,
+                        datetime.strptime(match[1], _TIMESTAMP),
+                        match[2],
+                        entry.stat().st_size,
+                    )
+                )
+        return sorted(snapshots, key=lambda s: s.created, reverse=True)
+
+    def latest(self) -> Optional[Snapshot]:
+        """
+        Returns the newest snapshot, or None if the store is empty.
+        """
+        snapshots = self.snapshots()
+        return snapshots[0] if snapshots else None
+
+    def snapshot(
+        self,
+        con: sqlite3.Connection,
+        progress: Optional[Progress] = None,
+        now: Optional[datetime] = None,
+    ) -> Optional[Snapshot]:
+        """
+        Takes a snapshot of the database, unless it is unchanged since the
+        latest snapshot, and prunes old snapshots.
+
+        Args:
+            con (sqlite3.Connection): The connection to the database.
+            progress (Progress): Called after each step of the backup.
+            now (datetime): The time stamp of the snapshot, now by default.
+        Returns:
+            Optional[Snapshot]: The new snapshot, or None if the database was
+            unchanged.
+        Raises:
+            sqlite3.DatabaseError: If the backup fails or fails quick_check.
+            OSError: If the snapshot cannot be written.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        db_path = os.path.join(self.directory, "snapshot.db.tmp")
+        try:
+            backup_to_file(con, db_path, progress=progress)
+            digest = file_digest(db_path)[:16]
+            latest = self.latest()
+            if latest is not None and latest.digest == digest:
+                logger.info("Database unchanged since the last backup.")
+                return None
+            created = now or datetime.now()
+            name = f"{SNAPSHOT_PREFIX}-{created:{_TIMESTAMP}}-{digest}.db.gz"
+            path = os.path.join(self.directory, name)
+            with open(db_path, "rb") as src:
+                with gzip.open(
+                    f"{path}.tmp", "wb", compresslevel=BACKUP_COMPRESS_LEVEL
+                ) as dst:
+                    shutil.copyfileobj(src, dst, _CHUNK)
+            os.replace(f"{path}.tmp", path)
+        finally:
+            if os.path.exists(db_path):
+                os.remove(db_path)
+        logger.info(f"Database backed up to {name}.")
+        self.prune()
+        return Snapshot(path, created, digest, os.path.getsize(path))
+
+    def prune(self) -> None:
+        """
+        Deletes all but the newest keep snapshots.
+        """
+        for old in self.snapshots()[self.keep :]:
+            os.remove(old.path)
+            logger.info(f"Deleted old backup {os.path.basename(old.path)}.")
+
+    def extract(
+        self,
+        snapshot: Snapshot,
+        path: str | os.PathLike,
+        progress: Optional[Progress] = None,
+    ) -> None:
+        """
+        Decompresses a snapshot to a database file and checks its hash.
+
+        Args:
+            snapshot (Snapshot): The snapshot to extract.
+            path (str | os.PathLike): The database file to write.
+            progress (Progress): Called after each chunk with (status,
+            remaining, total), in compressed bytes.
+        Raises:
+            FileNotFoundError: If the snapshot no longer exists.
+            sqlite3.DatabaseError: If the snapshot does not match its hash.
+            OSError: If the snapshot cannot be read.
+        """
+        total = os.path.getsize(snapshot.path)
+        digest = hashlib.sha256()
+        with open(snapshot.path, "rb") as raw, open(path, "wb") as dst:
+            src = gzip.GzipFile(fileobj=raw)
+            for chunk in iter(lambda: src.read(_CHUNK), b""):
+                digest.update(chunk)
+                dst.write(chunk)
+                if progress is not None:
+                    progress(0, total - raw.tell(), total)
+        if digest.hexdigest()[:16] != snapshot.digest:
+            raise sqlite3.DatabaseError("The backup is damaged.")
@@ -0,0 +1,121 @@
+"""
+Backup benchmark: file copy against the SQLite online backup API.
+
+Builds a database of --rows reminders with the app's schema and backs it up
+with shutil.copy2, as backup() used to, and with db_backup.backup_to_file on
+a worker thread, as backup() does now. For each, reports the wall time and
+the longest stall of a main thread that ticks every millisecond, which is
+how long the UI would freeze.
+
+Usage, from the repository root:
+    python benchmarks/bench_backup.py [--rows N] [--pages N] [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from typing import Callable, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from constants import BACKUP_PAGES_PER_STEP  # noqa: E402
+from db_backup import backup_to_file  # noqa: E402
+from schema import create_schema  # noqa: E402
+
+
+def build_database(path: str, rows: int) -> None:
+    con = sqlite3.connect(path)
+    create_schema(con)
+    start = date(2025, 1, 1)
+    con.executemany(
+        "INSERT INTO reminders(description, frequency, period, date_last,"
+        " date_next, note) VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (
+                f"reminder {i}",
+                "1",
+                "weeks",
+                (start + timedelta(days=i % 365)).isoformat(),
+                (start + timedelta(days=i % 365 + 7)).isoformat(),
+                f"note for reminder {i}",
+            )
+            for i in range(rows)
+        ),
+    )
+    con.commit()
+    con.close()
+
+
+def measure(work: Callable[[], None], threaded: bool) -> Tuple[float, float]:
+    """
+    Runs work on the main thread, or on a worker thread while the main
+    thread ticks.
+
+    Returns:
+        Tuple[float, float]: The wall time and the longest main thread
+        stall, in ms.
+    """
+    start = time.perf_counter()
+    if not threaded:
+        work()
+        elapsed = (time.perf_counter() - start) * 1000
+        return elapsed, elapsed
+    worker = threading.Thread(target=work)
+    worker.start()
+    stall, last = 0.0, time.perf_counter()
+    while worker.is_alive():
+        time.sleep(0.001)
+        now = time.perf_counter()
+        stall, last = max(stall, now - last), now
+    worker.join()
+    return (time.perf_counter() - start) * 1000, stall * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--pages", type=int, default=BACKUP_PAGES_PER_STEP)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "home_reminders.db")
+        bak_path = os.path.join(tmp, "db_backup.bak")
+        build_database(db_path, args.rows)
+        size_mb = os.path.getsize(db_path) / (1 << 20)
+        print(f"Database: {args.rows} reminders, {size_mb:.1f} MB")
+
+        def copy() -> None:
+            shutil.copy2(db_path, bak_path)
+
+        def online() -> None:
+            # The worker opens its own connection, as the DB executor does.
+            con = sqlite3.connect(db_path)
+            backup_to_file(con, bak_path, pages=args.pages)
+            con.close()
+
+        for label, work, threaded in (
+            ("shutil.copy2 on the main thread", copy, False),
+            (f"backup_to_file, {args.pages} pages/step", online, True),
+        ):
+            runs = [measure(work, threaded) for _ in range(args.runs)]
+            wall = statistics.median(r[0] for r in runs)
+            stall = statistics.median(r[1] for r in runs)
+            print(f"{label}:")
+            print(
+                f"  wall time {wall:8.1f} ms, main thread stall {stall:.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
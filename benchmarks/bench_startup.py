@@ -0,0 +1,140 @@
+"""
+Startup import-time report.
+
+Runs `python -X importtime -c "import home_reminders"` in a fresh interpreter
+and reports the total import time, the slowest direct imports and whether
+any heavy optional or test-only library was loaded at startup. Then times
+cold launches of the import without -X importtime and reports their wall
+time and peak resident set size (RSS).
+
+Usage, from the repository root:
+    python benchmarks/bench_startup.py [--runs N] [--top N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries that should only be imported on first use, or only by the tests.
+LAZY_MODULES = (
+    "google",
+    "googleapiclient",
+    "google_auth_oauthlib",
+    "numpy",
+    "pytest",
+    "_pytest",
+)
+
+# Prints the peak RSS of the interpreter after the import. ru_maxrss is in
+# bytes on macOS and in kilobytes elsewhere.
+LAUNCH = """
+import resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss / (1 << 20) if sys.platform == "darwin" else rss / 1024)
+"""
+
+
+def import_times(module: str = "home_reminders") -> List[Tuple[str, int, int]]:
+    """
+    Imports module in a fresh interpreter with -X importtime.
+
+    Returns:
+        List[Tuple[str, int, int]]: (module, self us, cumulative us) for every
+        module imported, in import order.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+def launch(module: str = "home_reminders") -> Tuple[float, float, float]:
+    """
+    Imports module in a fresh interpreter.
+
+    Returns:
+        Tuple[float, float, float]: The wall time of the whole launch and of
+        the import alone, in ms, and the peak RSS in MB.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", LAUNCH.format(module=module)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    import_s, rss_mb = result.stdout.split()
+    return wall_ms, float(import_s) * 1000, float(rss_mb)
+
+
+def depth(name: str) -> int:
+    # -X importtime indents each nested import by two more spaces.
+    return (len(name) - len(name.lstrip())) // 2
+
+
+def report(times: List[Tuple[str, int, int]], top: int) -> Dict[str, float]:
+    total_ms = sum(c for n, _, c in times if depth(n) == 0) / 1000
+    print(f"Total import time: {total_ms:.1f} ms, {len(times)} modules")
+    # The modules imported directly by the app's modules and the top level.
+    direct = [(n.strip(), c) for n, _, c in times if depth(n) <= 1]
+    print(f"Slowest {top} direct imports:")
+    for name, cumulative in sorted(direct, key=lambda r: -r[1])[:top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+    loaded = sorted(
+        {
+            n.strip().split(".")[0]
+            for n, _, _ in times
+            if n.strip().split(".")[0] in LAZY_MODULES
+        }
+    )
+    print(f"Lazy libraries loaded at startup: {', '.join(loaded) or 'none'}")
+    return {"total_ms": total_ms}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    report(import_times(), args.top)
+
+    launches = [launch() for _ in range(args.runs)]
+    print(f"Cold launch, median of {args.runs} runs:")
+    for label, index, unit in (
+        ("Launch wall time", 0, "ms"),
+        ("Import time", 1, "ms"),
+        ("Peak RSS", 2, "MB"),
+    ):
+        values = [run[index] for run in launches]
+        print(
+            f"  {label}: {statistics.median(values):.1f} {unit}"
+            f" (min {min(values):.1f} {unit})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,52 +2,111 @@ from __future__ import annotations
 
 import importlib
 import os
-import random
-import shutil
 import sqlite3
 import sys
 import tkinter as tk
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from tkinter import ttk
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import pytest
 from dateutil.relativedelta import relativedelta  # type: ignore
 from loguru import logger
 from tkcalendar import Calendar  # type: ignore
 
+from backup_store import BackupStore
 from classes import (
     InfoMsgBox,
+    ProgressPopup,
+    VersionPicker,
     YesNoMsgBox,
 )
-from constants import DB_ENVIRONMENT, NOTIFICATION_INTERVAL_MS
+from constants import (
+    AUTO_BACKUP,
+    DATE_CHECK_MAX_SLEEP_MS,
+    DB_ENVIRONMENT,
+    NOTIFICATION_LEAD_DAYS,
+    VIRTUAL_TREE_THRESHOLD,
+)
+from db_backup import copy_file, replace_database, validate_backup
+from db_executor import DBExecutor
+from db_manager import (  # noqa: F401
+    appsupportdir,
+    connect,
+    get_connection,
+    get_db_path,
+    get_manager,
+)
+from models import Reminder
+from notifications import (
+    NOTIFICATION_CATEGORIES,
+    NotificationScheduler,
+    build_notifications,
+    categorize,
+    due_ordinals,
+)
+from preferences import PreferencesCache, UserPreferences
+from reminder_store import ReminderStore, select_reminders
+from schema import create_schema
 from services2 import UIService
 
 
-def insert_data(self, data: Optional[sqlite3.Cursor]) -> Any:
+def row_status(reminder: Reminder, today: date) -> str:
+    """
+    Function to get the status tag of a reminder's row in the treeview.
+
+    The status tags are configured with their highlight colors in
+    create_tree_widget, see ROW_TAG_COLORS.
+    Args:
+        reminder (Reminder): The reminder displayed in the row.
+        today (date): The current date.
+    Returns:
+        str: The status tag for the row.
+    """
+    if reminder.due is None:
+        return "no-date"
+    if reminder.due < today:
+        return "past-due"
+    if reminder.due == today:
+        return "due-today"
+    return "future"
+
+
+def get_tree_rows(self) -> Dict[str, Tuple[Reminder, str]]:
+    """
+    Function to get the record of what each treeview row displays.
+
+    Maps the iid of each row, which is the reminder id, to the reminder and
+    the status tag shown. This lets refresh() find changed rows without
+    reading them back from the widget.
+    """
+    tree_rows = getattr(self, "tree_rows", None)
+    if tree_rows is None:
+        tree_rows = self.tree_rows = {}
+    return tree_rows
+
+
+def insert_data(self, data: Optional[Tuple[Reminder, ...]]) -> Any:
     """
     Function to insert data into the treeview.
 
-    It takes a cursor object as a parameter and iterates through the data,
-    inserting each item into the treeview. It uses the first item in each tuple
-    as a tag to color (highlight) the row based on the date_next value.
+    It takes the fetched reminders as a parameter and iterates through them,
+    inserting each item into the treeview. Each row's iid is the reminder id.
+    Each row is tagged with its status tag to color (highlight) the row based
+    on the date_next value.
     Args:
-        data (Optional[sqlite3.Cursor]): Cursor object containing the data to
-        be inserted into the treeview.
+        data (Optional[Tuple[Reminder, ...]]): The reminders to be inserted
+        into the treeview.
     """
     if data:
+        tree_rows = get_tree_rows(self)
+        today = date.today()
         for item in data:
-            self.tree.insert("", tk.END, values=item, tags=item[0])
-            if item[5] is None:
-                self.tree.tag_configure(item[0], background="#ececec")
-            else:
-                dat_nxt = datetime.strptime(item[5], "%Y-%m-%d").date()
-                if dat_nxt < date.today():
-                    self.tree.tag_configure(item[0], background="yellow")
-                elif dat_nxt == date.today():
-                    self.tree.tag_configure(item[0], background="lime")
-                else:
-                    self.tree.tag_configure(item[0], background="white")
+            iid = str(item.id)
+            status = row_status(item, today)
+            self.tree.insert(
+                "", tk.END, iid=iid, values=item.row, tags=(status,)
+            )
+            tree_rows[iid] = (item, status)
             # self.tree.tag_configure(item[0], font=("Helvetica", 13))
 
 
@@ -133,12 +192,21 @@ def refresh(self) -> Any:
     Returns:
         None
     """
-    # Fetch fresh set of reminders and insert into treeview.
-    refreshed_data = fetch_reminders(self, self.view_current)
-    for item in self.tree.get_children():
-        self.tree.delete(item)
-    insert_data(self, refreshed_data)
+    # This refresh serves any pending request_refresh.
+    refresh_id = getattr(self, "refresh_id", None)
+    if refresh_id is not None:
+        self.after_cancel(refresh_id)
+        self.refresh_id = None
+    # Count the refreshes, so that redundant ones can be spotted.
+    self.refresh_count = getattr(self, "refresh_count", 0) + 1
+    # Get a fresh set of reminders from the store and bring the treeview in
+    # line with it.
+    refreshed_data = get_store(self).reminders(self.view_current)
+    show_data(self, refreshed_data)
+    # Ignore selection events caused by the refresh. They are queued ahead of
+    # idle callbacks, so the flag is cleared once they have been handled.
     self.refreshed = True
+    self.after_idle(clear_refreshed, self)
     # Update label messages.
     if self.view_current:
         view_msg = (
@@ -150,6 +218,140 @@ def refresh(self) -> Any:
     self.view_lbl.config(background="#ececec")
 
 
+def request_refresh(self) -> Any:
+    """
+    Schedules a refresh of the treeview for when the app is next idle.
+
+    Any number of requests made before then are served by a single refresh,
+    so a change that passes through several functions refreshes the treeview
+    once. Use refresh() directly where the treeview must be up to date
+    immediately.
+    Args:
+        none
+    Returns:
+        None
+    """
+    if getattr(self, "refresh_id", None) is None:
+        self.refresh_id = self.after_idle(run_requested_refresh, self)
+
+
+def run_requested_refresh(self) -> Any:
+    """
+    Runs the refresh scheduled by request_refresh.
+    """
+    self.refresh_id = None
+    refresh(self)
+
+
+def clear_refreshed(self) -> Any:
+    """
+    Function to re-enable opening the edit window on selection after refresh.
+    """
+    self.refreshed = False
+
+
+def show_data(self, data: Sequence[Reminder]) -> Any:
+    """
+    Function to display data in the treeview.
+
+    Long lists are shown a window at a time by the app's VirtualRows, so that
+    only the visible rows and a buffer are inserted in the treeview. Shorter
+    lists are inserted in full.
+    Args:
+        data (Sequence[Reminder]): The reminders to display, in display order.
+    Returns:
+        None
+    """
+    virtual_rows = getattr(self, "virtual_rows", None)
+    if virtual_rows is not None and len(data) > VIRTUAL_TREE_THRESHOLD:
+        virtual_rows.set_source(data)
+        return
+    if virtual_rows is not None:
+        virtual_rows.set_source(None)
+    reconcile_data(self, data)
+
+
+def render_window(self, data: Sequence[Reminder]) -> Any:
+    """
+    Renders the window of rows that VirtualRows shows in the treeview.
+
+    Moving the window deletes the rows that scroll out of it, and may
+    deselect or reselect a row. As after a refresh, the selection events
+    this causes do not open the edit window.
+    Args:
+        data (Sequence[Reminder]): The reminders in the window, in display
+        order.
+    Returns:
+        None
+    """
+    reconcile_data(self, data)
+    self.refreshed = True
+    self.after_idle(clear_refreshed, self)
+
+
+def reconcile_data(self, data: Sequence[Reminder]) -> Any:
+    """
+    Function to bring the treeview in line with data, row by row.
+
+    Rows are keyed on the reminder id. Only new rows are inserted, only rows
+    whose reminder or status changed are updated, and only rows that are no
+    longer wanted are deleted. After a date change, only the rows whose status
+    changed are retagged. Rows whose reminder changed are moved to
+    their new position. The scroll position and selection are kept.
+    Args:
+        data (Sequence[Reminder]): The reminders to display, in display order.
+    Returns:
+        None
+    """
+    tree = self.tree
+    tree_rows = get_tree_rows(self)
+    selection = tree.selection()
+    top = tree.yview()[0]
+    today = date.today()
+    wanted = {str(r.id): r for r in data}
+
+    # Delete rows that are no longer wanted.
+    present = tree.get_children()
+    stale = [iid for iid in present if iid not in wanted]
+    if stale:
+        tree.delete(*stale)
+        for iid in stale:
+            tree_rows.pop(iid, None)
+    present_set = set(present).difference(stale)
+
+    # Detach rows whose reminder changed. Unchanged rows keep their relative
+    # order, so the changed and new rows can then be placed by index.
+    changed = {
+        iid
+        for iid in present_set
+        if tree_rows.get(iid, (None,))[0] != wanted[iid]
+    }
+    if changed:
+        tree.detach(*changed)
+
+    for index, reminder in enumerate(data):
+        iid = str(reminder.id)
+        status = row_status(reminder, today)
+        if iid not in present_set:
+            tree.insert(
+                "", index, iid=iid, values=reminder.row, tags=(status,)
+            )
+        elif iid in changed:
+            tree.item(iid, values=reminder.row, tags=(status,))
+            tree.move(iid, "", index)
+        elif tree_rows[iid][1] != status:
+            tree.item(iid, tags=(status,))
+        else:
+            continue
+        tree_rows[iid] = (reminder, status)
+
+    # Keep the selection and scroll position.
+    kept = tuple(iid for iid in selection if iid in wanted)
+    if tree.selection() != kept:
+        tree.selection_set(kept)
+    tree.yview_moveto(top)
+
+
 def date_next_calc(top) -> str:
     """
     Function to calculate next date for an item.
@@ -196,73 +398,22 @@ def date_next_calc(top) -> str:
 
 
 def get_con(db=DB_ENVIRONMENT) -> sqlite3.Connection:
-    """Function to create a connection to the SQLite database.
+    """Function to create a new connection to the SQLite database.
 
-    It checks if the path to the database exists, and if not, creates the
-    necessary directories. It returns a connection object to the database file
-    located in the "Home Reminders" directory within the Application Support
-    directory of the user's home directory.
+    The connection is unmanaged and is the caller's to close. Runtime code
+    should use get_connection() from db_manager instead, which reuses one
+    configured connection for the whole session.
     Args:
         db (str): The name of the database to connect to. Default is
         "production".
     Returns:
         sqlite3.Connection: A connection object to the SQLite database.
     """
-    # Check that DB_ENVIRONMENT is valid.
-    if DB_ENVIRONMENT not in ["production", "test"]:
-        logger.warning("Invalid DB_ENVIRONMENT, exiting.")
+    try:
+        return connect(get_db_path())
+    except sqlite3.Error as e:
+        logger.error(f"Error connecting to {db} database: {e}, exiting.")
         sys.exit()
-    # If not in production, use the test database.
-    if DB_ENVIRONMENT != "production":
-        try:
-            db_path = os.path.join(os.path.dirname(__file__), "tests/test.db")
-            return sqlite3.connect(db_path)
-        except sqlite3.Error as e:
-            logger.error(f"Error connecting to test database: {e}, exiting.")
-            sys.exit()
-    else:
-        try:
-            dir_path = os.path.join(appsupportdir(), "Home Reminders")
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
-            file_path = os.path.join(dir_path, "home_reminders.db")
-            return sqlite3.connect(file_path)
-        except sqlite3.Error as e:
-            logger.error(
-                f"Error connecting to production database: {e}, exiting."
-            )
-            sys.exit()
-
-
-def appsupportdir() -> str | os.PathLike:
-    """
-    Function to get the Application Support directory.
-
-    It checks for the existence of the Application Support directory in macOS
-    and Linux, and the AppData directory in Windows. If none of these
-    directories exist, it returns the user's home directory.
-    Args:
-        none
-    Returns:
-        str | os.PathLike: The path to the Application Support directory or
-        the user's home directory.
-    """
-    windows = r"%APPDATA%"
-    windows = os.path.expandvars(windows)
-    if "APPDATA" not in windows:
-        return windows
-
-    user_directory = os.path.expanduser("~")
-
-    macos = os.path.join(user_directory, "Library", "Application Support")
-    if os.path.exists(macos):
-        return macos
-
-    linux = os.path.join(user_directory, ".local", "share")
-    if os.path.exists(linux):
-        return linux
-
-    return user_directory
 
 
 def initialize_user(self) -> Any:
@@ -275,7 +426,7 @@ def initialize_user(self) -> Any:
         None
     """
     try:
-        with get_con() as con:
+        with get_connection() as con:
             cur = con.cursor()
             user = cur.execute("SELECT * FROM user").fetchone()
             if user is None:  # user table is empty
@@ -292,6 +443,7 @@ def initialize_user(self) -> Any:
                     values,
                 )
                 con.commit()
+                invalidate_preferences(self)
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         InfoMsgBox(self, "Error", "Failed to update the database.")
@@ -311,7 +463,7 @@ def save_prefs(self, values: Tuple[str, int, int, int, str]) -> None:
         if not isinstance(values, tuple) or len(values) != 5:
             raise ValueError("Invalid input: 'values' must be a 5-tuple.")
 
-        with get_con() as con:
+        with get_connection() as con:
             cur = con.cursor()
             cur.execute("DELETE FROM user")  # Clear existing preferences
             cur.execute(
@@ -353,6 +505,8 @@ def save_prefs(self, values: Tuple[str, int, int, int, str]) -> None:
                 y_offset=15,
             )
     finally:
+        # The user table may have changed, even if saving failed part way.
+        invalidate_preferences(self)
         logger.info("save_prefs operation completed.")
 
 
@@ -369,8 +523,9 @@ def notifications_popup(self) -> Any:
     """
     Checks for reminder notifications. Creates a notifications popup if needed.
 
-    Checks every four hours for items that are past due, due today, due
-    tomorrow, or due in 7 days, depending on user preferences. Also removes any
+    Checks for items that are past due, due today, due tomorrow, or due in 7
+    days, depending on user preferences. Runs at startup and then whenever the
+    notification scheduler sees a reminder change category. Also removes any
     pre-existing notifications popups to prevent multiple popups from
     accumulating.
     Args:
@@ -389,9 +544,10 @@ def notifications_popup(self) -> Any:
             "notifications popups",
         )
         return
-    # Fetch all reminders from the database and categorize them by due date.
+    # Categorize the reminders that are past due or due within the longest
+    # lead time by due date.
     try:
-        reminders = fetch_reminders(self, False)
+        reminders = get_store(self).due_within(max(NOTIFICATION_LEAD_DAYS))
         categorized_reminders = categorize_reminders(reminders)
     except Exception:
         error_handler(
@@ -400,24 +556,20 @@ def notifications_popup(self) -> Any:
             "categorizing reminders",
         )
         return
-    # If there are any reminders, generate messages for the notifications
-    # popup.
-    if categorized_reminders:
-        try:
-            messages = generate_notification_messages(
-                self, categorized_reminders
-            )
-        except Exception:
-            error_handler(
-                self,
-                "Notifications popup aborted, error "
-                "generating notificaton messages",
-            )
-            return
-    # If there are any messages, create a notifications popup.
-    if messages:
+    # Build the notifications for the categories the user has opted for.
+    try:
+        notifications = notification_records(self, categorized_reminders)
+    except Exception:
+        error_handler(
+            self,
+            "Notifications popup aborted, error "
+            "generating notificaton messages",
+        )
+        return
+    # If there are any notifications, create a notifications popup.
+    if notifications:
         try:
-            UIService.create_notifications_popup(self, messages)
+            UIService.create_notifications_popup(self, notifications)
         except Exception:
             error_handler(
                 self,
@@ -426,34 +578,78 @@ def notifications_popup(self) -> Any:
             )
             return
 
-    # Check for notifications every NOTIFICATION_INTERVAL.
-    self.after(NOTIFICATION_INTERVAL_MS, notifications_popup, self)
+
+def start_notification_scheduler(self) -> NotificationScheduler:
+    """
+    Starts running the notifications check when reminders change category.
+
+    Args:
+        none
+    Returns:
+        NotificationScheduler: The app's notification scheduler.
+    """
+    scheduler = getattr(self, "notification_scheduler", None)
+    if scheduler is None:
+        scheduler = self.notification_scheduler = NotificationScheduler(
+            self, get_store(self), lambda: notifications_popup(self)
+        )
+    scheduler.start()
+    return scheduler
+
+
+def check_date(self) -> bool:
+    """
+    Updates the 'today is' label and refreshes the treeview if the date has
+    changed.
+
+    Args:
+        none
+    Returns:
+        bool: True if the date has changed.
+    """
+    today = datetime.now().strftime("%Y-%m-%d")
+    if self.todays_date_var.get() == today:
+        return False
+    # update the label to show today's date
+    self.todays_date_var.set(today)
+    self.today_is_lbl.config(
+        text=f"Today is {self.todays_date_var.get()}",
+    )
+    # Update highlighting after date change.
+    request_refresh(self)
+    return True
+
+
+def ms_until_midnight(now: Optional[datetime] = None) -> int:
+    """
+    Returns the number of milliseconds until the next local midnight.
+    """
+    now = now or datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), time())
+    return int((midnight - now).total_seconds() * 1000)
 
 
 def date_check(self) -> Any:
     """
     Updates the 'today is' label and refreshes the treeview when date changes.
 
-    Calls itself every second to monitor for date change. On date change,
-    updates the 'today is' label and refreshes treeview to keep highlighting
-    accurate. This is needed because the app is meant to remain open for
-    extended periods.
+    Checks the date and schedules the next check for just after the next
+    local midnight. This is needed because the app is meant to remain open for
+    extended periods. The wait is capped at DATE_CHECK_MAX_SLEEP_MS, so that a
+    clock change or a system sleep delays the rollover by at most that long;
+    the date is also checked whenever the app gets focus.
     Args:
         none
     Returns:
         None
     """
-    # Check if the date has changed.
-    if self.todays_date_var.get() != datetime.now().strftime("%Y-%m-%d"):
-        # update the label to show today's date
-        self.todays_date_var.set(datetime.now().strftime("%Y-%m-%d"))
-        self.today_is_lbl.config(
-            text=f"Today is {self.todays_date_var.get()}",
-        )
-        # Update highlighting after date change.
-        refresh(self)
-    # Check every second.
-    self.after(1000, date_check, self)
+    check_date(self)
+    after_id = getattr(self, "date_check_id", None)
+    if after_id is not None:
+        self.after_cancel(after_id)
+    # Wake a second after midnight, so that the date has changed.
+    delay = min(ms_until_midnight() + 1000, DATE_CHECK_MAX_SLEEP_MS)
+    self.date_check_id = self.after(delay, date_check, self)
 
 
 def create_database(self) -> Any:
@@ -466,64 +662,39 @@ def create_database(self) -> Any:
         None
     """
     try:
-        with get_con() as con:
-            cur = con.cursor()
-            # Create user table to store user phone number and notifications
-            # preferences, if it doesn't exist.
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS user(
-                    phone_number TEXT,
-                    week_before INT,
-                    day_before INT,
-                    day_of INT,
-                    last_notification_date TEXT)
-            """)
-            # Create reminders table to store reminders, if it doesn't exist
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS reminders(
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    description TEXT,
-                    frequency TEXT,
-                    period TEXT,
-                    date_last TEXT,
-                    date_next TEXT,
-                    note TEXT)
-            """)
+        with get_connection() as con:
+            # Create the user and reminders tables if they don't exist, add
+            # indexes and apply any other pending schema migrations, and
+            # create the full-text search table if FTS5 is available.
+            create_schema(con)
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         InfoMsgBox(self, "Error", "Failed to create the database.")
 
 
-def fetch_reminders(self, view_current: bool) -> Optional[sqlite3.Cursor]:
+def fetch_reminders(
+    self, view_current: bool
+) -> Optional[Tuple[Reminder, ...]]:
     """
     Retrieves reminders from the database.
 
     Fetches either the pending reminders or all reminders depending on the
-    value of the attribute view_current.
+    value of the attribute view_current. The rows are read in full and
+    returned as immutable Reminder records, so the result can be shared and
+    iterated any number of times. Pending means due on or after today's
+    local date, the same date ReminderStore.pending uses.
 
     Args:
         view_current (bool): If True, fetch only items due today or in the
         future, otherwise fetch all items, past and present.
 
     Returns:
-        Optional[sqlite3.Cursor]: Cursor object containing the retrieved
-        reminder items, or None if an error occurs.
+        Optional[Tuple[Reminder, ...]]: The retrieved reminder items, or None
+        if an error occurs.
     """
     try:
-        with get_con() as con:
-            cur = con.cursor()
-            if view_current:
-                query = """
-                    SELECT * FROM reminders
-                    WHERE date_next >= DATE('now')
-                    ORDER BY date_next ASC
-                """
-            else:
-                query = """
-                    SELECT * FROM reminders
-                    ORDER BY date_next ASC
-                """
-            return cur.execute(query)
+        with get_connection() as con:
+            return select_reminders(con, view_current)
     except sqlite3.Error as e:
         logger.error(f"Database error while fetching reminders: {e}")
         InfoMsgBox(
@@ -539,6 +710,58 @@ def fetch_reminders(self, view_current: bool) -> Optional[sqlite3.Cursor]:
     return None
 
 
+def get_store(self) -> ReminderStore:
+    """
+    Returns the app's reminder store, loading it from the database on first
+    use.
+
+    Args:
+        none
+    Returns:
+        ReminderStore: The in-memory copy of the reminders table.
+    """
+    store = getattr(self, "store", None)
+    if store is None:
+        store = self.store = ReminderStore(fetch_reminders(self, False) or ())
+    return store
+
+
+def get_executor(self) -> DBExecutor:
+    """
+    Returns the app's database executor, creating it on first use.
+
+    The executor's worker thread is stopped by close_executor when the main
+    window is destroyed.
+
+    Args:
+        none
+    Returns:
+        DBExecutor: Runs database jobs off the Tk main thread.
+    """
+    executor = getattr(self, "executor", None)
+    if executor is None:
+        executor = self.executor = DBExecutor(self)
+    return executor
+
+
+def close_executor(self) -> Any:
+    """
+    Finishes the queued database jobs and stops the executor's worker thread.
+
+    Called before the main window is destroyed, while Tk can still run the
+    jobs' callbacks and cancel the executor's polling.
+
+    Args:
+        none
+    Returns:
+        None
+    """
+    executor = getattr(self, "executor", None)
+    if executor is not None:
+        executor.close()
+        self.executor = None
+
+
 def validate_inputs(self, top, id: int | None = None) -> bool:
     """
     Function to validate inputs for new and edited reminder items.
@@ -560,45 +783,16 @@ def validate_inputs(self, top, id: int | None = None) -> bool:
         )
         top.description_entry.focus_set()
         return_value = False
-    # Fetch all reminders. If view_current is set to True, temporarily reset
-    # it to False so that all reminders will be retrieved instead of just the
-    # pending reminders.
-    if self.view_current:
-        self.view_current = False
-        data = fetch_reminders(self, self.view_current)
-        # Reset view_current.
-        self.view_current = True
-    else:
-        data = fetch_reminders(self, self.view_current)
-    # Check for duplicates only if there are existing reminders.
-    if data:
-        items = data.fetchall()
-        # If updating an existing item, get the pre-edit description. Item[0]
-        # is the id in the database, item[1] is the description in the db.
-        original_description = None
-        if id:
-            for item in items:
-                if item[0] == id:
-                    original_description = item[1]
-        # Check for duplicate description.
-        for item in items:
-            if item[1] == description:
-                # It's not a duplicate if updating an existing item, and not
-                # changing the description.
-                if original_description:
-                    break
-                InfoMsgBox(
-                    self,
-                    "Duplicate Description",
-                    "There is already an entry with this description."
-                    + " Try again.",
-                )
-                # if updating an existing item, reset original description
-                if id == item[0]:
-                    description.delete(0, tk.END)
-                    description.insert(0, original_description)
-                    description.focus_set()
-                return_value = False
+    # Check the description against all reminders, past and present. The
+    # item being edited may keep its own description.
+    duplicate = get_store(self).find_duplicate(description, id)
+    if description and duplicate is not None:
+        InfoMsgBox(
+            self,
+            "Duplicate Description",
+            "There is already an entry with this description. Try again.",
+        )
+        return_value = False
     # frequency is required and must be an integer
     frequency = top.frequency_entry.get()
     if not frequency.isdigit():
@@ -658,10 +852,11 @@ def delete_user_data(self) -> Any:
         None
     """
     try:
-        with get_con() as con:
+        with get_connection() as con:
             cur = con.cursor()
             cur.execute("DELETE FROM user")
             con.commit()
+        invalidate_preferences(self)
     except sqlite3.Error as e:
         print(f"Database error: {e}")
         InfoMsgBox(
@@ -822,92 +1017,161 @@ def view_all(self) -> Any:
     update_treeview(self, view_current=False)
 
 
-def get_db_path() -> str:
+def get_backup_store(self) -> BackupStore:
     """
-    Function to get path to db depending on database environment.
+    Returns the app's backup store, in the backups directory next to the
+    database.
 
-    Returns os.PathLike: The path to the database.
+    Args:
+        none
+    Returns:
+        BackupStore: The database snapshots.
     """
-    # Check that DB_ENVIRONMENT is valid.
-    if DB_ENVIRONMENT not in ["production", "test"]:
-        logger.warning("Invalid DB_ENVIRONMENT, exiting.")
-        sys.exit()
-    # Get the database path depending on the database environment.
-    if DB_ENVIRONMENT != "production":
-        try:
-            db_path = os.path.join(
-                os.path.dirname(__file__), "tests", "test.db"
-            )
-        except FileNotFoundError as e:
-            logger.error(f"Test database not found: {e}, exiting.")
-            sys.exit()
-    else:
+    store = getattr(self, "backup_store", None)
+    if store is None:
+        directory = os.path.join(os.path.dirname(get_db_path()), "backups")
+        store = self.backup_store = BackupStore(directory)
+    return store
+
+
+def auto_backup(self) -> Any:
+    """
+    Takes a snapshot of the database in the background, if it has changed
+    since the last one.
+
+    Only the production database is backed up automatically; the test
+    database is copied and restored by the tests while the app runs.
+
+    Args:
+        none
+    Returns:
+        None
+    """
+    if not AUTO_BACKUP or DB_ENVIRONMENT != "production":
+        return
+
+    def done(future) -> None:
         try:
-            dir_path = os.path.join(appsupportdir(), "Home Reminders")
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
-            db_path = os.path.join(dir_path, "home_reminders.db")
-        except FileNotFoundError as e:
-            logger.error(f"Production database not found: {e}, exiting.")
-            sys.exit()
-    # Create a path to temporarily backup the database.
-    return db_path
+            future.result()
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Automatic backup error: {e}.")
+
+    store = get_backup_store(self)
+    get_executor(self).submit(store.snapshot, done)
 
 
 def backup(self) -> Any:
     """
-    Creates dialog giving user the option to create a database backup.
+    Backs up the database, showing the progress in a popup.
+
+    A new snapshot is added to the backup store, unless the data is unchanged
+    since the last one.
 
     Args:
         none
     Returns:
         None
     """
-    answer = YesNoMsgBox(
-        self,
-        "Backup",
-        "The current backup will be overwritten. Are you sure?",
-        x_offset=3,
-        y_offset=5,
+    store = get_backup_store(self)
+    popup = ProgressPopup(
+        self, "Backup", "Backing up data\u2026", x_offset=3, y_offset=5
     )
-    if answer.get_response():
-        db_path = get_db_path()
-        # Locate backup file in the same directory as the database.
-        db_bak_path = os.path.join(os.path.dirname(db_path), "db_backup.bak")
-        shutil.copy2(db_path, db_bak_path)
+
+    def done(future) -> None:
+        popup.destroy()
+        try:
+            snapshot = future.result()
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Backup error: {e}. Backup aborted.")
+            InfoMsgBox(
+                self,
+                "Backup",
+                "Unable to back up data.",
+                x_offset=3,
+                y_offset=5,
+            )
+            return
         InfoMsgBox(
             self,
             "Backup",
-            "Backup completed.",
+            "Backup completed."
+            if snapshot
+            else "No changes since the last backup.",
             x_offset=3,
             y_offset=5,
         )
-    else:
-        return
+
+    # The online backup runs on the database worker, so the UI stays
+    # responsive and other writes can continue.
+    get_executor(self).submit(
+        lambda con: store.snapshot(con, progress=popup.report), done
+    )
 
 
 def restore(self) -> Any:
     """
-    Creates dialog giving user the option to restore the database.
+    Lets the user pick a backup, and restores the database from it.
+
+    The choices are the snapshots in the backup store, newest first, and the
+    db_backup.bak file written by older versions, if there is one.
 
     Args:
         none
     Returns:
         None
     """
-    answer = YesNoMsgBox(
+    store = get_backup_store(self)
+    snapshots = store.snapshots()
+    versions = [snapshot.label for snapshot in snapshots]
+    # Locate the old single backup file in the same directory as the database.
+    db_bak_path = os.path.join(os.path.dirname(get_db_path()), "db_backup.bak")
+    if os.path.exists(db_bak_path):
+        modified = datetime.fromtimestamp(os.path.getmtime(db_bak_path))
+        versions.append(f"{modified:%Y-%m-%d %H:%M:%S}  (db_backup.bak)")
+    if not versions:
+        InfoMsgBox(
+            self,
+            "Restore",
+            "Unable to restore data:\nno backups found.\n",
+            x_offset=3,
+            y_offset=5,
+        )
+        return
+    picker = VersionPicker(
         self,
         "Restore",
-        "All current data will be overwritten. Are you sure?",
+        "Choose a backup to restore.\nAll current data will be overwritten.",
+        versions,
         x_offset=3,
         y_offset=5,
     )
-    if answer.get_response():
-        db_path = get_db_path()
-        # Locate backup file in the same directory as the database.
-        db_bak_path = os.path.join(os.path.dirname(db_path), "db_backup.bak")
+    index = picker.get_response()
+    if index is None:
+        return
+    popup = ProgressPopup(
+        self, "Restore", "Restoring data\u2026", x_offset=3, y_offset=5
+    )
+    # The backup is prepared next to the database, so that it can be renamed
+    # over it.
+    candidate = f"{get_db_path()}.restore"
+
+    def job(con: sqlite3.Connection) -> str:
+        try:
+            if index < len(snapshots):
+                store.extract(snapshots[index], candidate, popup.report)
+            else:
+                copy_file(db_bak_path, candidate, progress=popup.report)
+            validate_backup(candidate)
+        except BaseException:
+            if os.path.exists(candidate):
+                os.remove(candidate)
+            raise
+        return candidate
+
+    def done(future) -> None:
+        popup.destroy()
         try:
-            shutil.copy2(db_bak_path, db_path)
+            candidate = future.result()
         except FileNotFoundError as e:
             logger.error(f"Restore error: {e}. Restore aborted.")
             InfoMsgBox(
@@ -918,7 +1182,28 @@ def restore(self) -> Any:
                 y_offset=5,
             )
             return
-        refresh(self)
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Restore error: {e}. Restore aborted.")
+            InfoMsgBox(
+                self,
+                "Restore",
+                "Unable to restore data:\nbackup file is damaged.\n",
+                x_offset=3,
+                y_offset=5,
+            )
+            return
+        try:
+            swap_database(self, candidate)
+        except OSError as e:
+            logger.error(f"Restore error: {e}. Restore aborted.")
+            InfoMsgBox(
+                self,
+                "Restore",
+                "Unable to restore data:\ndatabase could not be replaced.\n",
+                x_offset=3,
+                y_offset=5,
+            )
+            return
         InfoMsgBox(
             self,
             "Restore",
@@ -926,14 +1211,86 @@ def restore(self) -> Any:
             x_offset=3,
             y_offset=5,
         )
-    else:
-        return
+
+    # The backup is copied and checked on the database worker; only the swap
+    # of the database files happens on the Tk main thread.
+    get_executor(self).submit(job, done)
+
+
+def swap_database(self, candidate: str) -> Any:
+    """
+    Replaces the database with a checked backup while the app is running.
+
+    Both connections to the database, the worker's and the Tk main thread's,
+    are closed, the backup is renamed over the database file, and everything
+    held in memory is invalidated. The connections reopen on the new file
+    when next used.
+
+    Args:
+        candidate (str): The backup, validated and in the database directory.
+    Returns:
+        None
+    Raises:
+        OSError: If the database file cannot be replaced; the database is
+        left as it was.
+    """
+    try:
+        # Wait for the worker to finish its queued jobs and let go of the
+        # file; this is quick, as the slow copy has already been made.
+        get_executor(self).release().result()
+        get_manager().close()
+        replace_database(candidate, get_db_path())
+    finally:
+        if os.path.exists(candidate):
+            os.remove(candidate)
+    # A backup made before full-text search was added has no full-text
+    # table; create it along with any other missing tables.
+    create_database(self)
+    invalidate_caches(self)
+
+
+def invalidate_caches(self) -> Any:
+    """
+    Discards everything held in memory from the database, in one step.
+
+    The preferences cache is emptied and the reminder store is reloaded on
+    the database worker. The reload rebuilds the search index and reschedules
+    the notification scheduler through the store's listeners. Once the store
+    is loaded, the search session is reset, the scheduler is started or
+    stopped to match the preferences, and the treeview is refreshed.
+
+    Args:
+        none
+    Returns:
+        None
+    """
+    invalidate_preferences(self)
+
+    def loaded(reminders) -> None:
+        session = getattr(self, "search_session", None)
+        if session is not None:
+            session.reset()
+        preferences = get_user_data(self)
+        if preferences and preferences.opted_in:
+            start_notification_scheduler(self)
+        else:
+            scheduler = getattr(self, "notification_scheduler", None)
+            if scheduler is not None:
+                scheduler.stop()
+        request_refresh(self)
+
+    # services imports business, so it is imported here.
+    module = importlib.import_module("services")
+    module.ReminderService.get_reminders_async(self, self.view_current, loaded)
 
 
 def delete_all(self) -> Any:
     """
     Creates dialog giving user the option to delete the database.
 
+    The reminders are deleted on the database worker thread; the store is
+    emptied and the treeview refreshed once the delete has committed.
+
     Args:
         none
     Returns:
@@ -946,18 +1303,20 @@ def delete_all(self) -> Any:
         x_offset=3,
         y_offset=5,
     )
-    if answer.get_response():
+    if not answer.get_response():
+        return
+
+    def deleted(future) -> None:
         try:
-            with get_con() as con:
-                cur = con.cursor()
-                cur.execute("DELETE FROM reminders")
-                con.commit()
+            future.result()
         except sqlite3.Error as e:
-            print(f"Database error: {e}")
+            logger.error(f"Database error: {e}")
             InfoMsgBox(
                 self, "Error", "Failed to delete user data from the database."
             )
-        refresh(self)
+            return
+        get_store(self).load(())
+        request_refresh(self)
         InfoMsgBox(
             self,
             "Delete All",
@@ -966,245 +1325,108 @@ def delete_all(self) -> Any:
             y_offset=5,
         )
 
+    get_executor(self).execute("DELETE FROM reminders", callback=deleted)
 
-def get_user_data(self) -> Optional[sqlite3.Cursor]:
-    """
-    Gets user preferences from the user table.
 
-    Args:
-        none
-    Returns:
-        A cursor object containing user preferences: phone number, week_before,
-         day_ before, day_of, last_notification_date.
+def get_preferences_cache(self) -> PreferencesCache:
     """
-    try:
-        with get_con() as con:
-            cur = con.cursor()
-            return cur.execute("SELECT * FROM user")
-    except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        InfoMsgBox(self, "Error", "Failed to get user_data from the database.")
-        return None
+    Returns the app's user preferences cache, creating it on first use.
+    """
+    cache = getattr(self, "preferences_cache", None)
+    if cache is None:
+        cache = self.preferences_cache = PreferencesCache()
+    return cache
 
 
-def save_database_item(
-    self, values: Tuple[str, str, str, str, str, str]
-) -> Any:
+def invalidate_preferences(self) -> None:
     """
-    Saves a new reminder item to the database.
-
-    Args:
-        values (tuple):  A 6 tuple containing reminder item data.
-    Returns:
-        None
+    Makes the next get_user_data read the user table again.
     """
-    try:
-        with get_con() as con:
-            cur = con.cursor()
-            # insert data into database
-            cur.execute(
-                """
-                INSERT INTO reminders (
-                    description,
-                    frequency,
-                    period,
-                    date_last,
-                    date_next,
-                    note)
-                VALUES (?, ?, ?, ?, ?, ?)""",
-                values,
-            )
-            con.commit()
-    except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        InfoMsgBox(
-            self, "Error", "Failed to save new reminder item to the database."
-        )
-    refresh(self)
-    return None
+    get_preferences_cache(self).invalidate()
 
 
-def update_database_item(
-    self, values: Tuple[str, str, str, str, str, str, int]
-) -> Any:
+def get_user_data(self) -> Optional[UserPreferences]:
     """
-    Updates selected reminder item in the database.
+    Gets user preferences from the user table.
+
+    The preferences are read once and then served from the app's preferences
+    cache until they are saved or deleted.
 
     Args:
-        values (tuple): a 7 tuple containing the edited data of the selected
-        reminder item, the last element of which is the reminder item id.
+        none
     Returns:
-        None
+        Optional[UserPreferences]: The user preferences: phone number,
+         week_before, day_before, day_of, last_notification_date, or None if
+         the user table is empty or an error occurs.
     """
     try:
-        with get_con() as con:
-            cur = con.cursor()
-            cur.execute(
-                """
-                UPDATE reminders
-                SET (
-                description, frequency, period, date_last, date_next, note)
-                = (?, ?, ?, ?, ?, ?)
-                WHERE id = ? """,
-                (values),
-            )
-            con.commit()
-            refresh(self)
+        return get_preferences_cache(self).get()
     except sqlite3.Error as e:
         print(f"Database error: {e}")
-        InfoMsgBox(
-            self,
-            "Error",
-            "Failed to update selected reminder item in the database.",
-        )
-    refresh(self)
-    return None
+        InfoMsgBox(self, "Error", "Failed to get user_data from the database.")
+        return None
 
 
 def categorize_reminders(
-    reminders: Optional[sqlite3.Cursor],
-) -> Tuple[list[str], list[str], list[str], list[str]]:
+    reminders: Optional[Sequence[Reminder | Tuple]],
+) -> Tuple[List[Reminder], ...]:
     """
     Creates lists of notification reminders categorized by due date.
 
     Args:
-        reminders (Optional[sqlite3.Cursor]): Cursor object containing the
-        reminder items to be categorized.
+        reminders (Optional[Sequence[Reminder | Tuple]]): The reminder items
+        to be categorized. Plain row tuples are converted to Reminders.
     Returns:
-        Tuple[list[str], list[str], list[str], list[str]]: A tuple containing 4
-        lists: past due items, items due today, items due tomorrow and items
-        due in 7 days.
-    """
-    (
-        past_due_reminders,
-        day_of_reminders,
-        day_before_reminders,
-        week_before_reminders,
-    ) = [], [], [], []
-    if reminders:
-        for r in reminders:
-            due_date = datetime.strptime(r[5], "%Y-%m-%d").date()
-            today = datetime.today().date()
-            if due_date < today:
-                past_due_reminders.append(r)
-            if due_date == today:
-                day_of_reminders.append(r)
-            if due_date == (datetime.today() + timedelta(days=1)).date():
-                day_before_reminders.append(r)
-            if due_date == (datetime.today() + timedelta(days=7)).date():
-                week_before_reminders.append(r)
-    return (
-        past_due_reminders,
-        day_of_reminders,
-        day_before_reminders,
-        week_before_reminders,
-    )
-
-
-def create_message_string(
-    app,
-    reminders_by_category: Optional[
-        Tuple[list[str], list[str], list[str], list[str]]
-    ],
-) -> str:
+        Tuple[List[Reminder], ...]: A tuple containing a list per notification
+        category: past due items, then the items due in each lead time of
+        NOTIFICATION_LEAD_DAYS, by default today, tomorrow and in 7 days.
     """
-    Creates a string of reminders notifications for the notifications popup.
+    if not reminders:
+        return tuple([] for _ in NOTIFICATION_CATEGORIES)
+    # Categorize all due dates at once, against a single snapshot of today.
+    past_due, buckets = categorize(due_ordinals(reminders))
 
-    Args:
-        reminders_by_category
-        (Tuple[list[str], list[str], list[str], list[str] | None]): A tuple
-        containing the categorized reminders for notification.
+    def pick(indexes) -> list:
+        # Only the reminders in a category are converted to Reminders.
+        return [
+            r if isinstance(r, Reminder) else Reminder.from_row(r)
+            for r in (reminders[i] for i in indexes)
+        ]
 
-    Returns:
-        str: A string representation of a bulleted list of reminders for
-        display in the notifications popup.
-    """
-    user_data = get_user_data(app)
-    user_data_tuple = user_data.fetchone() if user_data else None
-
-    # Create a string to hold reminders for notification.
-    messages = ""
-    # If there are no reminders, return a message indicating no notifications.
-    if not reminders_by_category:
-        messages += "No notifications.\n"
-        return messages
-    # Otherwise, create a string of reminders.
-    # Get the reminders categorized by due date starting with past due. Include
-    # only the categories selected by user preference.
-    if user_data_tuple:
-        # Past due always included.
-        for r in reminders_by_category[0]:
-            messages += f"\u2022 Past due: {r[1]}\n"
-        # Get 'day of' notificatons, if opted for.
-        if user_data_tuple[3]:
-            for r in reminders_by_category[1]:
-                messages += f"\u2022 Due today: {r[1]}\n"
-        # Get 'day before' notificatons, if opted for.
-        if user_data_tuple[2]:
-            for r in reminders_by_category[2]:
-                messages += f"\u2022 Due tomorrow: {r[1]}\n"
-        # Get 'week before' notificatons, if opted for.
-        if user_data_tuple[1]:
-            for r in reminders_by_category[3]:
-                messages += f"\u2022 Due in 7 days: {r[1]}\n"
-    return messages
+    # One list per lead time in NOTIFICATION_LEAD_DAYS, after past due.
+    return (pick(past_due), *(pick(bucket) for bucket in buckets))
 
 
 def get_phone_number(self) -> str:
-    user_data = get_user_data(self)
-    if user_data:
-        return user_data.fetchone()[0]
+    preferences = get_user_data(self)
+    if preferences:
+        return preferences.phone_number
     else:
         return ""
 
 
-def generate_notification_messages(
+def notification_records(
     self,
-    categorized_reminders: Optional[
-        Tuple[list[str], list[str], list[str], list[str]]
-    ],
-) -> str:
+    categorized_reminders: Optional[Sequence[Sequence[Reminder]]],
+) -> List[Tuple[str, str]]:
     """
-    Generates a string of notification messages from the categorized reminders.
+    Builds the notifications for the categorized reminders.
+
+    Includes only the categories selected by user preference; past due
+    reminders are always included.
 
     Args:
-        categorized_reminders
-        (Tuple[list[str], list[str], list[str], list[str]]):
-        A tuple containing the reminders categorized by due date.
+        categorized_reminders (Optional[Sequence[Sequence[Reminder]]]): The
+        past due reminders and the reminders due in each lead time, as from
+        categorize_reminders.
 
     Returns:
-        str: A string listing reminders bulleted by due date for display in the
-          notifications popup.
+        List[Tuple[str, str]]: (category, text) records for display in the
+        notifications popup.
     """
-    user_data = get_user_data(self)
-    user_data_tuple = user_data.fetchone() if user_data else None
-
-    # Create a string to hold reminders for notification.
-    messages = ""
-    # If there are no reminders, return a message indicating no notifications.
     if not categorized_reminders:
-        messages += "No notifications.\n"
-        return messages
-    # Otherwise, create a string of reminders.
-    # Get the reminders categorized by due date starting with past due. Include
-    # only the categories selected by user preference.
-    if user_data_tuple:
-        # Past due always included.
-        for reminder in categorized_reminders[0]:
-            messages += f"\u2022 Past due: {reminder[1]}\n"
-        # Get 'day of' notificatons, if opted for.
-        if user_data_tuple[3]:
-            for reminder in categorized_reminders[1]:
-                messages += f"\u2022 Due today: {reminder[1]}\n"
-        # Get 'day before' notificatons, if opted for.
-        if user_data_tuple[2]:
-            for reminder in categorized_reminders[2]:
-                messages += f"\u2022 Due tomorrow: {reminder[1]}\n"
-        # Get 'week before' notificatons, if opted for.
-        if user_data_tuple[1]:
-            for reminder in categorized_reminders[3]:
-                messages += f"\u2022 Due in 7 days: {reminder[1]}\n"
-    return messages
+        return []
+    return build_notifications(categorized_reminders, get_user_data(self))
 
 
 def update_treeview(self, view_current: bool):
@@ -1213,219 +1435,9 @@ def update_treeview(self, view_current: bool):
 
     """
     self.view_current = view_current
-    data = fetch_reminders(self, self.view_current)
-    insert_data(self, data)
     refresh(self)
-    self.refreshed = True
-    # Set focus in the treeview so that an item can be selected.
-    self.tree.focus(self.tree.get_children()[0])
-
-
-def get_days() -> Tuple[str, str, str, str, str, str]:
-    """
-    Initializes variables representing days relative to current date.
-    Returns:
-        Tuple[str, str, str, str, str, str]: A tuple containing the six
-        variables.
-    """
-    today_str = date.today().strftime("%Y-%m-%d")
-    yesterday_datetime = datetime.now() - timedelta(days=1)
-    yesterday_str = yesterday_datetime.strftime("%Y-%m-%d")
-    two_weeks_ago_datetime = datetime.now() - timedelta(weeks=2)
-    tomorrow_datetime = datetime.now() + timedelta(days=1)
-    tomorrow_str = tomorrow_datetime.strftime("%Y-%m-%d")
-    two_weeks_ago_str = two_weeks_ago_datetime.strftime("%Y-%m-%d")
-    week_from_today_datetime = datetime.now() + timedelta(days=7)
-    week_from_today_str = week_from_today_datetime.strftime("%Y-%m-%d")
-
-    # Any day within a year after current date, not day after or 7 days after.
-    days_list = [d for d in range(1, 365) if d not in [1, 7]]
-    non_category_datetime = datetime.now() + timedelta(
-        days=random.choice(days_list)
-    )
-    non_category_str = non_category_datetime.strftime("%Y-%m-%d")
-
-    return (
-        today_str,
-        yesterday_str,
-        tomorrow_str,
-        two_weeks_ago_str,
-        week_from_today_str,
-        non_category_str,
-    )
-
-
-def get_test_reminders() -> List[Tuple[int, str, str, str, str, str, str]]:
-    """
-    Initializes a list of reminders for testing.
-    Returns:
-        List[Tuple[int, str, str, str, str, str, str]]: The list of reminders
-        to be used testing.
-    """
-    days = get_days()
-
-    # Specify test reminders with known due dates. Note: the id fields are only
-    # placeholders since they are not used by the function but they must match
-    # the expected ids.
-    reminders = [
-        # Past due:
-        (
-            0,  # Placeholder for 'id'
-            "test1",
-            "0",  # Frequency irrelevant since date_last and date_next are
-            # pre-determined.
-            "days",
-            days[3],
-            days[1],
-            "test1 note",
-        ),
-        # Due today:
-        (
-            0,
-            "test2",
-            "0",
-            "days",
-            days[1],
-            days[0],
-            "test2 note",
-        ),
-        # Due tomorrow:
-        (
-            0,
-            "test3",
-            "0",
-            "days",
-            days[0],
-            days[2],
-            "test3 note",
-        ),
-        # Due in one week:
-        (
-            0,
-            "test4",
-            "0",
-            "weeks",
-            days[0],
-            days[4],
-            "test4 note",
-        ),
-        # Due any random day within the year after current date except the day
-        # after and the week after current date.
-        (
-            0,
-            "test5",
-            "0",
-            "days",
-            days[0],
-            days[5],
-            "test5 note",
-        ),
-    ]
-    return reminders
-
-
-def get_expected() -> tuple[
-    list[tuple[int, str, str, str, str, str, str]],
-    list[tuple[int, str, str, str, str, str, str]],
-    list[tuple[int, str, str, str, str, str, str]],
-    list[tuple[int, str, str, str, str, str, str]],
-]:
-    """
-    Provides an expected list of reminders categorized by due date.
-    Returns:
-        tuple[
-        list[tuple[int, str, str, str, str, str, str]],
-        list[tuple[int, str, str, str, str, str, str]],
-        list[tuple[int, str, str, str, str, str, str]],
-        list[tuple[int, str, str, str, str, str, str]]]:
-        The expected list of reminders categorized by due date.
-    """
-    days = get_days()
-    expected = (
-        # Past due:
-        [
-            (
-                0,  # Placeholder for id.
-                "test1",
-                "0",  # Frequency irrelevant since date_last and date_next are
-                # pre-determined.
-                "days",
-                days[3],
-                days[1],
-                "test1 note",
-            )
-        ],
-        # Due today:
-        [
-            (
-                0,
-                "test2",
-                "0",
-                "days",
-                days[1],
-                days[0],
-                "test2 note",
-            )
-        ],
-        # Due tomorrow:
-        [
-            (
-                0,
-                "test3",
-                "0",
-                "days",
-                days[0],
-                days[2],
-                "test3 note",
-            )
-        ],
-        # Due in one week:
-        [
-            (
-                0,
-                "test4",
-                "0",
-                "weeks",
-                days[0],
-                days[4],
-                "test4 note",
-            )
-        ],
-    )
-    return expected
-
-
-def copy_test_db() -> Tuple[str, str]:
-    """
-    Makes a temporary copy of the test database so that it can be restored
-    later.
-    Returns:
-        Tuple[str, str]: A tuple containing the paths to the database and the
-        temporary copy of that database.
-    """
-    db_path = os.path.join(os.path.dirname(__file__), "tests", "test.db")
-    db_bak_path = os.path.join(
-        os.path.dirname(__file__), "tests", "test_bak.db"
-    )
-    shutil.copy2(db_path, db_bak_path)
-    return (db_path, db_bak_path)
-
-
-def cleanup(app, db_path, db_bak_path) -> Any:
-    """
-    Restores the test database to its pre-test state.
-    """
-    shutil.copy2(db_bak_path, db_path)
-    # Delete the temporary copy of the test database.
-    os.remove(db_bak_path)
-
-
-def error_cleanup(app, db_path, db_bak_path, e, msg) -> Any:
-    """
-
-    Restores the test database to its pre-test state with error handling.
-    """
-    logger.error(msg + f": {e}," + " skipping this test.")
-    cleanup(app, db_path, db_bak_path)
-    app.destroy()
-    pytest.skip(msg + ".")
+    # Set focus in the treeview so that an item can be selected. The view
+    # may have no reminders.
+    children = self.tree.get_children()
+    if children:
+        self.tree.focus(children[0])
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import datetime
+import os.path
+import pickle
+
+from google.auth.transport.requests import Request
+from google_auth_oauthlib.flow import InstalledAppFlow
+from googleapiclient.discovery import build
+from loguru import logger
+
+from business import get_store
+from classes import OkMsgBox
+
+# Google Calendar integration. The Google API client libraries take a long
+# time to import, so this module is only imported when a calendar event is
+# first created.
+
+SCOPES = ["https://www.googleapis.com/auth/calendar"]
+
+
+def create_calendar_event(self, reminder_id: int) -> bool:
+    """
+    Record a reminder as an event on the calendar.
+
+    Args:
+        reminder_id (int): ID of the reminder to schedule.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    # Load credentials.
+    try:
+        creds = None
+
+        if os.path.exists("token.pickle"):
+            with open("token.pickle", "rb") as token:
+                creds = pickle.load(token)
+
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    "../credentials.json", SCOPES
+                )
+                creds = flow.run_local_server(port=0)
+
+            with open("token.pickle", "wb") as token:
+                pickle.dump(creds, token)
+    except Exception as e:
+        logger.error(f"Error loading credentials: {e}")
+        answer = OkMsgBox(
+            self,
+            "Credentials Error",
+            "Error loading credentials.",
+        )
+        if answer.get_response():
+            return False
+    # Create the calendar service.
+    try:
+        service = build("calendar", "v3", credentials=creds)
+    except Exception as e:
+        logger.error(f"Error creating calendar service: {e}")
+        answer = OkMsgBox(
+            self,
+            "Calendar Service Error",
+            "Error creating calendar service.",
+        )
+        if answer.get_response():
+            return False
+
+    # Get the reminder details from the reminder store.
+    reminder = get_store(self).get(reminder_id)
+
+    if not reminder:
+        logger.error("Reminder not found.")
+        answer = OkMsgBox(
+            self,
+            "Reminder Error",
+            "Reminder not found.",
+        )
+        if answer.get_response():
+            return False
+
+    # Check if the reminder is already scheduled.
+    start_date = reminder[4]  # reminder[4] is the date last.
+    end_datetime = datetime.datetime.strptime(
+        start_date, "%Y-%m-%d"
+    ) + datetime.timedelta(days=1)
+    end_date = end_datetime.strftime("%Y-%m-%d")
+    logger.info(f"Getting events for {start_date}")
+    events_result = (
+        service.events()
+        .list(
+            calendarId="primary",
+            timeMin=f"{start_date}T00:00:00Z",
+            timeMax=f"{end_date}T00:00:00Z",
+            singleEvents=True,
+            orderBy="startTime",
+        )
+        .execute()
+    )
+    events = events_result.get("items", [])
+
+    # Check if the event already exists.
+    if events:
+        for event in events:
+            if (
+                reminder[1] in event["summary"]
+            ):  # reminder[1] is the description.
+                logger.info("Event already exists.")
+                answer = OkMsgBox(
+                    self,
+                    "Create Event",
+                    "Event already exists in the calendar.",
+                )
+                if answer.get_response():
+                    return False
+
+    # Create the event.
+    event = {
+        "summary": f"HR: {reminder[1]}",  # reminder[1] is the description.
+        "description": reminder[6],  # reminder[6] is the note
+        "start": {
+            "date": reminder[4],  # reminder[4] is the date last.
+            "timeZone": "America/New_York",
+        },
+        "end": {
+            "date": reminder[4],  # reminder[4] is the date last.
+            "timeZone": "America/New_York",
+        },
+    }
+    # Insert the event into the calendar.
+    try:
+        created_event = (
+            service.events().insert(calendarId="primary", body=event).execute()
+        )
+        logger.info(f"Event created: {created_event['id']}")
+        answer = OkMsgBox(
+            self,
+            "Create Event",
+            "Calendar event successfully created.",
+        )
+        if answer.get_response():
+            return True
+    except Exception as e:
+        logger.error(f"Error creating event: {e}")
+        answer = OkMsgBox(
+            self,
+            "Event Creation Error",
+            "Error creating event.",
+        )
+        if answer.get_response():
+            return False
+
+    # If the event is created successfully, return True.
+    # If there is an error, return False.
+    # If an event with the same summary and date already exists, you can
+    # either skip creating the new event or update the existing event with
+    # the new details.
+    # This can be done by using the event ID to update the existing event.
+    # You can also add logic to handle conflicts, such as asking the user
+    # if they want to overwrite the existing event or create a new one with
+    # a different summary or date.
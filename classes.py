@@ -1,6 +1,13 @@
 import sys
 import tkinter as tk
 from tkinter import ttk
+from typing import Optional, Sequence, Tuple
+
+from constants import (
+    BACKUP_PROGRESS_POLL_MS,
+    NOTIFICATIONS_POPUP_LIMIT,
+    ROW_TAG_COLORS,
+)
 
 
 # create toplevel
@@ -183,6 +190,10 @@ class NotificationsPopup(tk.Toplevel):
         self.txt.grid(row=0, column=0, padx=10, pady=5, sticky="nsew")
         self.button.grid(row=2, column=0, columnspan=2, pady=(0, 1))
         self.txt.insert(tk.END, message)
+        # Configure the highlighting of the notification categories once.
+        for category, color in ROW_TAG_COLORS.items():
+            self.txt.tag_config(category, background=color)
+        self.txt.tag_config("summary", font=("Helvetica", 13, "italic"))
         x = master.winfo_x()
         y = master.winfo_y()
         self.geometry("+%d+%d" % (x + x_offset, y + y_offset))
@@ -201,6 +212,31 @@ class NotificationsPopup(tk.Toplevel):
         self.txt.configure(xscroll=h_scrollbar.set)
         h_scrollbar.grid(row=1, column=0, columnspan=2, sticky="ew")
 
+    def show_notifications(
+        self,
+        notifications: Sequence[Tuple[str, str]],
+        limit: int = NOTIFICATIONS_POPUP_LIMIT,
+    ) -> None:
+        """
+        Inserts the notifications, one per line, tagged with their category.
+
+        All lines go into the text box in a single insert. If there are more
+        than limit notifications, the rest are summarized in a last line.
+
+        Args:
+            notifications (Sequence[Tuple[str, str]]): (category, text)
+            records.
+            limit (int): The most notifications to list.
+        """
+        args = []
+        for category, text in notifications[:limit]:
+            args += (text + "\n", (category,))
+        if len(notifications) > limit:
+            more = len(notifications) - limit
+            args += (f"\u2026 and {more} more\n", ("summary",))
+        if args:
+            self.txt.insert(tk.END, *args)
+
 
 # custom showinfo messagebox class
 class InfoMsgBox(tk.Toplevel):
@@ -352,6 +388,100 @@ class YesNoMsgBox(tk.Toplevel):
         self.var.set(1)
 
 
+# list box dialog for choosing one of several versions, e.g. backups
+class VersionPicker(tk.Toplevel):
+    def __init__(
+        self,
+        master,
+        title="",
+        message="",
+        versions: Sequence[str] = (),
+        height=2,
+        width=40,
+        x_offset=405,
+        y_offset=300,
+    ):
+        super().__init__(master)
+        self.title(title)
+        self.resizable(False, False)
+        self.wm_transient(master)
+
+        self.wait_visibility()
+        if "pytest" not in sys.modules:
+            # Only grab the focus if not running in pytest
+            # This prevents pytest from hanging on the grab_set call
+            self.grab_set()
+        self.response: Optional[int] = None
+        self.var = tk.IntVar()
+        self.txt = tk.Text(
+            self,
+            bg="#ececec",
+            font=("Helvetica, 13"),
+            height=height,
+            width=width,
+            wrap="word",
+            highlightthickness=0,
+        )
+        self.listbox = tk.Listbox(
+            self,
+            font=("Helvetica, 13"),
+            height=min(len(versions), 10),
+            width=width,
+            activestyle="none",
+            exportselection=False,
+        )
+        self.listbox.insert(tk.END, *versions)
+        if versions:
+            self.listbox.selection_set(0)
+        self.listbox.bind("<Double-1>", lambda e: self.ok())
+        self.button1 = ttk.Button(
+            self,
+            text="Restore",
+            width=7,
+            command=self.ok,
+        )
+        self.button2 = ttk.Button(
+            self,
+            text="Cancel",
+            width=6,
+            command=self.cancel,
+        )
+
+        self.txt.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        self.listbox.grid(row=1, column=0, padx=10, pady=(0, 10))
+        self.button1.grid(
+            row=2, column=0, padx=(60, 0), pady=(0, 3), sticky="w"
+        )
+        self.button2.grid(
+            row=2, column=0, padx=(0, 60), pady=(0, 3), sticky="e"
+        )
+        self.txt.tag_configure("tag-center", justify="center")
+        self.txt.insert(tk.END, message, "tag-center")
+        x = master.winfo_x()
+        y = master.winfo_y()
+        self.geometry("+%d+%d" % (x + x_offset, y + y_offset))
+
+        # use wait_variable method to force user reponse before closing window
+        self.button1.wait_variable(self.var)
+
+    def get_response(self) -> Optional[int]:
+        """
+        Returns the index of the chosen version, or None if cancelled.
+        """
+        return self.response
+
+    def ok(self):
+        selection = self.listbox.curselection()
+        self.response = selection[0] if selection else None
+        self.destroy()
+        self.var.set(1)
+
+    def cancel(self):
+        self.response = None
+        self.destroy()
+        self.var.set(1)
+
+
 # custom okmessagebox class
 class OkMsgBox(tk.Toplevel):
     def __init__(
@@ -416,6 +546,61 @@ class OkMsgBox(tk.Toplevel):
         self.var.set(1)
 
 
+# progress bar popup for long running database operations
+class ProgressPopup(tk.Toplevel):
+    def __init__(
+        self,
+        master,
+        title="",
+        message="",
+        x_offset=405,
+        y_offset=275,
+        poll_ms=BACKUP_PROGRESS_POLL_MS,
+    ):
+        super().__init__(master)
+        self.title(title)
+        self.resizable(False, False)
+        self.wm_transient(master)
+        # The popup closes itself when the operation is done.
+        self.protocol("WM_DELETE_WINDOW", lambda: None)
+        self.wait_visibility()
+        if "pytest" not in sys.modules:
+            # Only grab the focus if not running in pytest
+            # This prevents pytest from hanging on the grab_set call
+            self.grab_set()
+        self.label = ttk.Label(self, text=message)
+        self.bar = ttk.Progressbar(
+            self, mode="determinate", maximum=1.0, length=250
+        )
+        self.label.grid(row=0, column=0, padx=10, pady=(10, 5))
+        self.bar.grid(row=1, column=0, padx=10, pady=(0, 10))
+        x = master.winfo_x()
+        y = master.winfo_y()
+        self.geometry("+%d+%d" % (x + x_offset, y + y_offset))
+        self.fraction = 0.0
+        self.poll_ms = poll_ms
+        self._poll_id = self.after(poll_ms, self._poll)
+
+    def report(self, status: int, remaining: int, total: int) -> None:
+        """
+        Records the progress of an operation.
+
+        Takes the arguments of a Connection.backup progress callback. Only
+        the fraction done is recorded, and the bar is updated from it on the
+        Tk main thread, so this may be called from any thread.
+        """
+        if total > 0:
+            self.fraction = (total - remaining) / total
+
+    def _poll(self) -> None:
+        self.bar["value"] = self.fraction
+        self._poll_id = self.after(self.poll_ms, self._poll)
+
+    def destroy(self) -> None:
+        self.after_cancel(self._poll_id)
+        super().destroy()
+
+
 class TestError(Exception):
     """Custom error class for testing purposes."""
 
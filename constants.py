@@ -1,5 +1,41 @@
 WINDOW_GEOMETRY = "1140x393+3+3"
-NOTIFICATION_INTERVAL_MS = 14400000  # 4 hours
+# Longest time the notification scheduler sleeps before checking the clock.
+NOTIFICATION_MAX_SLEEP_MS = 86400000  # 24 hours
+# Most notifications listed in the notifications popup; the rest are
+# summarized in a last line.
+NOTIFICATIONS_POPUP_LIMIT = 200
+# Longest time between checks for a change of date.
+DATE_CHECK_MAX_SLEEP_MS = 3600000  # 1 hour
+# Lead times in days of the notification categories: due today, due tomorrow
+# and due in 7 days.
+NOTIFICATION_LEAD_DAYS = (0, 1, 7)
+# Treeview row tags for the due status of a reminder, and their highlight
+# colors. The tags are configured once, when the treeview is created.
+ROW_TAG_COLORS = {
+    "past-due": "yellow",
+    "due-today": "lime",
+    "future": "white",
+    "no-date": "#ececec",
+}
+# Above this many rows, the treeview shows a window of the reminders at a time,
+# with this many buffer rows above and below the visible rows.
+VIRTUAL_TREE_THRESHOLD = 1000
+VIRTUAL_TREE_BUFFER = 50
+# Also search the SQLite FTS5 table, when available, which finds the words of a
+# query in any order and ranks them first. Substring matches are always
+# included after them.
+FULL_TEXT_SEARCH = True
+# How often the Tk main thread checks for finished background database jobs.
+DB_EXECUTOR_POLL_MS = 20
+# Database pages copied in each step of a backup or restore, and how often
+# the progress bar is updated.
+BACKUP_PAGES_PER_STEP = 1024
+BACKUP_PROGRESS_POLL_MS = 50
+# Number of backup snapshots kept, their gzip compression level, and whether
+# a snapshot is taken at every launch of the production app.
+BACKUP_KEEP = 10
+BACKUP_COMPRESS_LEVEL = 6
+AUTO_BACKUP = True
 # DB_ENVIRONMENT: must be 'production' or 'test'
 DB_ENVIRONMENT = "production"
 DB_ENVIRONMENT = "test"
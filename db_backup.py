@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from typing import Callable, Optional
+
+from constants import BACKUP_PAGES_PER_STEP
+from schema import SCHEMA_VERSION, schema_version
+
+# Called by Connection.backup after each step with the status of the step,
+# the number of pages still to copy and the total number of pages.
+Progress = Callable[[int, int, int], object]
+
+
+def quick_check(con: sqlite3.Connection) -> bool:
+    """
+    Returns True if PRAGMA quick_check finds no problems in the database.
+    """
+    try:
+        rows = con.execute("PRAGMA quick_check").fetchall()
+    except sqlite3.DatabaseError:
+        return False
+    return rows == [("ok",)]
+
+
+def copy_database(
+    source: sqlite3.Connection,
+    target: sqlite3.Connection,
+    pages: int = BACKUP_PAGES_PER_STEP,
+    progress: Optional[Progress] = None,
+) -> None:
+    """
+    Copies the source database into the target with the SQLite backup API.
+
+    The copy is made pages at a time. Each step holds the read lock on the
+    source only briefly, so other connections can keep writing, and a write
+    in between restarts the copy, so the result is a consistent snapshot
+    even under WAL or an open transaction on another connection.
+
+    Args:
+        source (sqlite3.Connection): The database to copy.
+        target (sqlite3.Connection): The database to overwrite.
+        pages (int): The number of pages to copy in each step.
+        progress (Progress): Called after each step with (status, remaining,
+        total).
+    Raises:
+        sqlite3.DatabaseError: If the copy fails, or the copied database
+        fails quick_check.
+    """
+    source.backup(target, pages=pages, progress=progress)
+    if not quick_check(target):
+        raise sqlite3.DatabaseError("The copied database failed quick_check.")
+
+
+def backup_to_file(
+    con: sqlite3.Connection,
+    path: str | os.PathLike,
+    pages: int = BACKUP_PAGES_PER_STEP,
+    progress: Optional[Progress] = None,
+) -> None:
+    """
+    Writes an online backup of the database to a file.
+
+    The backup is written to a temporary file next to path, checked and
+    then renamed over path, so the previous backup survives a failed one.
+    The backup uses a rollback journal, so it is a single self-contained
+    file even when the database is in WAL mode.
+
+    Args:
+        con (sqlite3.Connection): The connection to the database to back up.
+        path (str | os.PathLike): The backup file.
+        pages (int): The number of pages to copy in each step.
+        progress (Progress): Called after each step with (status, remaining,
+        total).
+    Raises:
+        sqlite3.DatabaseError: If the backup fails or fails quick_check.
+    """
+    tmp_path = f"{os.fspath(path)}.tmp"
+    target = sqlite3.connect(tmp_path)
+    try:
+        copy_database(con, target, pages, progress)
+        target.execute("PRAGMA journal_mode = DELETE")
+    except BaseException:
+        target.close()
+        os.remove(tmp_path)
+        raise
+    target.close()
+    os.replace(tmp_path, path)
+
+
+def copy_file(
+    source_path: str | os.PathLike,
+    target_path: str | os.PathLike,
+    pages: int = BACKUP_PAGES_PER_STEP,
+    progress: Optional[Progress] = None,
+) -> None:
+    """
+    Copies a database file, as backup_to_file does for an open connection.
+
+    Raises:
+        FileNotFoundError: If the source file does not exist.
+        sqlite3.DatabaseError: If the copy fails or fails quick_check.
+    """
+    if not os.path.exists(source_path):
+        raise FileNotFoundError(source_path)
+    source = sqlite3.connect(source_path)
+    try:
+        backup_to_file(source, target_path, pages, progress)
+    finally:
+        source.close()
+
+
+def validate_backup(path: str | os.PathLike) -> None:
+    """
+    Checks that a file is an intact database that this version can use.
+
+    Args:
+        path (str | os.PathLike): The database file.
+    Raises:
+        sqlite3.DatabaseError: If the file fails integrity_check, has a newer
+        schema version than SCHEMA_VERSION, or lacks the reminders or user
+        table.
+    """
+    con = sqlite3.connect(path)
+    try:
+        rows = con.execute("PRAGMA integrity_check").fetchall()
+        if rows != [("ok",)]:
+            raise sqlite3.DatabaseError("The backup failed integrity_check.")
+        version = schema_version(con)
+        if version > SCHEMA_VERSION:
+            raise sqlite3.DatabaseError(
+                f"The backup has schema version {version}; this version "
+                f"of the app supports up to {SCHEMA_VERSION}."
+            )
+        tables = {
+            row[0]
+            for row in con.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        missing = sorted({"reminders", "user"} - tables)
+        if missing:
+            raise sqlite3.DatabaseError(
+                f"The backup has no {' or '.join(missing)} table."
+            )
+    finally:
+        con.close()
+
+
+def replace_database(
+    candidate: str | os.PathLike, db_path: str | os.PathLike
+) -> None:
+    """
+    Atomically replaces the database file with a candidate file.
+
+    Every connection to the database must be closed first. The candidate is
+    synced to disk and renamed over the database, so a crash leaves either
+    the old or the new database, never a mix. Leftover WAL and shared-memory
+    files of the old database are removed before the rename, so that they
+    are never applied to the new one.
+
+    Args:
+        candidate (str | os.PathLike): The new database file, in the same
+        directory as the database.
+        db_path (str | os.PathLike): The database file.
+    Raises:
+        OSError: If the file cannot be replaced.
+    """
+    with open(candidate, "rb+") as f:
+        os.fsync(f.fileno())
+    for suffix in ("-wal", "-shm", "-journal"):
+        leftover = f"{os.fspath(db_path)}{suffix}"
+        if os.path.exists(leftover):
+            os.remove(leftover)
+    os.replace(candidate, db_path)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from loguru import logger
+
+from constants import DB_ENVIRONMENT, DB_EXECUTOR_POLL_MS
+from db_manager import ConnectionManager, get_db_path
+
+T = TypeVar("T")
+
+# Queued in place of a job to close the worker's connection.
+_RELEASE = object()
+
+
+class DBExecutor:
+    """
+    Runs database jobs on one dedicated worker thread.
+
+    The worker thread owns its own connection, so slow disks and locked
+    databases block the worker instead of the Tk main thread. Jobs are
+    functions of the connection; submitting one returns a
+    concurrent.futures.Future. A callback given with a job is run on the Tk
+    main thread: finished futures are put on a queue that is drained by
+    polling with app.after, and polling runs only while callbacks are
+    outstanding.
+    """
+
+    def __init__(
+        self,
+        app: Any = None,
+        db_path: Optional[str] = None,
+        wal: bool = DB_ENVIRONMENT == "production",
+        poll_ms: int = DB_EXECUTOR_POLL_MS,
+    ):
+        self.app = app
+        self.db_path = db_path
+        self.wal = wal
+        self.poll_ms = poll_ms
+        self._jobs: queue.Queue = queue.Queue()
+        self._done: queue.Queue = queue.Queue()
+        self._pending = 0
+        self._poll_id: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        # Opened on the worker thread by its first job.
+        self._manager = ConnectionManager(db_path or get_db_path(), wal=wal)
+
+    @property
+    def running(self) -> bool:
+        """
+        True if the worker thread is running.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Starts the worker thread, if it is not running.
+        """
+        if self.running:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="db-executor", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        job: Callable[[sqlite3.Connection], T],
+        callback: Optional[Callable[[Future[T]], Any]] = None,
+    ) -> Future[T]:
+        """
+        Queues a job for the worker thread.
+
+        Args:
+            job (Callable): Called on the worker thread with its connection.
+            callback (Callable): If given, called with the finished future on
+            the Tk main thread.
+        Returns:
+            Future: The result of the job.
+        """
+        self.start()
+        future: Future[T] = Future()
+        if callback is not None:
+            self._pending += 1
+            future.add_done_callback(lambda f: self._done.put((callback, f)))
+            self._schedule_poll()
+        self._jobs.put((future, job))
+        return future
+
+    def query(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        callback: Optional[Callable[[Future], Any]] = None,
+    ) -> Future[List[Tuple]]:
+        """
+        Runs a query on the worker thread; the result is the list of rows.
+        """
+        return self.submit(
+            lambda con: con.execute(sql, params).fetchall(), callback
+        )
+
+    def execute(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        callback: Optional[Callable[[Future], Any]] = None,
+    ) -> Future[int]:
+        """
+        Runs a command in a transaction on the worker thread; the result is
+        the number of rows changed.
+        """
+
+        def command(con: sqlite3.Connection) -> int:
+            with con:
+                return con.execute(sql, params).rowcount
+
+        return self.submit(command, callback)
+
+    def release(self) -> Future[None]:
+        """
+        Closes the worker's connection once the queued jobs are done.
+
+        The next job opens a new connection, so this is how the worker lets
+        go of a database file that is about to be replaced.
+
+        Returns:
+            Future: Done when the connection is closed.
+        """
+        self.start()
+        future: Future[None] = Future()
+        self._jobs.put((future, _RELEASE))
+        return future
+
+    def drain(self) -> None:
+        """
+        Runs the callbacks of the finished jobs on the calling thread.
+        """
+        while True:
+            try:
+                callback, future = self._done.get_nowait()
+            except queue.Empty:
+                return
+            self._pending -= 1
+            try:
+                callback(future)
+            except Exception as e:
+                logger.error(f"Error in database job callback: {e}")
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Finishes the queued jobs, then stops the worker and closes its
+        connection.
+        """
+        if self.running:
+            self._jobs.put(None)
+            self._thread.join(timeout)
+        self._thread = None
+        if self._poll_id is not None and self.app is not None:
+            self.app.after_cancel(self._poll_id)
+            self._poll_id = None
+        self.drain()
+
+    def _schedule_poll(self) -> None:
+        if self.app is not None and self._poll_id is None:
+            self._poll_id = self.app.after(self.poll_ms, self._poll)
+
+    def _poll(self) -> None:
+        self._poll_id = None
+        self.drain()
+        if self._pending > 0:
+            self._schedule_poll()
+
+    def _run(self) -> None:
+        manager = self._manager
+        try:
+            while True:
+                item = self._jobs.get()
+                if item is None:
+                    break
+                future, job = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if job is _RELEASE:
+                        result = manager.close()
+                    else:
+                        result = job(manager.connection())
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+        finally:
+            manager.close()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import atexit
+import os
+import sqlite3
+import sys
+from typing import Optional
+
+from loguru import logger
+
+from constants import DB_ENVIRONMENT
+
+# Number of sqlite3 connections opened during this session.
+_connections_opened = 0
+# The connection manager shared by the Tk main thread.
+_manager: Optional[ConnectionManager] = None
+
+
+def appsupportdir() -> str | os.PathLike:
+    """
+    Function to get the Application Support directory.
+
+    It checks for the existence of the Application Support directory in macOS
+    and Linux, and the AppData directory in Windows. If none of these
+    directories exist, it returns the user's home directory.
+    Args:
+        none
+    Returns:
+        str | os.PathLike: The path to the Application Support directory or
+        the user's home directory.
+    """
+    windows = r"%APPDATA%"
+    windows = os.path.expandvars(windows)
+    if "APPDATA" not in windows:
+        return windows
+
+    user_directory = os.path.expanduser("~")
+
+    macos = os.path.join(user_directory, "Library", "Application Support")
+    if os.path.exists(macos):
+        return macos
+
+    linux = os.path.join(user_directory, ".local", "share")
+    if os.path.exists(linux):
+        return linux
+
+    return user_directory
+
+
+def get_db_path() -> str:
+    """
+    Function to get path to db depending on database environment.
+
+    Returns os.PathLike: The path to the database.
+    """
+    # Check that DB_ENVIRONMENT is valid.
+    if DB_ENVIRONMENT not in ["production", "test"]:
+        logger.warning("Invalid DB_ENVIRONMENT, exiting.")
+        sys.exit()
+    # Get the database path depending on the database environment.
+    if DB_ENVIRONMENT != "production":
+        try:
+            db_path = os.path.join(
+                os.path.dirname(__file__), "tests", "test.db"
+            )
+        except FileNotFoundError as e:
+            logger.error(f"Test database not found: {e}, exiting.")
+            sys.exit()
+    else:
+        try:
+            dir_path = os.path.join(appsupportdir(), "Home Reminders")
+            if not os.path.exists(dir_path):
+                os.makedirs(dir_path)
+            db_path = os.path.join(dir_path, "home_reminders.db")
+        except FileNotFoundError as e:
+            logger.error(f"Production database not found: {e}, exiting.")
+            sys.exit()
+    return db_path
+
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """
+    Opens a sqlite3 connection and counts it toward the session total.
+
+    Args:
+        db_path (str): Path to the database file.
+        **kwargs: Passed through to sqlite3.connect.
+    Returns:
+        sqlite3.Connection: The new connection.
+    """
+    global _connections_opened
+    con = sqlite3.connect(db_path, **kwargs)
+    _connections_opened += 1
+    return con
+
+
+def connections_opened() -> int:
+    """
+    Returns the number of connections opened during this session.
+    """
+    return _connections_opened
+
+
+class ConnectionManager:
+    """
+    Owns one long-lived, configured connection to the database.
+
+    The connection is opened on first use and reused until close() is called.
+    It belongs to the thread that opened it, which is the Tk main thread.
+    Reusing one connection also reuses its prepared statement cache.
+    """
+
+    def __init__(self, db_path: str, wal: bool = True):
+        self.db_path = db_path
+        self.wal = wal
+        self._con: Optional[sqlite3.Connection] = None
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Returns the managed connection, opening it if necessary.
+        """
+        if self._con is None:
+            self._con = connect(self.db_path)
+            self._configure(self._con)
+            logger.info(f"Opened database connection to {self.db_path}.")
+        return self._con
+
+    def cursor(self) -> sqlite3.Cursor:
+        """
+        Returns a new cursor on the managed connection.
+        """
+        return self.connection().cursor()
+
+    def close(self) -> None:
+        """
+        Closes the managed connection, if open.
+        """
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+            logger.info(
+                "Closed database connection; "
+                f"{connections_opened()} connection(s) opened this session."
+            )
+
+    def _configure(self, con: sqlite3.Connection) -> None:
+        # WAL lets readers and the writer proceed without blocking each other
+        # and, with synchronous=NORMAL, only syncs at checkpoints.
+        if self.wal:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+
+
+def get_manager() -> ConnectionManager:
+    """
+    Returns the session's connection manager, creating it on first use.
+
+    The database path is resolved once, here. The test database is copied and
+    restored file by file by the test suite, so it stays in rollback-journal
+    mode rather than WAL.
+    """
+    global _manager
+    if _manager is None:
+        _manager = ConnectionManager(
+            get_db_path(), wal=DB_ENVIRONMENT == "production"
+        )
+        atexit.register(_manager.close)
+    return _manager
+
+
+def get_connection() -> sqlite3.Connection:
+    """
+    Returns the session's shared connection to the database.
+    """
+    return get_manager().connection()
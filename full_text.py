@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+from datetime import date
+from typing import List, Optional
+
+from loguru import logger
+
+FTS_TABLE = "reminders_fts"
+
+# External content table: the text is read from the reminders table, and the
+# index is kept in sync by the triggers below. The prefix option adds indexes
+# for two and three character prefixes, so that short prefix queries are fast.
+CREATE_FTS_TABLE = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        description,
+        note,
+        content='reminders',
+        content_rowid='id',
+        prefix='2 3')
+"""
+
+CREATE_FTS_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON reminders
+    BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, description, note)
+        VALUES (new.id, new.description, new.note);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON reminders
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description, note)
+        VALUES ('delete', old.id, old.description, old.note);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+    AFTER UPDATE OF description, note ON reminders
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description, note)
+        VALUES ('delete', old.id, old.description, old.note);
+        INSERT INTO {FTS_TABLE}(rowid, description, note)
+        VALUES (new.id, new.description, new.note);
+    END
+    """,
+)
+
+# A double-quoted phrase, or a single word.
+_TERM = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def fts5_available(con: sqlite3.Connection) -> bool:
+    """
+    Returns True if the SQLite library was compiled with FTS5.
+    """
+    try:
+        return bool(
+            con.execute(
+                "SELECT sqlite_compileoption_used('ENABLE_FTS5')"
+            ).fetchone()[0]
+        )
+    except sqlite3.Error:
+        return False
+
+
+def fts_enabled(con: sqlite3.Connection) -> bool:
+    """
+    Returns True if the full-text table exists in the database.
+    """
+    row = con.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (FTS_TABLE,),
+    ).fetchone()
+    return row is not None
+
+
+def create_fts(con: sqlite3.Connection) -> bool:
+    """
+    Creates the full-text table and its triggers, if FTS5 is available.
+
+    The table is filled from the reminders table when it is first created.
+    Databases without the table, including ones restored from an older
+    backup, keep working with the in-memory search.
+
+    Args:
+        con (sqlite3.Connection): The database connection.
+    Returns:
+        bool: True if the full-text table is in place.
+    """
+    if not fts5_available(con):
+        logger.info("SQLite FTS5 is not available; full-text search is off.")
+        return False
+    created = not fts_enabled(con)
+    with con:
+        con.execute(CREATE_FTS_TABLE)
+        for trigger in CREATE_FTS_TRIGGERS:
+            con.execute(trigger)
+        if created:
+            con.execute(
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+            )
+    return True
+
+
+def match_expression(query: str) -> str:
+    """
+    Converts a search query to an FTS5 MATCH expression.
+
+    Words are matched as prefixes and text in double quotes as a phrase. All
+    words and phrases must match. Quotes are doubled inside the FTS5 strings,
+    so the query cannot inject FTS5 operators.
+
+    Args:
+        query (str): The text entered in the search bar.
+    Returns:
+        str: The MATCH expression, empty if the query has no terms.
+    """
+    terms = []
+    for phrase, word in _TERM.findall(query):
+        text = phrase if phrase else word
+        text = text.strip().replace('"', '""')
+        if not text:
+            continue
+        terms.append(f'"{text}"' if phrase else f'"{text}"*')
+    return " ".join(terms)
+
+
+def search_fts(
+    con: sqlite3.Connection, query: str, since: Optional[date] = None
+) -> List[int]:
+    """
+    Returns the ids of the reminders matching the query, best match first.
+
+    Matches are ranked by BM25, with ties in treeview order.
+
+    Args:
+        con (sqlite3.Connection): The database connection.
+        query (str): The text entered in the search bar.
+        since (date): If given, only reminders due on or after this date are
+        returned, as in the pending view.
+    Returns:
+        List[int]: The matching reminder ids.
+    """
+    expression = match_expression(query)
+    if not expression:
+        return []
+    where, params = "", (expression,)
+    if since is not None:
+        where, params = "AND r.date_next >= ?", params + (since.isoformat(),)
+    rows = con.execute(
+        f"""
+        SELECT r.id FROM {FTS_TABLE} f JOIN reminders r ON r.id = f.rowid
+        WHERE {FTS_TABLE} MATCH ? {where}
+        ORDER BY f.rank, COALESCE(r.date_next, ''), r.id
+        """,
+        params,
+    )
+    return [row[0] for row in rows]
@@ -7,12 +7,16 @@ from loguru import logger
 from PIL import Image, ImageTk
 
 from business import (
+    auto_backup,
+    check_date,
+    close_executor,
     create_database,
     date_check,
+    get_store,
     get_user_data,
-    insert_data,
     notifications_popup,
     refresh,
+    start_notification_scheduler,
 )
 from classes import InfoMsgBox
 from constants import WINDOW_GEOMETRY
@@ -61,8 +65,10 @@ class App(tk.Tk):
         # flag to track whether coming from view_all or view_current
         self.view_current = False
 
-        # create database if it does not exist and retrieve data
+        # create database if it does not exist, load the reminder store and
+        # retrieve data
         create_database(self)
+        self.store = get_store(self)
         reminders = ReminderService.get_reminders(self, self.view_current)
         data = reminders if reminders else None
 
@@ -112,7 +118,6 @@ class App(tk.Tk):
         self.tree = create_tree_widget(self)
         # Add reminders in the database to the treeview.
         if data:
-            insert_data(self, data)
             refresh(self)
         else:
             logger.info("No reminders found to display.")
@@ -123,26 +128,44 @@ class App(tk.Tk):
 
         # Periodically check for notifications, if user has opted in to receive
         # them.
-        user_data = get_user_data(self).fetchone()
-        # user_data.fetchone()[0] = phone number. If present, user has opted to
-        # receive notifications.
-        if user_data:
-            if user_data[0]:
+        preferences = get_user_data(self)
+        # A phone number means the user has opted to receive notifications.
+        if preferences:
+            if preferences.opted_in:
                 notifications_popup(self)
+                # Check again whenever a reminder changes category.
+                start_notification_scheduler(self)
 
-        # Monitor for date change.
+        # Monitor for date change: at midnight, and whenever the app gets
+        # focus, e.g. after the computer wakes from sleep. FocusIn on the
+        # root window is also delivered for every child widget that gets
+        # focus, so only the event for the window itself is handled.
         date_check(self)
+        self.bind(
+            "<FocusIn>",
+            lambda e: check_date(self) if e.widget is self else None,
+            add="+",
+        )
+        # Snapshot the database in the background if it has changed since the
+        # last backup.
+        auto_backup(self)
         # Select the last item in the treeview. This will get focus into the
         # treeview but not interfere with the highlighting at the top of the
         # tree. Note: treeview will not accept focus at this point because the
         # notifications popup is open. This is a known issue with tkinter.
-        if self.tree.get_children():
-            last_index = len(self.tree.get_children()) - 1
-            self.tree.selection_set(self.tree.get_children()[last_index])
+        # Long lists only render a window of rows, so VirtualRows finds the
+        # last row.
+        self.virtual_rows.select_last()
 
     # end init
     ###############################################################
 
+    def destroy(self) -> None:
+        # Stop the database worker while Tk is still alive; the Quit button
+        # and closing the window both come through here.
+        close_executor(self)
+        super().destroy()
+
 
 if __name__ == "__main__":
     app = App()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Iterator, Optional, Sequence, Tuple
+
+
+def parse_date(value: Optional[str]) -> Optional[date]:
+    """
+    Parses a YYYY-MM-DD string from the database.
+
+    Args:
+        value (Optional[str]): The stored date string.
+    Returns:
+        Optional[date]: The parsed date, or None if the value is empty or not
+        a valid date.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+class Reminder:
+    """
+    An immutable reminder item as stored in the reminders table.
+
+    The date_next value is parsed once, into the due attribute. Indexing,
+    iteration and equality follow the column order of the reminders table, so
+    a Reminder can be used wherever a row tuple was used before.
+    """
+
+    __slots__ = (
+        "id",
+        "description",
+        "frequency",
+        "period",
+        "date_last",
+        "date_next",
+        "note",
+        "due",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        description: str,
+        frequency: str,
+        period: str,
+        date_last: str,
+        date_next: Optional[str],
+        note: str,
+    ):
+        init = object.__setattr__
+        init(self, "id", id)
+        init(self, "description", description)
+        init(self, "frequency", frequency)
+        init(self, "period", period)
+        init(self, "date_last", date_last)
+        init(self, "date_next", date_next)
+        init(self, "note", note)
+        init(self, "due", parse_date(date_next))
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> Reminder:
+        """
+        Creates a Reminder from a row of the reminders table.
+        """
+        return cls(*row)
+
+    @property
+    def row(self) -> Tuple[int, str, str, str, str, Optional[str], str]:
+        """
+        The reminder as a row tuple, in the column order of the table.
+        """
+        return (
+            self.id,
+            self.description,
+            self.frequency,
+            self.period,
+            self.date_last,
+            self.date_next,
+            self.note,
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Reminder objects are immutable.")
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.row)
+
+    def __len__(self) -> int:
+        return 7
+
+    def __getitem__(self, index):
+        return self.row[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Reminder):
+            return self.row == other.row
+        if isinstance(other, tuple):
+            return self.row == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.row)
+
+    def __repr__(self) -> str:
+        return f"Reminder{self.row!r}"
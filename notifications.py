@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import bisect
+from datetime import date, datetime, time, timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from constants import NOTIFICATION_LEAD_DAYS, NOTIFICATION_MAX_SLEEP_MS
+from models import Reminder, parse_date
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from preferences import UserPreferences
+    from reminder_store import ReminderStore
+
+# Ordinal used for reminders without a due date; below every real date, and
+# excluded from every bucket.
+NO_DATE = 0
+
+
+# The notification category of each lead time: the category name, the label
+# of its messages and the user preference that turns it on.
+LEAD_TIME_CATEGORIES = {
+    0: ("due-today", "Due today", "day_of"),
+    1: ("due-tomorrow", "Due tomorrow", "day_before"),
+    7: ("due-in-7-days", "Due in 7 days", "week_before"),
+}
+_unknown = [d for d in NOTIFICATION_LEAD_DAYS if d not in LEAD_TIME_CATEGORIES]
+if _unknown:
+    raise ValueError(
+        f"NOTIFICATION_LEAD_DAYS has lead times {_unknown} without a "
+        "notification category in LEAD_TIME_CATEGORIES."
+    )
+
+# The notification categories in display order: past due, which is always
+# included, then one category per lead time in NOTIFICATION_LEAD_DAYS.
+NOTIFICATION_CATEGORIES = (("past-due", "Past due", None),) + tuple(
+    LEAD_TIME_CATEGORIES[days] for days in NOTIFICATION_LEAD_DAYS
+)
+
+
+def due_ordinals(reminders: Sequence[Reminder | Tuple]) -> np.ndarray:
+    """
+    Returns the due dates of the reminders as an array of date ordinals.
+
+    Each due date is parsed once: Reminders carry their parsed date, and plain
+    row tuples are parsed here. Missing or invalid dates are NO_DATE.
+
+    Args:
+        reminders (Sequence[Reminder | Tuple]): The reminders or row tuples.
+    Returns:
+        np.ndarray: The int64 ordinals, in the order of reminders.
+    """
+    # numpy is imported on first use to keep it off the startup path.
+    import numpy as np
+
+    def ordinal(r: Reminder | Tuple) -> int:
+        due = r.due if isinstance(r, Reminder) else parse_date(r[5])
+        return due.toordinal() if due else NO_DATE
+
+    return np.fromiter(
+        (ordinal(r) for r in reminders), dtype=np.int64, count=len(reminders)
+    )
+
+
+def categorize(
+    ordinals: np.ndarray,
+    lead_days: Sequence[int] = NOTIFICATION_LEAD_DAYS,
+    today: Optional[date] = None,
+) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Buckets due dates into past due and due in each of the lead times.
+
+    All comparisons are against one snapshot of today's date.
+
+    Args:
+        ordinals (np.ndarray): Due date ordinals, as from due_ordinals.
+        lead_days (Sequence[int]): The lead times in days of the buckets; 0
+        is due today, 1 due tomorrow and so on.
+        today (date): The date to categorize against, today by default.
+    Returns:
+        Tuple[np.ndarray, List[np.ndarray]]: The indexes of the past due
+        reminders, and a list with the indexes of the reminders due in each
+        lead time, in the order of lead_days. Indexes are in ascending order.
+    """
+    import numpy as np
+
+    now = (today or date.today()).toordinal()
+    past_due = np.flatnonzero((ordinals != NO_DATE) & (ordinals < now))
+    buckets = [np.flatnonzero(ordinals == now + days) for days in lead_days]
+    return past_due, buckets
+
+
+def build_notifications(
+    categorized_reminders: Sequence[Sequence[Reminder | Tuple]],
+    preferences: Optional[UserPreferences],
+) -> List[Tuple[str, str]]:
+    """
+    Builds the notification messages for the categorized reminders.
+
+    Args:
+        categorized_reminders (Sequence[Sequence[Reminder | Tuple]]): The
+        past due reminders and the reminders due in each lead time, in the
+        order of NOTIFICATION_CATEGORIES.
+        preferences (Optional[UserPreferences]): The user preferences, which
+        select the categories to include. There are no notifications without
+        preferences.
+    Returns:
+        List[Tuple[str, str]]: (category, text) records in display order, for
+        example ("past-due", "\u2022 Past due: Clean gutters").
+    Raises:
+        ValueError: If there is not one sequence of reminders per category.
+    """
+    records: List[Tuple[str, str]] = []
+    if not preferences:
+        return records
+    if len(categorized_reminders) != len(NOTIFICATION_CATEGORIES):
+        raise ValueError(
+            f"Expected {len(NOTIFICATION_CATEGORIES)} categories of "
+            f"reminders, got {len(categorized_reminders)}."
+        )
+    for (category, label, option), reminders in zip(
+        NOTIFICATION_CATEGORIES, categorized_reminders
+    ):
+        if option is None or getattr(preferences, option):
+            # r[1] is the description of a Reminder or a row tuple.
+            records.extend(
+                (category, f"\u2022 {label}: {r[1]}") for r in reminders
+            )
+    return records
+
+
+def next_threshold(
+    ordinals: Sequence[int],
+    lead_days: Sequence[int] = NOTIFICATION_LEAD_DAYS,
+    today: Optional[date] = None,
+) -> Optional[date]:
+    """
+    Returns the next date on which a reminder changes notification category.
+
+    A reminder due on day d enters a lead-time category on d minus each lead
+    time and becomes past due on d + 1. Each of these thresholds is found
+    with a binary search of the sorted due dates.
+
+    Args:
+        ordinals (Sequence[int]): The due date ordinals, in ascending order.
+        lead_days (Sequence[int]): The lead times in days of the categories.
+        today (date): The current date, today by default.
+    Returns:
+        Optional[date]: The first threshold after today, or None if no
+        reminder reaches another threshold.
+    """
+    now = (today or date.today()).toordinal()
+    candidates = []
+    for offset in {-days for days in lead_days} | {1}:
+        # The first due date whose threshold is after today.
+        index = bisect.bisect_right(ordinals, now - offset)
+        if index < len(ordinals):
+            candidates.append(ordinals[index] + offset)
+    return date.fromordinal(min(candidates)) if candidates else None
+
+
+class NotificationScheduler:
+    """
+    Runs the notifications check when a reminder crosses a threshold.
+
+    Rather than polling, the scheduler works out from the reminders' due
+    dates the next midnight at which a reminder moves into a notification
+    category (7 days before, 1 day before, due, past due) and sleeps until
+    then. It subscribes to the ReminderStore and recomputes the schedule
+    when reminders are saved, updated or deleted. Long sleeps are split into
+    steps of at most NOTIFICATION_MAX_SLEEP_MS, so the schedule recovers
+    from clock changes and system sleep.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        store: ReminderStore,
+        notify: Callable[[], Any],
+        lead_days: Sequence[int] = NOTIFICATION_LEAD_DAYS,
+    ):
+        self.app = app
+        self.store = store
+        self.notify = notify
+        self.lead_days = lead_days
+        self.next_date: Optional[date] = None
+        self._after_id: Optional[str] = None
+        self._idle_id: Optional[str] = None
+        store.subscribe(self)
+
+    def start(self) -> None:
+        """
+        Schedules the next notifications check.
+        """
+        self._schedule()
+
+    def stop(self) -> None:
+        """
+        Cancels the scheduled notifications check.
+        """
+        for after_id in (self._after_id, self._idle_id):
+            if after_id is not None:
+                self.app.after_cancel(after_id)
+        self._after_id = self._idle_id = None
+
+    def reminder_added(self, reminder: Reminder) -> None:
+        self._reschedule()
+
+    def reminder_removed(self, reminder: Reminder) -> None:
+        self._reschedule()
+
+    def reminders_loaded(self, reminders: Sequence[Reminder]) -> None:
+        self._reschedule()
+
+    def _reschedule(self) -> None:
+        # Recompute once after a burst of changes, such as an update, which
+        # is reported as a removal and an addition.
+        if self._idle_id is None and self._after_id is not None:
+            self._idle_id = self.app.after_idle(self._schedule)
+
+    def _schedule(self) -> None:
+        self._idle_id = None
+        if self._after_id is not None:
+            self.app.after_cancel(self._after_id)
+            self._after_id = None
+        ordinals = [r.due.toordinal() for r in self.store.all() if r.due]
+        self.next_date = next_threshold(ordinals, self.lead_days)
+        if self.next_date is None:
+            delay = NOTIFICATION_MAX_SLEEP_MS
+        else:
+            # Wake just after midnight, so that the date has changed.
+            wake = datetime.combine(self.next_date, time()) + timedelta(
+                seconds=1
+            )
+            delay = int((wake - datetime.now()).total_seconds() * 1000)
+            delay = max(0, min(delay, NOTIFICATION_MAX_SLEEP_MS))
+        self._after_id = self.app.after(delay, self._wake)
+
+    def _wake(self) -> None:
+        self._after_id = None
+        if self.next_date is not None and date.today() >= self.next_date:
+            self.notify()
+        self._schedule()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Callable, NamedTuple, Optional
+
+from db_manager import get_connection
+
+
+class UserPreferences(NamedTuple):
+    """
+    The row of the user table: phone number and notification preferences.
+
+    As a NamedTuple it still unpacks and indexes like the row tuple, so it
+    can be passed to save_prefs as is.
+    """
+
+    phone_number: str
+    week_before: int
+    day_before: int
+    day_of: int
+    last_notification_date: str
+
+    @property
+    def opted_in(self) -> bool:
+        """
+        True if the user has opted in to notifications by giving a number.
+        """
+        return bool(self.phone_number)
+
+
+class PreferencesCache:
+    """
+    Loads the user preferences once and serves them from memory.
+
+    Whatever writes the user table must call invalidate(), so that the next
+    read loads the new preferences.
+    """
+
+    def __init__(
+        self, connection: Callable[[], sqlite3.Connection] = get_connection
+    ):
+        self._connection = connection
+        self._loaded = False
+        self._preferences: Optional[UserPreferences] = None
+
+    def get(self) -> Optional[UserPreferences]:
+        """
+        Returns the user preferences, or None if the user table is empty.
+
+        Raises sqlite3.Error if the preferences cannot be read; nothing is
+        cached in that case.
+        """
+        if not self._loaded:
+            row = self._connection().execute("SELECT * FROM user").fetchone()
+            self._preferences = UserPreferences(*row) if row else None
+            self._loaded = True
+        return self._preferences
+
+    def invalidate(self) -> None:
+        """
+        Forgets the cached preferences.
+        """
+        self._loaded = False
+        self._preferences = None
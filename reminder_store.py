@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import bisect
+import sqlite3
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from models import Reminder
+
+
+def sort_key(reminder: Reminder) -> Tuple[str, int]:
+    """
+    Key that orders reminders like ORDER BY date_next ASC, missing dates first.
+    """
+    return (reminder.date_next or "", reminder.id)
+
+
+def select_reminders(
+    con: sqlite3.Connection,
+    view_current: bool,
+    today: Optional[date] = None,
+) -> Tuple[Reminder, ...]:
+    """
+    Reads pending reminders if view_current is True, otherwise all, ordered
+    by date_next.
+
+    Pending is compared against today's local date, not SQLite's
+    DATE('now'), which is UTC, so that this agrees with
+    ReminderStore.pending around midnight.
+    """
+    if view_current:
+        today = today or date.today()
+        rows = con.execute(
+            "SELECT * FROM reminders WHERE date_next >= ? "
+            "ORDER BY date_next, id",
+            (today.isoformat(),),
+        )
+    else:
+        rows = con.execute("SELECT * FROM reminders ORDER BY date_next, id")
+    return tuple(Reminder.from_row(row) for row in rows)
+
+
+def insert_reminder(
+    con: sqlite3.Connection, values: Tuple[str, str, str, str, str, str]
+) -> Reminder:
+    """
+    Saves a new reminder to the database and returns it with its id.
+    """
+    with con:
+        cur = con.execute(
+            """
+            INSERT INTO reminders (
+                description,
+                frequency,
+                period,
+                date_last,
+                date_next,
+                note)
+            VALUES (?, ?, ?, ?, ?, ?)""",
+            values,
+        )
+    return Reminder(cur.lastrowid, *values)
+
+
+def update_reminder(
+    con: sqlite3.Connection, values: Tuple[str, str, str, str, str, str, int]
+) -> Reminder:
+    """
+    Updates a reminder in the database and returns the updated reminder.
+    """
+    with con:
+        con.execute(
+            """
+            UPDATE reminders
+            SET (
+            description, frequency, period, date_last, date_next, note)
+            = (?, ?, ?, ?, ?, ?)
+            WHERE id = ? """,
+            values,
+        )
+    return Reminder(values[6], *values[:6])
+
+
+def delete_reminder(con: sqlite3.Connection, reminder_id: int) -> None:
+    """
+    Deletes a reminder from the database.
+    """
+    with con:
+        con.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+
+
+class ReminderStore:
+    """
+    In-memory copy of the reminders table.
+
+    The table is loaded once and indexed by id and by description. Reads are
+    served from memory. Writes are made by insert_reminder, update_reminder
+    and delete_reminder on the database worker thread, and are applied to the
+    in-memory copy with apply_saved and apply_deleted only once the database
+    write has succeeded.
+
+    Objects that derive data from the reminders, such as the search index,
+    can subscribe to changes. A listener implements reminder_added(reminder),
+    reminder_removed(reminder) and reminders_loaded(reminders). An update is
+    reported as a removal followed by an addition.
+    """
+
+    def __init__(self, reminders: Iterable[Reminder] = ()):
+        self._listeners: List[Any] = []
+        self.load(reminders)
+
+    def load(self, reminders: Iterable[Reminder]) -> None:
+        """
+        Replaces the contents of the store with the given reminders.
+        """
+        self._by_id: Dict[int, Reminder] = {}
+        self._by_description: Dict[str, Set[int]] = {}
+        self._ordered: List[Reminder] = []
+        self._keys: List[Tuple[str, int]] = []
+        for reminder in reminders:
+            self._by_id[reminder.id] = reminder
+            self._by_description.setdefault(reminder.description, set()).add(
+                reminder.id
+            )
+        self._ordered = sorted(self._by_id.values(), key=sort_key)
+        self._keys = [sort_key(r) for r in self._ordered]
+        self._snapshot: Optional[Tuple[Reminder, ...]] = None
+        # Incremented on every change, so that readers can tell when derived
+        # data is stale.
+        self.version = getattr(self, "version", 0) + 1
+        for listener in self._listeners:
+            listener.reminders_loaded(self.all())
+
+    def subscribe(self, listener: Any) -> None:
+        """
+        Registers a listener to be told about changes to the reminders.
+        """
+        self._listeners.append(listener)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, reminder_id: object) -> bool:
+        return reminder_id in self._by_id
+
+    def get(self, reminder_id: int) -> Optional[Reminder]:
+        """
+        Returns the reminder with the given id, or None.
+        """
+        return self._by_id.get(reminder_id)
+
+    def find_by_description(self, description: str) -> List[Reminder]:
+        """
+        Returns the reminders with exactly the given description.
+        """
+        ids = self._by_description.get(description, ())
+        return [self._by_id[i] for i in ids]
+
+    def find_duplicate(
+        self, description: str, exclude_id: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Returns the id of another reminder with the given description.
+
+        Args:
+            description (str): The description to check.
+            exclude_id (int): The id of the reminder being edited, which does
+            not conflict with itself.
+        Returns:
+            Optional[int]: The id of a conflicting reminder, or None.
+        """
+        for reminder_id in self._by_description.get(description, ()):
+            if reminder_id != exclude_id:
+                return reminder_id
+        return None
+
+    def all(self) -> Tuple[Reminder, ...]:
+        """
+        Returns all reminders, ordered by date_next.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self._ordered)
+        return self._snapshot
+
+    def pending(self, today: Optional[date] = None) -> Tuple[Reminder, ...]:
+        """
+        Returns the reminders due today or later, ordered by date_next.
+        """
+        today = today or date.today()
+        # Reminders are ordered by date_next, so the pending ones are a
+        # suffix of the ordered list. Missing dates sort first and are never
+        # pending, as with select_reminders.
+        start = bisect.bisect_left(self._keys, (today.isoformat(), 0))
+        return tuple(self._ordered[start:])
+
+    def due_within(
+        self, days: int, today: Optional[date] = None
+    ) -> Tuple[Reminder, ...]:
+        """
+        Returns the reminders that are past due or due in the next days days,
+        ordered by date_next.
+        """
+        last = (today or date.today()) + timedelta(days=days)
+        # A slice of the ordered list, between the missing dates, which sort
+        # first, and the last date, so reminders due later are never read.
+        start = bisect.bisect_right(self._keys, ("", float("inf")))
+        stop = bisect.bisect_right(
+            self._keys, (last.isoformat(), float("inf"))
+        )
+        return tuple(self._ordered[start:stop])
+
+    def reminders(self, view_current: bool) -> Tuple[Reminder, ...]:
+        """
+        Returns pending reminders if view_current is True, otherwise all.
+        """
+        return self.pending() if view_current else self.all()
+
+    def apply_saved(self, reminder: Reminder) -> None:
+        """
+        Adds or replaces a reminder that has already been saved to the
+        database, for example by the database worker thread.
+        """
+        self._remove(reminder.id)
+        self._add(reminder)
+
+    def apply_deleted(self, reminder_id: int) -> None:
+        """
+        Removes a reminder that has already been deleted from the database.
+        """
+        self._remove(reminder_id)
+
+    def _add(self, reminder: Reminder) -> None:
+        self._by_id[reminder.id] = reminder
+        self._by_description.setdefault(reminder.description, set()).add(
+            reminder.id
+        )
+        key = sort_key(reminder)
+        index = bisect.bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._ordered.insert(index, reminder)
+        self._changed()
+        for listener in self._listeners:
+            listener.reminder_added(reminder)
+
+    def _remove(self, reminder_id: int) -> None:
+        reminder = self._by_id.pop(reminder_id, None)
+        if reminder is None:
+            return
+        ids = self._by_description[reminder.description]
+        ids.discard(reminder_id)
+        if not ids:
+            del self._by_description[reminder.description]
+        index = bisect.bisect_left(self._keys, sort_key(reminder))
+        del self._keys[index]
+        del self._ordered[index]
+        self._changed()
+        for listener in self._listeners:
+            listener.reminder_removed(reminder)
+
+    def _changed(self) -> None:
+        self._snapshot = None
+        self.version += 1
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Callable, List
+
+from loguru import logger
+
+from full_text import create_fts
+
+# The tables of schema version 0. Later changes are migrations.
+CREATE_USER_TABLE = """
+    CREATE TABLE IF NOT EXISTS user(
+        phone_number TEXT,
+        week_before INT,
+        day_before INT,
+        day_of INT,
+        last_notification_date TEXT)
+"""
+
+CREATE_REMINDERS_TABLE = """
+    CREATE TABLE IF NOT EXISTS reminders(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        description TEXT,
+        frequency TEXT,
+        period TEXT,
+        date_last TEXT,
+        date_next TEXT,
+        note TEXT)
+"""
+
+
+def add_reminder_indexes(con: sqlite3.Connection) -> None:
+    """
+    Migration 1: indexes on reminders.date_next and reminders.description.
+
+    The date_next index serves the ORDER BY date_next and the pending view's
+    WHERE date_next >= ?. The description index serves the
+    duplicate check. It is unique unless the database already has duplicate
+    descriptions, which older versions could save, in which case a plain
+    index is created so that the lookup is still indexed, and
+    make_description_index_unique retries the unique index on every later
+    migrate.
+    """
+    con.execute(
+        "CREATE INDEX IF NOT EXISTS idx_reminders_date_next"
+        " ON reminders(date_next)"
+    )
+    try:
+        con.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_reminders_description"
+            " ON reminders(description)"
+        )
+    except sqlite3.IntegrityError:
+        logger.warning(
+            "Duplicate reminder descriptions found; creating a non-unique "
+            "description index. The unique index is retried at every start "
+            "until the duplicates are removed."
+        )
+        con.execute(
+            "CREATE INDEX IF NOT EXISTS idx_reminders_description"
+            " ON reminders(description)"
+        )
+
+
+# Migrations in order. Migration n brings the database to user_version n.
+# Append new migrations; never change or reorder the existing ones.
+MIGRATIONS: List[Callable[[sqlite3.Connection], None]] = [
+    add_reminder_indexes,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def make_description_index_unique(con: sqlite3.Connection) -> bool:
+    """
+    Replaces a non-unique description index with the unique one, once the
+    database has no duplicate descriptions left.
+
+    Migration 1 falls back to a non-unique index when there are duplicates,
+    and user_version records the migration as done either way, so this is
+    checked on every migrate instead of being a migration.
+
+    Args:
+        con (sqlite3.Connection): The database connection, not in a
+        transaction.
+    Returns:
+        bool: True if the description index is unique.
+    """
+    row = con.execute(
+        "SELECT sql FROM sqlite_master"
+        " WHERE type = 'index' AND name = 'idx_reminders_description'"
+    ).fetchone()
+    if row is None:
+        return False
+    if "UNIQUE" in row[0].upper():
+        return True
+    duplicates = con.execute("""
+        SELECT COUNT(*) FROM (
+            SELECT description FROM reminders
+            WHERE description IS NOT NULL
+            GROUP BY description HAVING COUNT(*) > 1)
+    """).fetchone()[0]
+    if duplicates:
+        logger.warning(
+            f"{duplicates} reminder descriptions are used more than once; "
+            "the description index stays non-unique until they are removed."
+        )
+        return False
+    con.execute("BEGIN")
+    try:
+        con.execute("DROP INDEX idx_reminders_description")
+        con.execute(
+            "CREATE UNIQUE INDEX idx_reminders_description"
+            " ON reminders(description)"
+        )
+        con.commit()
+    except BaseException:
+        con.rollback()
+        raise
+    logger.info("The reminder description index is now unique.")
+    return True
+
+
+def schema_version(con: sqlite3.Connection) -> int:
+    """
+    Returns the schema version recorded in the database.
+    """
+    return con.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(con: sqlite3.Connection) -> int:
+    """
+    Brings the database schema up to date.
+
+    Each pending migration runs in its own transaction together with the
+    update of PRAGMA user_version, so an interrupted migration is rolled back
+    and run again next time. Afterwards a non-unique description index is
+    made unique if the duplicates that prevented it are gone.
+
+    Args:
+        con (sqlite3.Connection): The database connection. The user and
+        reminders tables must already exist.
+    Returns:
+        int: The schema version of the database.
+    """
+    version = schema_version(con)
+    if con.in_transaction:
+        con.commit()
+    for number, migration in enumerate(MIGRATIONS[version:], version + 1):
+        con.execute("BEGIN")
+        try:
+            migration(con)
+            con.execute(f"PRAGMA user_version = {number}")
+            con.commit()
+        except BaseException:
+            con.rollback()
+            raise
+        logger.info(f"Database migrated to schema version {number}.")
+        version = number
+    if version >= 1:
+        make_description_index_unique(con)
+    return version
+
+
+def create_tables(con: sqlite3.Connection) -> None:
+    """
+    Creates the user and reminders tables of schema version 0, if they do
+    not exist.
+    """
+    # The user table stores the phone number and notification preferences.
+    con.execute(CREATE_USER_TABLE)
+    con.execute(CREATE_REMINDERS_TABLE)
+
+
+def create_schema(con: sqlite3.Connection) -> int:
+    """
+    Creates the tables, applies any pending migrations and creates the
+    full-text search table, if FTS5 is available.
+
+    Args:
+        con (sqlite3.Connection): The database connection.
+    Returns:
+        int: The schema version of the database.
+    """
+    create_tables(con)
+    version = migrate(con)
+    create_fts(con)
+    return version
@@ -1,97 +1,415 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import sqlite3
+from datetime import date
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from loguru import logger
 
+from business import get_store
 from classes import InfoMsgBox
+from constants import FULL_TEXT_SEARCH
+from db_manager import get_connection
+from full_text import fts_enabled, search_fts
+from reminder_store import ReminderStore, sort_key
 
 if TYPE_CHECKING:
     import tkinter as tk
-    from tkinter import ttk
 
+    from models import Reminder
 
-def search_treeview(tree: ttk.Treeview, search_query: str) -> Optional[list]:
+
+class SearchIndex:
+    """
+    Lowercase token and n-gram index over the text of the reminders.
+
+    The indexed text of a reminder is the text of its treeview row. Each
+    reminder is listed under every token (whitespace-separated word) and every
+    n-gram of its text. A query is answered from the postings of its n-grams,
+    or of the tokens containing it if it is shorter than an n-gram, and the
+    candidates are then checked with a substring test, so results match a
+    plain substring search. The index subscribes to the ReminderStore and is
+    kept up to date as reminders are added, updated and deleted.
+    """
+
+    NGRAM = 3
+
+    def __init__(self, reminders: Iterable[Reminder] = ()):
+        self.reminders_loaded(reminders)
+
+    def reminders_loaded(self, reminders: Iterable[Reminder]) -> None:
+        """
+        Rebuilds the index from the given reminders.
+        """
+        self._text: Dict[int, str] = {}
+        self._keys: Dict[int, Tuple[str, int]] = {}
+        self._tokens: Dict[str, Set[int]] = {}
+        self._grams: Dict[str, Set[int]] = {}
+        for reminder in reminders:
+            self.reminder_added(reminder)
+
+    def reminder_added(self, reminder: Reminder) -> None:
+        """
+        Adds a reminder to the index.
+        """
+        text = row_text(reminder)
+        self._text[reminder.id] = text
+        self._keys[reminder.id] = sort_key(reminder)
+        for token in set(text.split()):
+            self._tokens.setdefault(token, set()).add(reminder.id)
+        for gram in self._ngrams(text):
+            self._grams.setdefault(gram, set()).add(reminder.id)
+
+    def reminder_removed(self, reminder: Reminder) -> None:
+        """
+        Removes a reminder from the index.
+        """
+        text = self._text.pop(reminder.id, None)
+        if text is None:
+            return
+        del self._keys[reminder.id]
+        for token in set(text.split()):
+            self._discard(self._tokens, token, reminder.id)
+        for gram in self._ngrams(text):
+            self._discard(self._grams, gram, reminder.id)
+
+    def search(self, query: str, since: Optional[date] = None) -> List[int]:
+        """
+        Finds the reminders whose text contains the query.
+
+        Args:
+            query (str): The search query, matched case-insensitively.
+            since (Optional[date]): If given, only reminders due on or after
+            this date are returned, as in the pending view.
+        Returns:
+            List[int]: The ids of the matching reminders, in treeview order.
+        """
+        query = query.lower()
+        if not query:
+            return []
+        if len(query) >= self.NGRAM:
+            grams = sorted(
+                self._ngrams(query),
+                key=lambda g: len(self._grams.get(g, ())),
+            )
+            candidates = set(self._grams.get(grams[0], ()))
+            for gram in grams[1:]:
+                if not candidates:
+                    break
+                candidates &= self._grams.get(gram, set())
+        elif not any(c.isspace() for c in query):
+            # A short query without whitespace can only match within a token.
+            candidates = set()
+            for token, ids in self._tokens.items():
+                if query in token:
+                    candidates |= ids
+        else:
+            candidates = set(self._text)
+        matches = [i for i in candidates if query in self._text[i]]
+        if since is not None:
+            cutoff = since.isoformat()
+            matches = [i for i in matches if self._keys[i][0] >= cutoff]
+        matches.sort(key=self._keys.__getitem__)
+        return matches
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._keys
+
+    def _ngrams(self, text: str) -> Set[str]:
+        n = self.NGRAM
+        return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+    @staticmethod
+    def _discard(postings: Dict[str, Set[int]], key: str, id: int) -> None:
+        ids = postings.get(key)
+        if ids is not None:
+            ids.discard(id)
+            if not ids:
+                del postings[key]
+
+
+def row_text(reminder: Reminder) -> str:
     """
-    Searches the Treeview for items matching the search query.
+    Returns the lowercase text of a reminder's treeview row, for searching.
+    """
+    return " ".join("" if v is None else str(v) for v in reminder.row).lower()
+
+
+def get_search_index(self) -> SearchIndex:
+    """
+    Returns the app's search index, building it from the store on first use.
+    """
+    index = getattr(self, "search_index", None)
+    if index is None:
+        store = get_store(self)
+        index = self.search_index = SearchIndex(store.all())
+        store.subscribe(index)
+    return index
+
+
+def full_text_search(query: str, since: Optional[date] = None) -> List[int]:
+    """
+    Runs a ranked full-text query against the FTS5 table.
+
+    Returns an empty list if the query fails, so that the caller falls back
+    to the in-memory substring search.
+    """
+    try:
+        return search_fts(get_connection(), query, since)
+    except sqlite3.Error as e:
+        logger.error(f"Full-text search error: {e}.")
+        return []
+
+
+def get_full_text_search(self) -> Optional[Callable]:
+    """
+    Returns full_text_search if the database has a full-text table, or None.
+    """
+    if not FULL_TEXT_SEARCH:
+        return None
+    try:
+        enabled = fts_enabled(get_connection())
+    except sqlite3.Error as e:
+        logger.error(f"Full-text search error: {e}.")
+        enabled = False
+    return full_text_search if enabled else None
+
+
+def find_matches(
+    index: SearchIndex,
+    full_text: Optional[Callable],
+    query: str,
+    since: Optional[date] = None,
+) -> List[int]:
+    """
+    Finds the reminders matching a query.
+
+    If full_text is given, its matches come first, best match first; they
+    also find the words of a query in any order. They are followed by the
+    other substring matches of the index, anywhere in the row text, in
+    treeview order.
+
+    Args:
+        index (SearchIndex): The app's search index.
+        full_text (Optional[Callable]): full_text_search, or None.
+        query (str): The search query.
+        since (Optional[date]): If given, only reminders due on or after this
+        date are returned.
+    Returns:
+        List[int]: The ids of the matching reminders.
+    """
+    ids = index.search(query, since)
+    if full_text is None:
+        return ids
+    # Full-text results can lag behind the store; only known ids are kept.
+    ranked = [i for i in full_text(query, since) if i in index]
+    seen = set(ranked)
+    return ranked + [i for i in ids if i not in seen]
+
+
+def search_reminders(self, search_query: str) -> Optional[list]:
+    """
+    Searches the reminders in the current view for the search query.
 
     Args:
-        tree: The Treeview widget to search.
         search_query (str): The search query string.
 
     Returns:
-        Optional[str]: List of matching item ID's, or None if no match
-        is found.
-    """
-    query = search_query.lower()
-    matching_items = []
-    for item in tree.get_children():
-        values = tree.item(item, "values")
-        if query in str(values).lower():
-            matching_items.append(item)
+        Optional[list]: List of matching treeview item ID's in the order of
+        find_matches, or None if no match is found.
+    """
+    since = date.today() if self.view_current else None
+    ids = find_matches(
+        get_search_index(self),
+        get_full_text_search(self),
+        search_query,
+        since,
+    )
+    matching_items = [str(i) for i in ids]
     if matching_items:
         return matching_items
     return None  # Return None if no matches are found
 
 
-def get_matching_items(
-    tree: ttk.Treeview, search_var: tk.StringVar
-) -> Optional[list]:
+class SearchSession:
     """
-    Gets the list of items in a tree matching a search term.
+    The state of stepping through the matches of a search.
 
-    Args:
-        tree (ttk.Treeview): The tree to be searched.
-        search_var (tk.StringVar): The search term.
-    Returns:
-        Optional[list]: The list of items in the tree matching the search term.
+    Holds the query, the normalized query used for matching, the list of
+    matching treeview items and the position of the selected match. The match
+    list is rebuilt only when the query, the view or the reminders change, so
+    stepping to the next or previous match is O(1).
+
+    Matches are found by find_matches: the full-text matches if full_text is
+    given, best match first, then the other substring matches of the index.
     """
-    search_query = search_var.get()
-    return search_treeview(tree, search_query)
 
+    def __init__(
+        self,
+        index: SearchIndex,
+        store: ReminderStore,
+        full_text: Optional[Callable] = None,
+    ):
+        self.index = index
+        self.store = store
+        self.full_text = full_text
+        self.query: Optional[str] = None
+        self.matcher = ""
+        self.matches: List[str] = []
+        self.position = -1
+        self._key: Optional[tuple] = None
 
-def next_found(self, search_var: tk.StringVar) -> Any:
+    def next(self, query: str, view_current: bool) -> Optional[str]:
+        """
+        Returns the next matching item, wrapping to the first after the last.
+        """
+        return self._step(query, view_current, 1)
+
+    def previous(self, query: str, view_current: bool) -> Optional[str]:
+        """
+        Returns the previous matching item, wrapping to the last after the
+        first.
+        """
+        return self._step(query, view_current, -1)
+
+    def reset(self) -> None:
+        """
+        Forgets the query and matches.
+        """
+        self.query = None
+        self.matcher = ""
+        self.matches = []
+        self.position = -1
+        self._key = None
+
+    def _step(
+        self, query: str, view_current: bool, step: int
+    ) -> Optional[str]:
+        self._update(query, view_current)
+        if not self.matches:
+            return None
+        if self.position < 0:
+            self.position = 0 if step > 0 else len(self.matches) - 1
+        else:
+            self.position = (self.position + step) % len(self.matches)
+        return self.matches[self.position]
+
+    def _update(self, query: str, view_current: bool) -> None:
+        # The pending view depends on today's date as well as on the data.
+        since = date.today() if view_current else None
+        key = (query, since, view_current, self.store.version)
+        if key == self._key:
+            return
+        current = self.matches[self.position] if self.position >= 0 else None
+        if query != self.query:
+            # Start again from the first match for a new query.
+            current = None
+            self.query = query
+            self.matcher = query.lower()
+        ids = find_matches(self.index, self.full_text, self.matcher, since)
+        self.matches = [str(i) for i in ids]
+        # Keep stepping from the same item if it still matches.
+        self.position = (
+            self.matches.index(current) if current in self.matches else -1
+        )
+        self._key = key
+
+
+def get_search_session(self) -> SearchSession:
     """
-    Selects the next item in a list of items from a tree matching a search term
+    Returns the app's search session, creating it on first use.
+    """
+    session = getattr(self, "search_session", None)
+    if session is None:
+        session = self.search_session = SearchSession(
+            get_search_index(self),
+            get_store(self),
+            get_full_text_search(self),
+        )
+    return session
+
+
+def reveal_item(self, item: str) -> Any:
+    """
+    Selects a treeview item and scrolls it into view.
+
+    If the treeview is showing a window of a long list, the window is moved
+    to the item first.
+    """
+    virtual_rows = getattr(self, "virtual_rows", None)
+    if virtual_rows is not None:
+        virtual_rows.see(item)
+    self.tree.selection_set(item)
+    self.tree.see(item)
+
+
+def find_item(self, search_var: tk.StringVar, step: int) -> Any:
+    """
+    Selects the next or previous item matching a search term.
 
     Args:
         search_var (tk.StringVar): The search term used to select the list of
         matching items.
+        step (int): 1 to select the next match, -1 to select the previous one.
     Returns:
         None
-
     """
     # If search field is empty, abort search and display message .
     if not search_var.get():
         InfoMsgBox(self, "Search", "Please enter a search term.")
         return
-    matching_items = get_matching_items(self.tree, search_var)
-    if matching_items:
-        # Sequential selection of found items using the find_next button.
-        try:
-            matching_item = matching_items[next_found.counter]  # type:ignore
-            self.tree.selection_set(matching_item)
-            self.tree.see(matching_item)
-            # Increment counter by one to move to next reminder. Reset counter
-            # to start over after the last reminder is selected.
-            next_found.counter = (  # type:ignore
-                0
-                if next_found.counter == len(matching_items) - 1  # type:ignore
-                else next_found.counter + 1  # type:ignore
-            )
-        except Exception as e:
-            logger.error(
-                f"An error occurred while selecting matching items: {e}."
-            )
-            InfoMsgBox(
-                self,
-                "Error",
-                "An error occurred while selecting matching items.",
-            )
-            return
+    session = get_search_session(self)
+    if step > 0:
+        matching_item = session.next(search_var.get(), self.view_current)
     else:
+        matching_item = session.previous(search_var.get(), self.view_current)
+    if matching_item is None:
         # Optionally, show a message if no match is found
         InfoMsgBox(self, "Search", "No matching item found.")
+        return
+    try:
+        reveal_item(self, matching_item)
+    except Exception as e:
+        logger.error(f"An error occurred while selecting matching items: {e}.")
+        InfoMsgBox(
+            self,
+            "Error",
+            "An error occurred while selecting matching items.",
+        )
+
+
+def next_found(self, search_var: tk.StringVar) -> Any:
+    """
+    Selects the next item in a list of items from a tree matching a search term
 
+    Args:
+        search_var (tk.StringVar): The search term used to select the list of
+        matching items.
+    Returns:
+        None
 
-next_found.counter = 0  # type:ignore
+    """
+    find_item(self, search_var, 1)
+
+
+def previous_found(self, search_var: tk.StringVar) -> Any:
+    """
+    Selects the previous item in a list of items matching a search term.
+
+    Args:
+        search_var (tk.StringVar): The search term used to select the list of
+        matching items.
+    Returns:
+        None
+    """
+    find_item(self, search_var, -1)
@@ -1,136 +1,246 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, Tuple  # noqa: F401
+from concurrent.futures import Future
+from typing import (  # noqa: F401
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Optional,
+    Tuple,
+)
 
 if TYPE_CHECKING:
-    import sqlite3
-
-import datetime
-import os.path
-import pickle
+    from models import Reminder
+    from preferences import UserPreferences
 
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 from loguru import logger
 
 from business import (
-    fetch_reminders,
-    get_con,
+    get_executor,
+    get_store,
     get_user_data,
-    save_database_item,
+    request_refresh,
     save_prefs,
-    update_database_item,
 )
-from classes import InfoMsgBox, OkMsgBox
+from classes import InfoMsgBox
+from reminder_store import (
+    ReminderStore,
+    delete_reminder,
+    insert_reminder,
+    select_reminders,
+    update_reminder,
+)
+
 
-SCOPES = ["https://www.googleapis.com/auth/calendar"]
+def _run_async(
+    self,
+    job: Callable,
+    apply: Callable[[Any], Any],
+    error: str,
+    callback: Optional[Callable[[Any], Any]],
+    failed: Any,
+) -> Future:
+    """
+    Runs a job on the database executor and handles its result on the Tk
+    main thread.
+
+    Args:
+        job (Callable): Called on the worker thread with its connection.
+        apply (Callable): Called with the job's result on the Tk main thread;
+        its return value is passed to callback.
+        error (str): The message shown if the job fails.
+        callback (Callable): If given, called on the Tk main thread with the
+        value from apply, or with failed if the job fails.
+        failed (Any): The value passed to callback if the job fails.
+    Returns:
+        Future: The future of the job.
+    """
+
+    def done(future: Future) -> None:
+        try:
+            result = apply(future.result())
+        except Exception as e:
+            logger.error(f"{error} {e}")
+            InfoMsgBox(self, "Database Error", error)
+            result = failed
+        if callback is not None:
+            callback(result)
+
+    return get_executor(self).submit(job, done)
 
 
 class ReminderService:
     @staticmethod
-    def get_reminders(self, view_current: bool) -> Optional[sqlite3.Cursor]:  # noqa: PLW0211
+    def get_reminders(  # noqa: PLW0211
+        self, view_current: bool
+    ) -> Optional[Tuple[Reminder, ...]]:
         """
-        Fetch reminders from the database.
+        Get reminders from the reminder store.
 
         Args:
             view_current (bool): If True, fetch only pending reminders,
             otherwise, fetch all reminders.
 
         Returns:
-            Optional[sqlite3.Cursor]: List of reminders or None if an error
-            occurs.
+            Optional[Tuple[Reminder, ...]]: The reminders, or None if there
+            are none or an error occurs.
         """
         try:
-            reminders_cursor = fetch_reminders(self, view_current)
-            return reminders_cursor if reminders_cursor else None
+            reminders = get_store(self).reminders(view_current)
+            return reminders if reminders else None
         except Exception:
             logger.error("Error fetching reminders.")
             InfoMsgBox(self, "Database Error", "Error fetching reminders.")
             return None
 
     @staticmethod
-    def save_reminder(
+    def get_reminders_async(  # noqa: PLW0211
+        self,
+        view_current: bool,
+        callback: Optional[Callable[[Any], Any]] = None,
+    ) -> Future:
+        """
+        Reload the reminder store from the database without blocking the UI.
+
+        The reminders are read on the database worker thread; the store is
+        loaded on the Tk main thread.
+
+        Args:
+            view_current (bool): If True, pass only pending reminders to the
+            callback, otherwise, pass all reminders.
+            callback (Callable): Called on the Tk main thread with the
+            reminders, or None if there are none or an error occurs.
+
+        Returns:
+            Future: The future of the database read.
+        """
+
+        def apply(rows: Tuple[Reminder, ...]):
+            store = getattr(self, "store", None)
+            if store is None:
+                store = self.store = ReminderStore(rows)
+            else:
+                store.load(rows)
+            return store.reminders(view_current) or None
+
+        return _run_async(
+            self,
+            lambda con: select_reminders(con, False),
+            apply,
+            "Error fetching reminders.",
+            callback,
+            None,
+        )
+
+    @staticmethod
+    def save_reminder_async(
         self,  # noqa: PLW0211
         values: Tuple[str, str, str, str, str, str],
-    ) -> bool:
+        callback: Optional[Callable[[bool], Any]] = None,
+    ) -> Future:
         """
-        Save a new reminder to the database.
+        Save a new reminder to the database without blocking the UI.
 
         Args:
             values (Tuple): Reminder data to save.
+            callback (Callable): Called on the Tk main thread with True if
+            successful, False otherwise.
 
         Returns:
-            bool: True if successful, False otherwise.
+            Future: The future of the database write.
         """
-        try:
-            save_database_item(self, values)
+
+        def apply(reminder: Reminder) -> bool:
+            get_store(self).apply_saved(reminder)
+            request_refresh(self)
             return True
-        except Exception:
-            logger.error("Error saving reminders.")
-            InfoMsgBox(self, "Database Error", "Error saving reminders.")
-            return False
+
+        return _run_async(
+            self,
+            lambda con: insert_reminder(con, values),
+            apply,
+            "Error saving reminders.",
+            callback,
+            False,
+        )
 
     @staticmethod
-    def update_reminder(
+    def update_reminder_async(
         self,  # noqa: PLW0211
         values: Tuple[str, str, str, str, str, str, int],
-    ) -> bool:
+        callback: Optional[Callable[[bool], Any]] = None,
+    ) -> Future:
         """
-        Update an existing reminder in the database.
+        Update an existing reminder in the database without blocking the UI.
 
         Args:
             values (Tuple): Updated reminder data.
+            callback (Callable): Called on the Tk main thread with True if
+            successful, False otherwise.
 
         Returns:
-            bool: True if successful, False otherwise.
+            Future: The future of the database write.
         """
-        try:
-            update_database_item(self, values)
+
+        def apply(reminder: Reminder) -> bool:
+            get_store(self).apply_saved(reminder)
+            request_refresh(self)
             return True
-        except Exception:
-            logger.error("Error updating reminders.")
-            InfoMsgBox(self, "Database Error", "Error updating reminders.")
-            return False
+
+        return _run_async(
+            self,
+            lambda con: update_reminder(con, values),
+            apply,
+            "Error updating reminders.",
+            callback,
+            False,
+        )
 
     @staticmethod
-    def delete_reminder(self, reminder_id: int) -> bool:  # noqa: PLW0211
+    def delete_reminder_async(
+        self,  # noqa: PLW0211
+        reminder_id: int,
+        callback: Optional[Callable[[bool], Any]] = None,
+    ) -> Future:
         """
-        Delete a reminder from the database.
+        Delete a reminder from the database without blocking the UI.
 
         Args:
             reminder_id (int): ID of the reminder to delete.
+            callback (Callable): Called on the Tk main thread with True if
+            successful, False otherwise.
 
         Returns:
-            bool: True if successful, False otherwise.
+            Future: The future of the database write.
         """
-        try:
-            with get_con() as con:
-                cur = con.cursor()
-                cur.execute(
-                    """
-                    DELETE FROM reminders
-                    WHERE id = ?""",
-                    (reminder_id,),
-                )
-                con.commit()
+
+        def apply(_: None) -> bool:
+            get_store(self).apply_deleted(reminder_id)
+            request_refresh(self)
             return True
-        except Exception as e:
-            logger.error(f"Error deleting reminder: {e}")
-            InfoMsgBox(self, "Database Error", "Error deleting reminder.")
-            return False
+
+        return _run_async(
+            self,
+            lambda con: delete_reminder(con, reminder_id),
+            apply,
+            "Error deleting reminder.",
+            callback,
+            False,
+        )
 
     @staticmethod
-    def get_user_preferences(self) -> Optional[Tuple]:  # noqa: PLW0211
+    def get_user_preferences(  # noqa: PLW0211
+        self,
+    ) -> Optional[UserPreferences]:
         """
-        Fetch user preferences from the database.
+        Fetch user preferences, from the preferences cache once loaded.
 
         Returns:
-            Optional[Tuple]: User preferences or None if an error occurs.
+            Optional[UserPreferences]: User preferences or None if there are
+            none or an error occurs.
         """
         try:
-            user_data = get_user_data(self)
-            return user_data.fetchone() if user_data else None
+            return get_user_data(self)
         except Exception:
             logger.error("Error fetching user preferences.")
             InfoMsgBox(
@@ -191,149 +301,8 @@ class ReminderService:
         Returns:
             bool: True if successful, False otherwise.
         """
-        # Load credentials.
-        try:
-            creds = None
-
-            if os.path.exists("token.pickle"):
-                with open("token.pickle", "rb") as token:
-                    creds = pickle.load(token)
-
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                else:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        "../credentials.json", SCOPES
-                    )
-                    creds = flow.run_local_server(port=0)
-
-                with open("token.pickle", "wb") as token:
-                    pickle.dump(creds, token)
-        except Exception as e:
-            logger.error(f"Error loading credentials: {e}")
-            answer = OkMsgBox(
-                self,
-                "Credentials Error",
-                "Error loading credentials.",
-            )
-            if answer.get_response():
-                return False
-        # Create the calendar service.
-        try:
-            service = build("calendar", "v3", credentials=creds)
-        except Exception as e:
-            logger.error(f"Error creating calendar service: {e}")
-            answer = OkMsgBox(
-                self,
-                "Calendar Service Error",
-                "Error creating calendar service.",
-            )
-            if answer.get_response():
-                return False
-
-        # Fetch the reminder details from the database.
-        with get_con() as con:
-            cur = con.cursor()
-            cur.execute(
-                """
-                SELECT *
-                FROM reminders
-                WHERE id = ?
-                """,
-                (reminder_id,),
-            )
-            reminder = cur.fetchone()
+        # Import the calendar code on first use, to keep the Google API client
+        # libraries off the startup path.
+        from calendar_service import create_calendar_event
 
-        if not reminder:
-            logger.error("Reminder not found.")
-            answer = OkMsgBox(
-                self,
-                "Reminder Error",
-                "Reminder not found.",
-            )
-            if answer.get_response():
-                return False
-
-        # Check if the reminder is already scheduled.
-        start_date = reminder[4]  # reminder[4] is the date last.
-        end_datetime = datetime.datetime.strptime(
-            start_date, "%Y-%m-%d"
-        ) + datetime.timedelta(days=1)
-        end_date = end_datetime.strftime("%Y-%m-%d")
-        logger.info(f"Getting events for {start_date}")
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=f"{start_date}T00:00:00Z",
-                timeMax=f"{end_date}T00:00:00Z",
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
-        )
-        events = events_result.get("items", [])
-
-        # Check if the event already exists.
-        if events:
-            for event in events:
-                if (
-                    reminder[1] in event["summary"]
-                ):  # reminder[1] is the description.
-                    logger.info("Event already exists.")
-                    answer = OkMsgBox(
-                        self,
-                        "Create Event",
-                        "Event already exists in the calendar.",
-                    )
-                    if answer.get_response():
-                        return False
-
-        # Create the event.
-        event = {
-            "summary": f"HR: {reminder[1]}",  # reminder[1] is the description.
-            "description": reminder[6],  # reminder[6] is the note
-            "start": {
-                "date": reminder[4],  # reminder[4] is the date last.
-                "timeZone": "America/New_York",
-            },
-            "end": {
-                "date": reminder[4],  # reminder[4] is the date last.
-                "timeZone": "America/New_York",
-            },
-        }
-        # Insert the event into the calendar.
-        try:
-            created_event = (
-                service.events()
-                .insert(calendarId="primary", body=event)
-                .execute()
-            )
-            logger.info(f"Event created: {created_event['id']}")
-            answer = OkMsgBox(
-                self,
-                "Create Event",
-                "Calendar event successfully created.",
-            )
-            if answer.get_response():
-                return True
-        except Exception as e:
-            logger.error(f"Error creating event: {e}")
-            answer = OkMsgBox(
-                self,
-                "Event Creation Error",
-                "Error creating event.",
-            )
-            if answer.get_response():
-                return False
-
-        # If the event is created successfully, return True.
-        # If there is an error, return False.
-        # If an event with the same summary and date already exists, you can
-        # either skip creating the new event or update the existing event with
-        # the new details.
-        # This can be done by using the event ID to update the existing event.
-        # You can also add logic to handle conflicts, such as asking the user
-        # if they want to overwrite the existing event or create a new one with
-        # a different summary or date.
+        return create_calendar_event(self, reminder_id)
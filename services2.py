@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 import tkinter as tk
-from typing import TYPE_CHECKING, Any, Optional, Tuple  # noqa: F401
+from typing import (  # noqa: F401
+    TYPE_CHECKING,
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from classes import NotificationsPopup
 
@@ -24,57 +30,37 @@ class UIService:
             ):
                 widget.destroy()
 
-    def create_notifications_popup(self, messages: str) -> Any:
+    def create_notifications_popup(
+        self, notifications: Sequence[Tuple[str, str]]
+    ) -> Any:
         """
         Creates a Notifications Popup window.
 
         Displays a bulleted list of reminder notifications, categorized by due
-        date.
+        date. Each line is highlighted with the color of its category. Long
+        lists are cut at NOTIFICATIONS_POPUP_LIMIT lines with a summary of the
+        rest.
         Args:
-            messages (str): The string of reminder notifications to be
-            displayed.
+            notifications (Sequence[Tuple[str, str]]): The (category, text)
+            records of the reminder notifications to be displayed.
         Returns:
             None.
         """
-        if messages == "No notifications.":
-            notifications_win = NotificationsPopup(
+        if not notifications:
+            NotificationsPopup(
                 self,
                 title="Notifications",
                 message="No notifications at this time.",
                 x_offset=310,
                 y_offset=400,
             )
-        else:
-            # Remove the trailing \n from messages.
-            messages = messages[:-1]
-            # Create the window.
-            notifications_win = NotificationsPopup(
-                self,
-                title="Notifications",
-                message="",
-                x_offset=310,
-                y_offset=400,
-            )
-            # Add highlighting to messages.
-            message_list = messages.split("\n")
-            line_num = 1
-            for ndx, msg in enumerate(message_list):
-                line_num = ndx + 1  # ndx starts at 0, lin_num starts at 1
-                if msg.startswith("\u2022 Past due"):
-                    notifications_win.txt.insert("end", msg + "\n")
-                    indx_start = str(line_num) + ".0"
-                    indx_end = str(line_num + 1) + ".0"
-                    notifications_win.txt.tag_add(
-                        "yellow", indx_start, indx_end
-                    )
-                    notifications_win.txt.tag_config(
-                        "yellow", background="yellow"
-                    )
-                elif msg.startswith("\u2022 Due today"):
-                    notifications_win.txt.insert("end", msg + "\n")
-                    indx_start = str(line_num) + ".0"
-                    indx_end = str(line_num + 1) + ".0"
-                    notifications_win.txt.tag_add("lime", indx_start, indx_end)
-                    notifications_win.txt.tag_config("lime", background="lime")
-                else:
-                    notifications_win.txt.insert("end", msg + "\n")
+            return
+        # Create the window.
+        notifications_win = NotificationsPopup(
+            self,
+            title="Notifications",
+            message="",
+            x_offset=310,
+            y_offset=400,
+        )
+        notifications_win.show_notifications(notifications)
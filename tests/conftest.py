@@ -6,6 +6,8 @@ from _pytest.logging import LogCaptureFixture
 from loguru import logger
 
 from business import get_con
+from models import Reminder
+from schema import create_schema
 
 
 @pytest.fixture
@@ -30,7 +32,7 @@ def reportlog(pytestconfig):
 
 
 @pytest.fixture
-def get_cursor():
+def get_reminders():
     try:
         with get_con() as con:
             cur = con.cursor()
@@ -38,9 +40,49 @@ def get_cursor():
         logger.error(f"Error connecting to the test database: {e}, exiting.")
         sys.exit()
     try:
-        return cur.execute("""SELECT * FROM reminders""")
+        return tuple(
+            Reminder.from_row(row)
+            for row in cur.execute("""SELECT * FROM reminders""")
+        )
     except sqlite3.Error as e:
         logger.error(
             f"Error retrieving data from test database: {e}, exiting."
         )
         sys.exit()
+
+
+@pytest.fixture
+def make_db(tmp_path):
+    """
+    A factory for temporary databases built with the app's schema.
+
+    make_db(name, descriptions, schema) creates tmp_path / name with the
+    schema function, create_schema by default, inserts a reminder for each
+    description and returns the open connection. The connections are closed
+    at teardown.
+    """
+    connections = []
+
+    def make(name="home_reminders.db", descriptions=(), schema=create_schema):
+        con = sqlite3.connect(tmp_path / name)
+        schema(con)
+        with con:
+            con.executemany(
+                "INSERT INTO reminders(description) VALUES (?)",
+                [(d,) for d in descriptions],
+            )
+        connections.append(con)
+        return con
+
+    yield make
+    for con in connections:
+        con.close()
+
+
+@pytest.fixture
+def db_path(make_db, tmp_path):
+    """
+    The path of an empty temporary database with the app's schema.
+    """
+    make_db().close()
+    return str(tmp_path / "home_reminders.db")
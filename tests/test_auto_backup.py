@@ -0,0 +1,22 @@
+from business import auto_backup
+
+
+def test_auto_backup(mocker):
+    """
+    Test that a snapshot is only taken automatically in production.
+    """
+    app = mocker.Mock()
+    executor = mocker.patch("business.get_executor").return_value
+    mocker.patch("business.get_backup_store")
+
+    mocker.patch("business.DB_ENVIRONMENT", "test")
+    auto_backup(app)
+    executor.submit.assert_not_called()
+
+    mocker.patch("business.DB_ENVIRONMENT", "production")
+    auto_backup(app)
+    executor.submit.assert_called_once()
+
+    mocker.patch("business.AUTO_BACKUP", False)
+    auto_backup(app)
+    assert executor.submit.call_count == 1
@@ -0,0 +1,71 @@
+import gzip
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from backup_store import BackupStore
+
+
+@pytest.fixture
+def con(make_db):
+    """
+    A database with one reminder.
+    """
+    return make_db("live.db", ["test1"])
+
+
+def add(con, description):
+    con.execute(
+        "INSERT INTO reminders(description) VALUES (?)", (description,)
+    )
+    con.commit()
+
+
+def test_snapshots_are_deduplicated_and_pruned(con, tmp_path):
+    """
+    Test that unchanged data is not backed up again, and only the newest
+    snapshots are kept.
+    """
+    store = BackupStore(str(tmp_path / "backups"), keep=2)
+    start = datetime(2025, 6, 1, 12, 0, 0)
+    first = store.snapshot(con, now=start)
+    assert first is not None
+    with gzip.open(first.path) as f:
+        assert f.read(16) == b"SQLite format 3\x00"
+    assert store.snapshot(con, now=start + timedelta(hours=1)) is None
+
+    add(con, "test2")
+    store.snapshot(con, now=start + timedelta(hours=2))
+    add(con, "test3")
+    store.snapshot(con, now=start + timedelta(hours=3))
+    snapshots = store.snapshots()
+    assert [s.created.hour for s in snapshots] == [15, 14]
+    assert first not in snapshots
+    assert sorted(p.name for p in (tmp_path / "backups").iterdir()) == sorted(
+        s.path.rsplit("/", 1)[-1] for s in snapshots
+    )
+
+
+def test_extract_version(con, tmp_path):
+    """
+    Test that an older snapshot can be extracted, and a damaged one is not.
+    """
+    store = BackupStore(str(tmp_path / "backups"))
+    old = store.snapshot(con, now=datetime(2025, 6, 1))
+    add(con, "test2")
+    store.snapshot(con, now=datetime(2025, 6, 2))
+
+    steps = []
+    path = tmp_path / "old.db"
+    store.extract(old, path, lambda *args: steps.append(args))
+    assert steps[-1][1] == 0  # nothing remaining
+    extracted = sqlite3.connect(path)
+    rows = extracted.execute("SELECT description FROM reminders").fetchall()
+    extracted.close()
+    assert rows == [("test1",)]
+
+    with gzip.open(old.path, "wb") as f:
+        f.write(b"damaged")
+    with pytest.raises(sqlite3.DatabaseError):
+        store.extract(old, path)
@@ -1,6 +1,7 @@
 from loguru import logger  # noqa: F401
 
-from business import categorize_reminders, get_expected, get_test_reminders
+from business import categorize_reminders
+from tests.helpers import get_expected, get_test_reminders
 
 
 def test_categorize_reminder():
@@ -6,15 +6,18 @@ from loguru import logger  # noqa: F401
 
 from business import (
     categorize_reminders,
+    get_con,
+    notification_records,
+)
+from classes import NotificationsPopup
+from constants import DB_ENVIRONMENT
+from services2 import UIService
+from tests.helpers import (
     cleanup,
     copy_test_db,
     error_cleanup,
-    generate_notification_messages,
-    get_con,
     get_test_reminders,
 )
-from constants import DB_ENVIRONMENT
-from services2 import UIService
 
 
 def test_create_notifications_popup():
@@ -59,16 +62,16 @@ def test_create_notifications_popup():
             e,
             "Database error setting user preferences",
         )
-    # Get the message if there are no reminders.
-    message_no_reminders = generate_notification_messages(app, None)
-    # Get messages provided by get_reminders function.
-    message = generate_notification_messages(app, categorized_reminders)
+    # Get the notifications if there are no reminders.
+    no_notifications = notification_records(app, None)
+    # Get notifications for the test reminders.
+    notifications = notification_records(app, categorized_reminders)
 
     # Restore test database now in case there is an assertion error.
     cleanup(app, db_path, db_bak_path)
 
     # Create a notifications_popup window for no reminders.
-    UIService.create_notifications_popup(app, message_no_reminders)
+    UIService.create_notifications_popup(app, no_notifications)
 
     def check_popup(msg):
         # Confirm that the popup window meets expected crteria.
@@ -84,7 +87,7 @@ def test_create_notifications_popup():
         # There should only be one Toplevel window open.
         assert count == 1
 
-    check_popup("No notifications.\n")
+    check_popup("No notifications at this time.")
 
     # Destroy current popup.
     for popup in app.winfo_children():
@@ -92,6 +95,45 @@ def test_create_notifications_popup():
 
     # Create a notifications_popup window for messages provided by
     # get_reminders function.
-    UIService.create_notifications_popup(app, message)
+    UIService.create_notifications_popup(app, notifications)
+
+    check_popup("".join(f"{text}\n" for _, text in notifications))
+    # The past due line is highlighted.
+    popup = app.winfo_children()[0]
+    assert popup.txt.tag_ranges("past-due")
+
+
+def test_show_notifications(mocker):
+    """
+    Test that the notifications are inserted in one call, capped at limit.
+    """
+    popup = mocker.Mock()
+    notifications = [
+        ("past-due", "• Past due: test1"),
+        ("due-today", "• Due today: test2"),
+        ("due-tomorrow", "• Due tomorrow: test3"),
+    ]
+    NotificationsPopup.show_notifications(popup, notifications)
+    popup.txt.insert.assert_called_once_with(
+        "end",
+        "• Past due: test1\n",
+        ("past-due",),
+        "• Due today: test2\n",
+        ("due-today",),
+        "• Due tomorrow: test3\n",
+        ("due-tomorrow",),
+    )
+
+    popup.reset_mock()
+    NotificationsPopup.show_notifications(popup, notifications, limit=1)
+    popup.txt.insert.assert_called_once_with(
+        "end",
+        "• Past due: test1\n",
+        ("past-due",),
+        "… and 2 more\n",
+        ("summary",),
+    )
 
-    check_popup(message)
+    popup.reset_mock()
+    NotificationsPopup.show_notifications(popup, [])
+    popup.txt.insert.assert_not_called()
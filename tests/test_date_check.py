@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from business import date_check, ms_until_midnight
+from constants import DATE_CHECK_MAX_SLEEP_MS
+
+
+def test_ms_until_midnight():
+    assert ms_until_midnight(datetime(2025, 6, 10, 23, 59, 59)) == 1000
+    assert ms_until_midnight(datetime(2025, 6, 10, 0, 0)) == 86400000
+    assert ms_until_midnight(datetime(2025, 12, 31, 12, 0)) == 43200000
+
+
+def test_date_check(mocker):
+    """
+    Test that date_check updates the date and schedules a single timer.
+    """
+    app = mocker.Mock()
+    app.todays_date_var.get.return_value = "1970-01-01"
+    app.after.return_value = "after#1"
+    # No timer is pending on the first check.
+    app.date_check_id = None
+    request_refresh = mocker.patch("business.request_refresh")
+
+    date_check(app)
+    app.todays_date_var.set.assert_called_once()
+    request_refresh.assert_called_once_with(app)
+    delay = app.after.call_args[0][0]
+    assert 0 < delay <= DATE_CHECK_MAX_SLEEP_MS
+    assert app.date_check_id == "after#1"
+
+    # Checking again replaces the pending timer.
+    date_check(app)
+    app.after_cancel.assert_called_once_with("after#1")
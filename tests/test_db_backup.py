@@ -0,0 +1,83 @@
+import os
+import sqlite3
+
+import pytest
+
+from db_backup import (
+    backup_to_file,
+    copy_file,
+    quick_check,
+    replace_database,
+    validate_backup,
+)
+from schema import SCHEMA_VERSION
+
+
+def descriptions(con):
+    rows = con.execute("SELECT description FROM reminders ORDER BY id")
+    return [row[0] for row in rows]
+
+
+def test_backup_and_copy(make_db, tmp_path):
+    """
+    Test that a backup is copied in steps, checked, and valid.
+    """
+    con = make_db("live.db", [f"test{i}" for i in range(2000)])
+    bak_path = tmp_path / "db_backup.bak"
+    steps = []
+    backup_to_file(
+        con, bak_path, pages=5, progress=lambda *args: steps.append(args)
+    )
+    con.close()
+    assert len(steps) > 1
+    assert steps[-1][1] == 0  # no pages remaining
+    assert not (tmp_path / "db_backup.bak.tmp").exists()
+
+    copy_path = tmp_path / "live.db.restore"
+    copy_file(bak_path, copy_path)
+    validate_backup(copy_path)
+    con = sqlite3.connect(copy_path)
+    assert quick_check(con)
+    assert len(descriptions(con)) == 2000
+    con.close()
+
+
+def test_validate_rejects_bad_backups(make_db, tmp_path):
+    """
+    Test that missing, damaged, newer and incomplete backups are rejected.
+    """
+    with pytest.raises(FileNotFoundError):
+        copy_file(tmp_path / "missing.bak", tmp_path / "copy.db")
+    bad_path = tmp_path / "bad.bak"
+    bad_path.write_bytes(b"not a database" * 100)
+    with pytest.raises(sqlite3.DatabaseError):
+        validate_backup(bad_path)
+
+    newer = make_db("newer.db", ["test1"])
+    newer.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    newer.close()
+    with pytest.raises(sqlite3.DatabaseError, match="schema version"):
+        validate_backup(tmp_path / "newer.db")
+
+    incomplete = sqlite3.connect(tmp_path / "incomplete.db")
+    incomplete.execute("CREATE TABLE reminders(id)")
+    incomplete.close()
+    with pytest.raises(sqlite3.DatabaseError, match="user table"):
+        validate_backup(tmp_path / "incomplete.db")
+
+
+def test_replace_database(make_db, tmp_path):
+    """
+    Test that the database file is replaced and WAL leftovers are removed.
+    """
+    db_path = str(tmp_path / "live.db")
+    make_db("live.db", ["old"]).close()
+    make_db("live.db.restore", ["new"]).close()
+    for suffix in ("-wal", "-shm"):
+        (tmp_path / f"live.db{suffix}").write_bytes(b"stale")
+
+    replace_database(tmp_path / "live.db.restore", db_path)
+    assert sorted(os.listdir(tmp_path)) == ["live.db"]
+    con = sqlite3.connect(db_path)
+    assert descriptions(con) == ["new"]
+    con.close()
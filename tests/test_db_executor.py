@@ -0,0 +1,108 @@
+import sqlite3
+import threading
+
+import pytest
+
+from business import close_executor
+from db_executor import DBExecutor
+from models import Reminder
+from reminder_store import insert_reminder, select_reminders
+
+
+def test_jobs_run_on_worker(db_path):
+    """
+    Test that jobs run in order on one worker thread and return futures.
+    """
+    executor = DBExecutor(db_path=db_path, wal=False)
+    threads = []
+
+    def job(con):
+        threads.append(threading.get_ident())
+        description = f"test{len(threads)}"
+        return insert_reminder(
+            con, (description, "1", "days", "2025-01-01", "2025-01-02", "")
+        )
+
+    first = executor.submit(job)
+    second = executor.submit(job)
+    count = executor.query("SELECT COUNT(*) FROM reminders")
+    assert first.result(5).id == 1
+    assert second.result(5).id == 2
+    assert count.result(5) == [(2,)]
+    assert threads[0] == threads[1] != threading.get_ident()
+
+    rows = executor.submit(lambda con: select_reminders(con, False))
+    assert all(isinstance(r, Reminder) for r in rows.result(5))
+    executor.close(5)
+    assert not executor.running
+
+
+def test_errors_are_returned(db_path):
+    """
+    Test that a failing job sets the exception of its future and the worker
+    keeps running.
+    """
+    executor = DBExecutor(db_path=db_path, wal=False)
+    failed = executor.execute("INSERT INTO missing VALUES (1)")
+    with pytest.raises(sqlite3.OperationalError):
+        failed.result(5)
+    assert executor.execute("DELETE FROM reminders").result(5) == 0
+    executor.close(5)
+
+
+def test_callbacks_run_on_tk_thread(db_path, mocker):
+    """
+    Test that callbacks are run by the after polling, not by the worker.
+    """
+    app = mocker.Mock()
+    app.after.return_value = "after#1"
+    executor = DBExecutor(app, db_path=db_path, wal=False, poll_ms=5)
+    results = []
+    future = executor.query(
+        "SELECT 1",
+        callback=lambda f: results.append((f.result(), threading.get_ident())),
+    )
+    app.after.assert_called_once_with(5, executor._poll)
+    future.result(5)
+    assert results == []
+
+    executor._poll()
+    assert results == [([(1,)], threading.get_ident())]
+    # Nothing is pending, so polling stops.
+    assert app.after.call_count == 1
+    executor.close(5)
+
+
+def test_release(db_path):
+    """
+    Test that release closes the worker's connection and the next job opens
+    a new one.
+    """
+    executor = DBExecutor(db_path=db_path, wal=False)
+    first = executor.submit(lambda con: con).result(5)
+    executor.release().result(5)
+    assert executor._manager._con is None
+    second = executor.submit(lambda con: con).result(5)
+    assert second is not first
+    executor.close(5)
+
+
+def test_close_executor(db_path, mocker):
+    """
+    Test that closing the app's executor runs the pending callbacks and
+    cancels the polling while Tk is still alive.
+    """
+    app = mocker.Mock()
+    app.after.return_value = "after#1"
+    app.executor = DBExecutor(app, db_path=db_path, wal=False)
+    results = []
+    app.executor.query("SELECT 1", callback=lambda f: results.append(f))
+    executor = app.executor
+
+    close_executor(app)
+    assert len(results) == 1
+    app.after_cancel.assert_called_once_with("after#1")
+    assert not executor.running
+    assert app.executor is None
+    # Closing again does nothing.
+    close_executor(app)
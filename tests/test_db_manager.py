@@ -0,0 +1,39 @@
+import sqlite3
+
+from db_manager import ConnectionManager, connections_opened
+
+
+def test_connection_manager(tmp_path):
+    """
+    Test that the ConnectionManager reuses one configured connection.
+    """
+    manager = ConnectionManager(str(tmp_path / "managed.db"))
+    opened_before = connections_opened()
+
+    # Repeated requests return the same connection.
+    con = manager.connection()
+    assert isinstance(con, sqlite3.Connection)
+    assert manager.connection() is con
+    assert isinstance(manager.cursor(), sqlite3.Cursor)
+    # Only one connection was opened for all of the above.
+    assert connections_opened() == opened_before + 1
+
+    # The connection is configured for WAL with synchronous=NORMAL.
+    assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert con.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    # After closing, the next request opens a fresh connection.
+    manager.close()
+    assert manager.connection() is not con
+    assert connections_opened() == opened_before + 2
+    manager.close()
+
+
+def test_connection_manager_without_wal(tmp_path):
+    """
+    Test that WAL can be turned off, as it is for the test database.
+    """
+    manager = ConnectionManager(str(tmp_path / "rollback.db"), wal=False)
+    con = manager.connection()
+    assert con.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    manager.close()
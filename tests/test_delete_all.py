@@ -0,0 +1,38 @@
+import sqlite3
+
+from business import delete_all
+
+
+def test_delete_all(mocker):
+    """
+    Test that the reminders are deleted on the database worker and the
+    store is emptied once the delete has committed.
+    """
+    app = mocker.Mock()
+    mocker.patch(
+        "business.YesNoMsgBox"
+    ).return_value.get_response.return_value = True
+    info = mocker.patch("business.InfoMsgBox")
+    store = mocker.patch("business.get_store").return_value
+    request_refresh = mocker.patch("business.request_refresh")
+    executor = mocker.patch("business.get_executor").return_value
+
+    delete_all(app)
+    sql = executor.execute.call_args[0][0]
+    assert sql == "DELETE FROM reminders"
+    store.load.assert_not_called()
+
+    deleted = executor.execute.call_args[1]["callback"]
+    future = mocker.Mock()
+    deleted(future)
+    store.load.assert_called_once_with(())
+    request_refresh.assert_called_once_with(app)
+    assert info.call_args[0][2] == "Data has been deleted."
+
+    # A failed delete leaves the store alone.
+    future.result.side_effect = sqlite3.OperationalError("locked")
+    deleted(future)
+    assert store.load.call_count == 1
+    assert (
+        info.call_args[0][2] == "Failed to delete user data from the database."
+    )
@@ -68,7 +68,7 @@ def test_fetch_reminders():
             cur.execute("DELETE FROM reminders")
             con.commit()
             # Get function result if reminders table is empty - expect None.
-            actual_for_empty_table = fetch_reminders(app, False).fetchall()
+            actual_for_empty_table = fetch_reminders(app, False)
             # Insert values into the reminders table.
             cur.execute(
                 """
@@ -109,7 +109,7 @@ def test_fetch_reminders():
             con.commit()
             # Get function result after inserting values into the reminders
             # table.
-            actual_values = fetch_reminders(app, False).fetchall()
+            actual_values = fetch_reminders(app, False)
             logger.info(f"actual_values: {actual_values}")
     except Exception as e:
         logger.error(f"Error during database setup: {e}, skipping this test.")
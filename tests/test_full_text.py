@@ -0,0 +1,60 @@
+from datetime import date
+
+import pytest
+
+from full_text import create_fts, fts_enabled, match_expression, search_fts
+from schema import create_tables
+
+
+@pytest.fixture
+def con(make_db):
+    """
+    A database with one reminder saved before the full-text table exists.
+    """
+    con = make_db("fts.db", schema=create_tables)
+    con.execute(
+        "INSERT INTO reminders VALUES (1, 'Clean gutters', '1', 'years',"
+        " '2025-01-01', '2026-01-01', 'ladder in garage')"
+    )
+    con.commit()
+    return con
+
+
+def test_match_expression():
+    """
+    Test that words become prefix terms and quoted text a phrase.
+    """
+    assert match_expression("gut clean") == '"gut"* "clean"*'
+    assert match_expression('"in garage" lad') == '"in garage" "lad"*'
+    # FTS5 operators and stray quotes are matched as plain text.
+    assert match_expression('a"b OR') == '"a""b"* "OR"*'
+    assert match_expression("  ") == ""
+
+
+def test_full_text_search(con):
+    """
+    Test that the table is built, kept in sync and queried by rank.
+    """
+    if not create_fts(con):
+        pytest.skip("SQLite was built without FTS5")
+    assert fts_enabled(con)
+    # Rows saved before the table was created are indexed.
+    assert search_fts(con, "gutt") == [1]
+    with con:
+        con.execute(
+            "INSERT INTO reminders VALUES (2, 'Furnace filter', '3',"
+            " 'months', '2025-03-01', '2025-06-01', 'gutter gutter gutter')"
+        )
+    # The reminder with more occurrences of the term ranks first.
+    assert search_fts(con, "gutter") == [2, 1]
+    assert search_fts(con, '"in garage"') == [1]
+    assert search_fts(con, '"garage in"') == []
+    assert search_fts(con, "gutter", since=date(2025, 7, 1)) == [1]
+    with con:
+        con.execute("UPDATE reminders SET note = '' WHERE id = 2")
+    assert search_fts(con, "gutter") == [1]
+    with con:
+        con.execute("DELETE FROM reminders WHERE id = 1")
+    assert search_fts(con, "gutter") == []
+    # Creating the table again is harmless.
+    assert create_fts(con)
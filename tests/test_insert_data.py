@@ -8,7 +8,7 @@ from business import insert_data
 from ui_logic import create_tree_widget
 
 
-def test_insert_data(get_cursor):
+def test_insert_data(get_reminders):
     """
     Test the insert_data function.
     """
@@ -56,8 +56,8 @@ def test_insert_data(get_cursor):
     # Check that treeview is empty at this stage.
     assert len(app.tree.get_children()) == 0
 
-    # Insert get_cursor data into the mock treeview.
-    insert_data(app, get_cursor)
+    # Insert get_reminders data into the mock treeview.
+    insert_data(app, get_reminders)
 
     # Verify the expected behavior of the insert_data function:
 
@@ -70,8 +70,8 @@ def test_insert_data(get_cursor):
     # Check if the first item inserted in the test database has the expected
     # background color (highlighting).
     first_inserted_item = app.tree.item(app.tree.get_children()[0])
-    # Item tags are named as the database index of the item.
-    tag_name = first_inserted_item["values"][0]
+    # Items are tagged with a shared status tag.
+    tag_name = first_inserted_item["tags"][0]
     logger.info(f"tag_name: {tag_name}")
     # Query the tag configuration to get the background color.
     logger.info(f"tag color: {app.tree.tag_configure(tag_name, 'background')}")
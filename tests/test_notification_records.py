@@ -6,14 +6,16 @@ from loguru import logger  # noqa: F401
 
 from business import (
     categorize_reminders,
+    get_con,
+    notification_records,
+)
+from constants import DB_ENVIRONMENT
+from tests.helpers import (
     cleanup,
     copy_test_db,
     error_cleanup,
-    generate_notification_messages,
-    get_con,
     get_test_reminders,
 )
-from constants import DB_ENVIRONMENT
 
 
 @pytest.mark.parametrize(
@@ -48,7 +50,7 @@ from constants import DB_ENVIRONMENT
         ),
     ],
 )
-def test_generate_notification_messages(user_preferences, expected):
+def test_notification_records(user_preferences, expected):
     # Skip this test if not in test environment.
     if DB_ENVIRONMENT != "test":
         pytest.skip("Skipping this test - not in test environment.")
@@ -89,16 +91,17 @@ def test_generate_notification_messages(user_preferences, expected):
             e,
             "Database error setting user preferences",
         )
-    # Get message if there are no reminders.
-    message_no_reminders = generate_notification_messages(app, None)
-    # Get messages provided by get_reminders function.
-    message = generate_notification_messages(app, categorized_reminders)
+    # Get records if there are no reminders.
+    records_no_reminders = notification_records(app, None)
+    # Get the records for the categorized reminders.
+    records = notification_records(app, categorized_reminders)
+    message = "".join(f"{text}\n" for _, text in records)
 
     # Restore test database now in case there is an assertion error.
     cleanup(app, db_path, db_bak_path)
     app.destroy()
 
-    # Check the message if there are no categorized reminders.
-    assert message_no_reminders == "No notifications.\n"
+    # Check that there are no records if there are no categorized reminders.
+    assert records_no_reminders == []
     # Check the message against expected for the given user preferences.
     assert message == expected
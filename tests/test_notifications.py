@@ -0,0 +1,156 @@
+from datetime import date, timedelta
+
+import pytest
+
+from constants import NOTIFICATION_LEAD_DAYS, NOTIFICATION_MAX_SLEEP_MS
+from models import Reminder
+from notifications import (
+    LEAD_TIME_CATEGORIES,
+    NO_DATE,
+    NOTIFICATION_CATEGORIES,
+    NotificationScheduler,
+    build_notifications,
+    categorize,
+    due_ordinals,
+    next_threshold,
+)
+from preferences import UserPreferences
+from reminder_store import ReminderStore
+
+
+@pytest.fixture
+def store():
+    """
+    An empty ReminderStore.
+    """
+    return ReminderStore()
+
+
+def test_due_ordinals():
+    """
+    Test that due dates of Reminders and row tuples become ordinals.
+    """
+    reminders = [
+        Reminder(1, "test1", "1", "days", "2025-01-01", "2025-01-02", ""),
+        (2, "test2", "1", "days", "2025-01-01", "2025-01-03", ""),
+        (3, "test3", "1", "days", "2025-01-01", "", ""),
+        (4, "test4", "1", "days", "2025-01-01", "invalid", ""),
+    ]
+    assert due_ordinals(reminders).tolist() == [
+        date(2025, 1, 2).toordinal(),
+        date(2025, 1, 3).toordinal(),
+        NO_DATE,
+        NO_DATE,
+    ]
+    assert due_ordinals([]).tolist() == []
+
+
+def test_categorize():
+    """
+    Test that due dates are bucketed against the given lead times.
+    """
+    today = date(2025, 6, 10)
+    ordinals = due_ordinals(
+        [
+            (1, "", "", "", "", "2025-06-09", ""),  # past due
+            (2, "", "", "", "", "2025-06-10", ""),  # today
+            (3, "", "", "", "", "2025-06-17", ""),  # in 7 days
+            (4, "", "", "", "", "", ""),  # no date
+            (5, "", "", "", "", "2025-06-11", ""),  # tomorrow
+            (6, "", "", "", "", "2025-01-01", ""),  # past due
+        ]
+    )
+    past_due, buckets = categorize(ordinals, today=today)
+    assert past_due.tolist() == [0, 5]
+    assert [b.tolist() for b in buckets] == [[1], [4], [2]]
+    # Custom lead times.
+    _, buckets = categorize(ordinals, lead_days=(3, 7), today=today)
+    assert [b.tolist() for b in buckets] == [[], [2]]
+
+
+def test_next_threshold():
+    """
+    Test that the next category change is found from the due dates.
+    """
+    today = date(2025, 6, 10)
+
+    def ordinals(*days):
+        return [date(2025, 6, d).toordinal() for d in days]
+
+    # Due on the 20th: enters the 7 day category on the 13th.
+    assert next_threshold(ordinals(20), today=today) == date(2025, 6, 13)
+    # Due on the 12th: due tomorrow on the 11th.
+    assert next_threshold(ordinals(12, 20), today=today) == date(2025, 6, 11)
+    # Due today: past due tomorrow.
+    assert next_threshold(ordinals(1, 10), today=today) == date(2025, 6, 11)
+    # Past due reminders change no more.
+    assert next_threshold(ordinals(1, 5), today=today) is None
+    assert next_threshold([], today=today) is None
+
+
+def test_notification_scheduler(store, mocker):
+    """
+    Test that the scheduler sleeps until the next threshold and is
+    rescheduled when the reminders change.
+    """
+    app = mocker.Mock()
+    app.after.return_value = "after#1"
+    notify = mocker.Mock()
+    scheduler = NotificationScheduler(app, store, notify)
+    scheduler.start()
+    tomorrow = date.today() + timedelta(days=1)
+    assert scheduler.next_date is None
+    assert app.after.call_args[0][0] == NOTIFICATION_MAX_SLEEP_MS
+
+    # Saving a reminder due tomorrow schedules a check for the midnight it
+    # becomes due.
+    store.apply_saved(
+        Reminder(1, "test", "1", "days", "", tomorrow.isoformat(), "")
+    )
+    app.after_idle.assert_called_once()
+    app.after_idle.call_args[0][0]()
+    assert scheduler.next_date == tomorrow
+    assert 0 < app.after.call_args[0][0] <= NOTIFICATION_MAX_SLEEP_MS
+
+    # Waking before the threshold only reschedules.
+    wake = app.after.call_args[0][1]
+    wake()
+    notify.assert_not_called()
+    # Waking after the threshold runs the notifications check.
+    scheduler.next_date = date.today()
+    wake()
+    notify.assert_called_once()
+    scheduler.stop()
+    app.after_cancel.assert_called_with("after#1")
+
+
+def test_build_notifications():
+    """
+    Test that records are built for the categories opted for.
+    """
+    categorized = (
+        [Reminder(1, "test1", "1", "days", "", "2025-06-09", "")],
+        [(2, "test2", "1", "days", "", "2025-06-10", "")],
+        [],
+        [Reminder(4, "test4", "1", "days", "", "2025-06-17", "")],
+    )
+    preferences = UserPreferences("1234567890", 1, 1, 0, "")
+    assert build_notifications(categorized, preferences) == [
+        ("past-due", "• Past due: test1"),
+        ("due-in-7-days", "• Due in 7 days: test4"),
+    ]
+    assert build_notifications(categorized, None) == []
+
+
+def test_categories_follow_lead_days():
+    """
+    Test that there is one notification category per lead time, and that
+    categorized reminders must match the categories.
+    """
+    assert [c[0] for c in NOTIFICATION_CATEGORIES] == [
+        "past-due",
+        *(LEAD_TIME_CATEGORIES[d][0] for d in NOTIFICATION_LEAD_DAYS),
+    ]
+    preferences = UserPreferences("1234567890", 1, 1, 1, "1970-01-01")
+    with pytest.raises(ValueError):
+        build_notifications(([], []), preferences)
@@ -0,0 +1,47 @@
+import sqlite3
+
+import pytest
+
+from preferences import PreferencesCache, UserPreferences
+
+
+@pytest.fixture
+def con(make_db):
+    return make_db("prefs.db")
+
+
+def test_preferences_cache(con):
+    """
+    Test that the preferences are read once until invalidated.
+    """
+    queries = []
+    con.set_trace_callback(queries.append)
+    cache = PreferencesCache(connection=lambda: con)
+
+    # An empty user table is cached too.
+    assert cache.get() is None
+    assert cache.get() is None
+    assert len(queries) == 1
+
+    con.execute("INSERT INTO user VALUES ('1234567890', 1, 0, 1, '')")
+    cache.invalidate()
+    preferences = cache.get()
+    assert preferences == UserPreferences("1234567890", 1, 0, 1, "")
+    assert preferences.opted_in
+    assert preferences.week_before == 1
+    assert preferences.day_before == 0
+    assert cache.get() is preferences
+    # Still usable as the row tuple.
+    assert preferences[0] == "1234567890"
+
+
+def test_preferences_cache_error(con):
+    """
+    Test that a failed read raises and is not cached.
+    """
+    cache = PreferencesCache(connection=lambda: con)
+    con.execute("ALTER TABLE user RENAME TO old_user")
+    with pytest.raises(sqlite3.Error):
+        cache.get()
+    con.execute("ALTER TABLE old_user RENAME TO user")
+    assert cache.get() is None
@@ -0,0 +1,47 @@
+import tkinter as tk
+
+from business import insert_data, reconcile_data
+from models import Reminder
+from ui_logic import create_tree_widget
+
+
+def test_reconcile_data():
+    """
+    Test that reconcile_data changes only the rows that need it.
+    """
+    # Mock the app and create treeview widget.
+    app = tk.Tk()
+    app.tree = create_tree_widget(app)
+    reminders = [
+        Reminder(1, "test1", "1", "days", "2025-01-01", "2025-01-02", ""),
+        Reminder(2, "test2", "1", "days", "2025-01-02", "2025-01-03", ""),
+        Reminder(3, "test3", "1", "days", "2025-01-03", "2025-01-04", ""),
+    ]
+    insert_data(app, reminders)
+    app.tree.selection_set("2")
+
+    # Count the rows inserted by reconcile_data.
+    inserted = []
+    original_insert = app.tree.insert
+
+    def counting_insert(*args, **kwargs):
+        inserted.append(kwargs["iid"])
+        return original_insert(*args, **kwargs)
+
+    app.tree.insert = counting_insert
+
+    # Remove test1, move test2 to the end and add test4.
+    updated = [
+        reminders[2],
+        Reminder(4, "test4", "1", "days", "2025-01-04", "2025-01-05", ""),
+        Reminder(2, "test2b", "1", "days", "2025-01-05", "2025-01-06", ""),
+    ]
+    reconcile_data(app, updated)
+
+    # Rows are in the new order, and only the new row was inserted.
+    assert app.tree.get_children() == ("3", "4", "2")
+    assert inserted == ["4"]
+    # The changed row shows its new values and is still selected.
+    assert app.tree.item("2")["values"][1] == "test2b"
+    assert app.tree.selection() == ("2",)
+    app.destroy()
@@ -0,0 +1,36 @@
+from datetime import date
+
+import pytest
+
+from models import Reminder
+
+
+def test_reminder():
+    """
+    Test the Reminder record.
+    """
+    row = (1, "test1", "1", "weeks", "2025-06-01", "2025-06-08", "note")
+    reminder = Reminder.from_row(row)
+
+    # Fields are named and date_next is parsed once.
+    assert reminder.id == 1
+    assert reminder.description == "test1"
+    assert reminder.due == date(2025, 6, 8)
+    # The record behaves like the row it was created from.
+    assert reminder == row
+    assert reminder.row == row
+    assert tuple(reminder) == row
+    assert reminder[5] == "2025-06-08"
+    assert len(reminder) == 7
+    # Records are immutable.
+    with pytest.raises(AttributeError):
+        reminder.description = "changed"
+
+
+@pytest.mark.parametrize("date_next", [None, "", "25-06-08", "invalid"])
+def test_reminder_without_valid_date(date_next):
+    """
+    Test that a missing or malformed date_next leaves due unset.
+    """
+    reminder = Reminder(1, "test1", "1", "weeks", "2025-06-01", date_next, "")
+    assert reminder.due is None
@@ -0,0 +1,105 @@
+from datetime import date
+
+import pytest
+
+from models import Reminder
+from reminder_store import (
+    ReminderStore,
+    delete_reminder,
+    insert_reminder,
+    select_reminders,
+    update_reminder,
+)
+
+ROWS = [
+    (1, "test1", "1", "weeks", "2025-06-01", "2025-06-08", "note1"),
+    (2, "test2", "1", "days", "2025-06-01", "2025-06-02", "note2"),
+]
+
+
+@pytest.fixture
+def con(make_db):
+    """
+    A temporary database with two reminders.
+    """
+    con = make_db("store.db")
+    con.executemany("INSERT INTO reminders VALUES (?, ?, ?, ?, ?, ?, ?)", ROWS)
+    con.commit()
+    return con
+
+
+@pytest.fixture
+def store():
+    """
+    A ReminderStore with the two reminders of the database.
+    """
+    return ReminderStore(Reminder.from_row(r) for r in ROWS)
+
+
+def db_rows(con):
+    return con.execute("SELECT * FROM reminders ORDER BY id").fetchall()
+
+
+def test_reads(store):
+    """
+    Test that reads are served in date_next order from memory.
+    """
+    assert len(store) == 2
+    assert [r.id for r in store.all()] == [2, 1]
+    assert store.get(1).description == "test1"
+    assert store.find_by_description("test2")[0].id == 2
+    assert store.find_by_description("missing") == []
+    assert store.find_duplicate("test1") == 1
+    assert store.find_duplicate("test1", exclude_id=1) is None
+    assert store.find_duplicate("missing") is None
+    assert [r.id for r in store.pending(date(2025, 6, 5))] == [1]
+    assert store.pending(date(2025, 6, 9)) == ()
+    assert [r.id for r in store.due_within(0, date(2025, 6, 2))] == [2]
+    assert [r.id for r in store.due_within(6, date(2025, 6, 2))] == [2, 1]
+    assert store.due_within(7, date(2025, 5, 1)) == ()
+
+
+def test_pending_matches_query(store, con):
+    """
+    Test that the store and the database agree on what is pending for the
+    same date, including a reminder due on that date.
+    """
+    for day in (date(2025, 6, 2), date(2025, 6, 5), date(2025, 6, 8)):
+        assert store.pending(day) == select_reminders(con, True, day)
+
+
+def test_apply_writes(store, con):
+    """
+    Test that writes to the database are applied to the store.
+    """
+    version = store.version
+
+    new = insert_reminder(
+        con, ("test3", "1", "days", "2025-05-01", "2025-05-02", "note3")
+    )
+    assert new.id == 3
+    store.apply_saved(new)
+    assert [r.id for r in store.all()] == [3, 2, 1]
+    assert len(db_rows(con)) == 3
+
+    updated = update_reminder(
+        con, ("test3b", "1", "days", "2025-06-09", "2025-06-10", "note3", 3)
+    )
+    store.apply_saved(updated)
+    assert [r.id for r in store.all()] == [2, 1, 3]
+    assert store.find_by_description("test3") == []
+    assert store.get(3).description == "test3b"
+    assert db_rows(con)[2][1] == "test3b"
+
+    delete_reminder(con, 2)
+    store.apply_deleted(2)
+    assert 2 not in store
+    assert [r[0] for r in db_rows(con)] == [1, 3]
+    # Deleting a reminder that is not in the store does nothing.
+    store.apply_deleted(2)
+    assert len(store) == 2
+
+    store.load(())
+    assert len(store) == 0
+    # Every change bumps the version.
+    assert store.version > version
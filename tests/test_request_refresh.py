@@ -0,0 +1,31 @@
+from business import request_refresh
+
+
+def test_request_refresh(mocker):
+    """
+    Test that one edit results in one refresh of the treeview.
+    """
+    app = mocker.Mock()
+    app.refresh_id = None
+    app.refresh_count = 0
+    app.after_idle.return_value = "idle#1"
+    mocker.patch("business.get_store")
+    show_data = mocker.patch("business.show_data")
+
+    # An edit requests a refresh; more requests before the app is idle are
+    # coalesced.
+    request_refresh(app)
+    request_refresh(app)
+    assert app.after_idle.call_count == 1
+    assert app.refresh_count == 0
+
+    # Run the idle callback.
+    callback, *args = app.after_idle.call_args[0]
+    callback(*args)
+    assert app.refresh_count == 1
+    show_data.assert_called_once()
+    assert app.refresh_id is None
+
+    # A later edit schedules a new refresh.
+    request_refresh(app)
+    assert app.after_idle.call_count == 3  # including clear_refreshed
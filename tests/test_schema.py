@@ -0,0 +1,81 @@
+import sqlite3
+
+import pytest
+
+from schema import (
+    SCHEMA_VERSION,
+    create_tables,
+    make_description_index_unique,
+    migrate,
+    schema_version,
+)
+
+
+@pytest.fixture
+def con(make_db):
+    """
+    A database with the tables of a version 0 schema.
+    """
+    return make_db("schema.db", schema=create_tables)
+
+
+def index_sql(con, name):
+    return con.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = ?",
+        (name,),
+    ).fetchone()[0]
+
+
+def test_migrate(con):
+    """
+    Test that the indexes are added and the pending view uses them.
+    """
+    assert schema_version(con) == 0
+    assert migrate(con) == SCHEMA_VERSION
+    assert schema_version(con) == SCHEMA_VERSION
+    assert "UNIQUE" in index_sql(con, "idx_reminders_description")
+    plan = " ".join(
+        row[-1]
+        for row in con.execute(
+            """
+            EXPLAIN QUERY PLAN SELECT * FROM reminders
+            WHERE date_next >= ? ORDER BY date_next, id
+            """,
+            ("2025-01-01",),
+        )
+    )
+    assert "idx_reminders_date_next" in plan
+    assert "TEMP B-TREE" not in plan
+    # Duplicate descriptions are rejected by the unique index.
+    con.execute("INSERT INTO reminders (description) VALUES ('test1')")
+    with pytest.raises(sqlite3.IntegrityError):
+        con.execute("INSERT INTO reminders (description) VALUES ('test1')")
+    # Migrating again does nothing.
+    assert migrate(con) == SCHEMA_VERSION
+
+
+def test_migrate_with_duplicates(con):
+    """
+    Test that existing duplicate descriptions get a non-unique index.
+    """
+    with con:
+        con.executemany(
+            "INSERT INTO reminders (description) VALUES (?)",
+            [("test1",), ("test1",)],
+        )
+    assert migrate(con) == SCHEMA_VERSION
+    assert "UNIQUE" not in index_sql(con, "idx_reminders_description")
+    assert con.execute("SELECT COUNT(*) FROM reminders").fetchone()[0] == 2
+    assert not make_description_index_unique(con)
+
+    # Once the duplicate is removed, the next migrate makes the index unique.
+    with con:
+        con.execute("DELETE FROM reminders WHERE id = 2")
+        con.executemany(
+            "INSERT INTO reminders (description) VALUES (?)",
+            [(None,), (None,)],
+        )
+    assert migrate(con) == SCHEMA_VERSION
+    assert "UNIQUE" in index_sql(con, "idx_reminders_description")
+    with pytest.raises(sqlite3.IntegrityError):
+        con.execute("INSERT INTO reminders (description) VALUES ('test1')")
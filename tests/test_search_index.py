@@ -0,0 +1,85 @@
+from datetime import date
+
+import pytest
+
+from models import Reminder
+from reminder_store import ReminderStore
+from search_module import SearchIndex
+
+
+@pytest.fixture
+def reminders():
+    return [
+        Reminder(
+            1,
+            "Clean gutters",
+            "1",
+            "years",
+            "2025-01-01",
+            "2026-01-01",
+            "ladder in garage",
+        ),
+        Reminder(
+            2,
+            "Replace furnace filter",
+            "3",
+            "months",
+            "2025-03-01",
+            "2025-06-01",
+            "",
+        ),
+        Reminder(
+            3,
+            "Gutter guards",
+            "1",
+            "one-time",
+            "2025-02-01",
+            "2025-02-01",
+            "check price",
+        ),
+    ]
+
+
+def test_search_index(reminders):
+    """
+    Test that queries return matching ids in treeview order.
+    """
+    index = SearchIndex(reminders)
+    # Case-insensitive substring matches, ordered by date_next.
+    assert index.search("GUTTER") == [3, 1]
+    assert index.search("utte") == [3, 1]
+    # Short queries and queries spanning fields.
+    assert index.search("a") == [3, 2, 1]
+    assert index.search("in g") == [1]
+    assert index.search("filter 3") == [2]
+    assert index.search("missing") == []
+    assert index.search("") == []
+    # Restrict to reminders due on or after a date, as in the pending view.
+    assert index.search("gutter", since=date(2025, 3, 1)) == [1]
+
+
+def test_search_index_follows_store(reminders):
+    """
+    Test that the index is updated as the store changes.
+    """
+    store = ReminderStore(reminders)
+    index = SearchIndex(store.all())
+    store.subscribe(index)
+
+    new = Reminder(
+        10, "Gutter check", "1", "days", "2025-01-01", "2025-01-02", ""
+    )
+    store.apply_saved(new)
+    assert index.search("gutter") == [new.id, 3, 1]
+    store.apply_saved(
+        Reminder(
+            new.id, "Roof check", "1", "days", "2025-01-01", "2025-01-02", ""
+        )
+    )
+    assert index.search("gutter") == [3, 1]
+    assert index.search("roof") == [new.id]
+    store.apply_deleted(1)
+    assert index.search("gutter") == [3]
+    store.load(reminders[1:])
+    assert index.search("gutter") == [3]
+    assert index.search("roof") == []
@@ -0,0 +1,103 @@
+import pytest
+
+from models import Reminder
+from reminder_store import ReminderStore
+from search_module import SearchIndex, SearchSession
+
+
+@pytest.fixture
+def store():
+    """
+    A ReminderStore with three reminders, two of them matching "gutter".
+    """
+    rows = [
+        (1, "Clean gutters", "1", "years", "2025-01-01", "2026-01-01", ""),
+        (2, "Furnace filter", "3", "months", "2025-03-01", "2025-06-01", ""),
+        (3, "Gutter guards", "1", "days", "2025-02-01", "2025-02-01", ""),
+    ]
+    return ReminderStore(Reminder.from_row(r) for r in rows)
+
+
+@pytest.fixture
+def session(store):
+    index = SearchIndex(store.all())
+    store.subscribe(index)
+    return SearchSession(index, store)
+
+
+def test_next_and_previous(session):
+    """
+    Test that next and previous step through the matches and wrap around.
+    """
+    assert session.next("gutter", False) == "3"
+    assert session.next("gutter", False) == "1"
+    assert session.next("gutter", False) == "3"
+    assert session.previous("gutter", False) == "1"
+    # Previous starts from the last match.
+    session.reset()
+    assert session.previous("GUTTER", False) == "1"
+    assert session.next("nothing", False) is None
+
+
+def test_new_query_starts_over(session):
+    """
+    Test that changing the query starts again from the first match.
+    """
+    session.next("gutter", False)
+    session.next("gutter", False)
+    assert session.next("gutt", False) == "3"
+
+
+def test_matches_follow_store(session, store):
+    """
+    Test that the matches are rebuilt when the reminders change.
+    """
+    assert session.next("gutter", False) == "3"
+    store.apply_saved(
+        Reminder(
+            4, "Gutter check", "1", "days", "2025-01-01", "2025-01-02", ""
+        )
+    )
+    # The current match is kept, and the new reminder is found after it.
+    assert session.next("gutter", False) == "1"
+    assert session.next("gutter", False) == "4"
+    # If the current match goes away, stepping starts over.
+    store.apply_deleted(4)
+    assert session.next("gutter", False) == "3"
+
+
+def test_full_text_matches(session):
+    """
+    Test that full-text matches come first, in rank order, followed by the
+    other substring matches.
+    """
+    # Full-text search finds words in any order, which the substring search
+    # does not.
+    session.full_text = lambda query, since: (
+        [1] if query == "gutters clean" else []
+    )
+    assert session.next("gutters clean", False) == "1"
+    assert session.matches == ["1"]
+    # The ranked full-text matches come first, even if they are later in the
+    # treeview; ids the index does not know are dropped.
+    session.full_text = lambda query, since: (
+        [1, 99] if query == "gutter" else []
+    )
+    assert session.next("gutter", False) == "1"
+    assert session.matches == ["1", "3"]
+
+
+def test_full_text_keeps_substring_matches(session):
+    """
+    Test that matches full-text search misses are still found: text in the
+    middle of a word, and text outside the description and note.
+    """
+    # Full-text search only matches word prefixes in description and note.
+    session.full_text = lambda query, since: [3] if query == "gutter" else []
+    assert session.next("utter", False) == "3"
+    assert session.matches == ["3", "1"]
+    assert session.next("months", False) == "2"
+    assert session.next("2025-03-01", False) == "2"
+    session.reset()
+    assert session.next("gutter", False) == "3"
+    assert session.matches == ["3", "1"]
@@ -0,0 +1,81 @@
+import os
+
+from business import invalidate_caches, swap_database
+from db_backup import quick_check
+from db_executor import DBExecutor
+from db_manager import ConnectionManager
+from preferences import UserPreferences
+
+
+def test_swap_database(db_path, make_db, mocker):
+    """
+    Test that the database is replaced under open WAL connections, which
+    then see only the restored data.
+    """
+    manager = ConnectionManager(db_path, wal=True)
+    mocker.patch("business.get_manager", return_value=manager)
+    mocker.patch("business.get_db_path", return_value=db_path)
+    create_database = mocker.patch("business.create_database")
+    invalidate = mocker.patch("business.invalidate_caches")
+    app = mocker.Mock()
+    app.executor = DBExecutor(app, db_path=db_path, wal=True)
+
+    # Both connections have written, so the old database has a WAL file.
+    with manager.connection() as con:
+        con.execute("INSERT INTO reminders(description) VALUES ('main')")
+    app.executor.execute(
+        "INSERT INTO reminders(description) VALUES ('worker')"
+    ).result(5)
+    assert os.path.exists(f"{db_path}-wal")
+
+    candidate = f"{db_path}.restore"
+    make_db("home_reminders.db.restore", ["restored"]).close()
+    swap_database(app, candidate)
+
+    assert not os.path.exists(candidate)
+    con = manager.connection()
+    assert quick_check(con)
+    assert con.execute("SELECT description FROM reminders").fetchall() == [
+        ("restored",)
+    ]
+    rows = app.executor.query("SELECT description FROM reminders").result(5)
+    assert rows == [("restored",)]
+    create_database.assert_called_once_with(app)
+    invalidate.assert_called_once_with(app)
+    app.executor.close(5)
+    manager.close()
+
+
+def test_invalidate_caches(mocker):
+    """
+    Test that every in-memory copy of the database is invalidated.
+    """
+    app = mocker.Mock()
+    invalidate_preferences = mocker.patch("business.invalidate_preferences")
+    get_reminders_async = mocker.patch(
+        "services.ReminderService.get_reminders_async"
+    )
+    get_user_data = mocker.patch(
+        "business.get_user_data",
+        return_value=UserPreferences("5555555555", 1, 1, 1, ""),
+    )
+    start = mocker.patch("business.start_notification_scheduler")
+    request_refresh = mocker.patch("business.request_refresh")
+
+    invalidate_caches(app)
+    invalidate_preferences.assert_called_once_with(app)
+    # The store is reloaded in the background; the rest waits for it.
+    args = get_reminders_async.call_args[0]
+    assert args[:2] == (app, app.view_current)
+    request_refresh.assert_not_called()
+    args[2](None)
+    app.search_session.reset.assert_called_once()
+    start.assert_called_once_with(app)
+    request_refresh.assert_called_once_with(app)
+
+    # A restored database without a phone number stops the scheduler.
+    get_user_data.return_value = None
+    invalidate_caches(app)
+    get_reminders_async.call_args[0][2](None)
+    app.notification_scheduler.stop.assert_called_once()
+    assert start.call_count == 1
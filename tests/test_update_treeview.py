@@ -0,0 +1,21 @@
+from business import update_treeview
+
+
+def test_update_treeview(mocker):
+    """
+    Test that switching views refreshes the treeview and focuses its first
+    row, if it has one.
+    """
+    app = mocker.Mock()
+    refresh = mocker.patch("business.refresh")
+    app.tree.get_children.return_value = ("3", "4")
+
+    update_treeview(app, True)
+    assert app.view_current is True
+    refresh.assert_called_once_with(app)
+    app.tree.focus.assert_called_once_with("3")
+
+    # An empty view leaves the focus alone.
+    app.tree.get_children.return_value = ()
+    update_treeview(app, False)
+    assert app.tree.focus.call_count == 1
@@ -22,8 +22,8 @@ from classes import TopLvl
         ),
         (
             {
-                "description": "test1",  # Duplicate description but this is an
-                # update, so it should be valid.
+                "description": "test2",  # The reminder's own description,
+                # so it is not a duplicate.
                 "frequency": "2",
                 "date_last": "2025-01-01",
                 "period": "weeks",
@@ -31,6 +31,15 @@ from classes import TopLvl
             True,
         ),
         # Invalid inputs
+        (
+            {
+                "description": "test1",  # Description of another reminder
+                "frequency": "2",
+                "date_last": "2025-01-01",
+                "period": "weeks",
+            },
+            False,
+        ),
         (
             {
                 "description": "",  # Empty description
@@ -110,7 +119,7 @@ def test_validate_inputs(inputs, expected, mocker):
     top.period_combobox.get.return_value = inputs["period"]
 
     # Get a reminder from the database to test this function.
-    reminder = fetch_reminders(app, app.view_current).fetchone()
+    reminder = fetch_reminders(app, app.view_current)[0]
     logger.info(f"reminder: {reminder}")
     id = reminder[0]
 
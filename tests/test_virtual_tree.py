@@ -0,0 +1,147 @@
+from business import clear_refreshed, render_window
+from models import Reminder
+from virtual_tree import VirtualRows
+
+
+def make_reminders(count):
+    return tuple(
+        Reminder(
+            i, f"test{i}", "1", "days", "2025-01-01", f"2030-01-{i:02}", ""
+        )
+        for i in range(1, count + 1)
+    )
+
+
+def test_virtual_rows(mocker):
+    """
+    Test that only a window of rows is rendered as the view scrolls.
+    """
+    tree = mocker.Mock()
+    tree.cget.return_value = "10"
+    tree.selection.return_value = ()
+    scrollbar = mocker.Mock()
+    windows = []
+    virtual_rows = VirtualRows(
+        tree, scrollbar, lambda rows: windows.append(rows), buffer=4
+    )
+    reminders = make_reminders(28)
+
+    virtual_rows.set_source(reminders)
+    assert virtual_rows.active
+    # Visible rows plus the bottom buffer are rendered at the top.
+    assert windows[-1] == reminders[0:14]
+    scrollbar.set.assert_called_with(0.0, 10 / 28)
+
+    # Scrolling moves the window and keeps a buffer above it.
+    virtual_rows.scroll("scroll", "1", "pages")
+    assert virtual_rows.first == 10
+    assert windows[-1] == reminders[6:24]
+    virtual_rows.scroll("moveto", "1.0")
+    assert virtual_rows.first == 18
+    assert windows[-1] == reminders[14:28]
+
+    # Seeing a row outside the window moves the window to it.
+    virtual_rows.see("2")
+    assert virtual_rows.start <= 1 < virtual_rows.stop
+    tree.see.assert_called_with("2")
+
+    # The last reminder is selected even when it is not rendered.
+    virtual_rows.scroll("moveto", "0.0")
+    virtual_rows.select_last()
+    assert virtual_rows.stop == 28
+    tree.selection_set.assert_called_with("28")
+    tree.see.assert_called_with("28")
+
+    # Turning virtual mode off reconnects the scrollbar to the treeview.
+    virtual_rows.set_source(None)
+    assert not virtual_rows.active
+    scrollbar.configure.assert_called_with(command=tree.yview)
+    tree.get_children.return_value = ("1", "2")
+    virtual_rows.select_last()
+    tree.selection_set.assert_called_with("2")
+
+
+class FakeTree:
+    """
+    The parts of a ttk.Treeview that VirtualRows uses. Deleting a row drops
+    it from the selection, as in Tk.
+    """
+
+    def __init__(self, height):
+        self.height = height
+        self.rows = ()
+        self.selected = ()
+
+    def show(self, reminders):
+        self.rows = tuple(str(r.id) for r in reminders)
+        self.selected = tuple(i for i in self.selected if i in self.rows)
+
+    def cget(self, option):
+        return str(self.height)
+
+    def exists(self, iid):
+        return iid in self.rows
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, *iids):
+        self.selected = iids
+
+    def see(self, iid):
+        pass
+
+    def configure(self, **kw):
+        pass
+
+    def yview_moveto(self, fraction):
+        pass
+
+    def yview_scroll(self, number, what):
+        pass
+
+
+def test_selection_survives_scrolling(mocker):
+    """
+    Test that a selected row scrolled out of the window is selected again
+    when it comes back, and that a cleared selection stays cleared.
+    """
+    tree = FakeTree(10)
+    virtual_rows = VirtualRows(tree, mocker.Mock(), tree.show, buffer=4)
+    reminders = make_reminders(28)
+    virtual_rows.set_source(reminders)
+    tree.selection_set("2")
+
+    # Scrolled out of the window, the row is deleted and not selected.
+    virtual_rows.scroll("moveto", "1.0")
+    assert not tree.exists("2")
+    assert tree.selection() == ()
+    # Back in the window, it is selected again.
+    virtual_rows.scroll("moveto", "0.0")
+    assert tree.selection() == ("2",)
+
+    # A selection cleared in the window is not restored.
+    tree.selection_set()
+    virtual_rows.scroll("moveto", "1.0")
+    virtual_rows.scroll("moveto", "0.0")
+    assert tree.selection() == ()
+
+    # A new source keeps the selected reminder selected.
+    tree.selection_set("3")
+    virtual_rows.set_source(reminders[1:])
+    assert tree.selection() == ("3",)
+
+
+def test_render_window_ignores_selection_events(mocker):
+    """
+    Test that moving the window, like a refresh, keeps the resulting
+    selection events from opening the edit window.
+    """
+    app = mocker.Mock()
+    app.refreshed = False
+    reconcile_data = mocker.patch("business.reconcile_data")
+    rows = make_reminders(3)
+    render_window(app, rows)
+    reconcile_data.assert_called_once_with(app, rows)
+    assert app.refreshed
+    app.after_idle.assert_called_once_with(clear_refreshed, app)
@@ -14,15 +14,17 @@ from business import (
     opt_in,
     opt_out,
     preferences,
-    refresh,
+    render_window,
     restore,
     validate_inputs,
     view_all,
     view_pending,
 )
 from classes import InfoMsgBox, TopLvl, YesNoMsgBox
-from search_module import next_found
+from constants import ROW_TAG_COLORS
+from search_module import get_search_session, next_found, previous_found
 from services import ReminderService
+from virtual_tree import VirtualRows
 
 
 def create_menu_bar(self):
@@ -255,13 +257,13 @@ def create_preferences_window(self):  # noqa: PLR0915
         command=preferences_window.destroy,
     ).grid(row=4, column=1, padx=(15, 0), pady=15, sticky="w")
     # Get existing preferences, if present, and insert into preferences window.
-    user_data_tuple = ReminderService.get_user_preferences(self)
-    # user_data.tuple[0] = phone number. Indicates that user exists.
-    if user_data_tuple[0]:
-        entry.insert(0, user_data_tuple[0])
-        self.var1.set(user_data_tuple[1])  # week_before
-        self.var2.set(user_data_tuple[2])  # day_before
-        self.var3.set(user_data_tuple[3])  # day_of
+    preferences = ReminderService.get_user_preferences(self)
+    # A phone number indicates that the user exists.
+    if preferences and preferences.opted_in:
+        entry.insert(0, preferences.phone_number)
+        self.var1.set(preferences.week_before)
+        self.var2.set(preferences.day_before)
+        self.var3.set(preferences.day_of)
 
     entry.focus_set()
 
@@ -279,11 +281,16 @@ def create_edit_window(self, event) -> Any:
     if self.refreshed:
         self.refreshed = False
         return
+    # A row that was deleted or scrolled out of the window leaves nothing
+    # selected.
+    selection = self.tree.selection()
+    if not selection:
+        return
     # Remove any existing toplevels
     remove_toplevels(self)
     # create toplevel
     top = TopLvl(self, "Edit Selection")
-    selected_item = self.tree.selection()[0]
+    selected_item = selection[0]
     # Populate entries with data from the selection
     top.description_entry.insert(0, self.tree.item(selected_item)["values"][1])
     top.frequency_entry.insert(0, self.tree.item(selected_item)["values"][2])
@@ -330,10 +337,14 @@ def create_edit_window(self, event) -> Any:
             top.note_entry.get(),
             self.tree.item(selected_item)["values"][0],
         )
-        success = ReminderService.update_reminder(self, values)
-        if success:
-            refresh(self)
-            remove_toplevels(self)
+
+        def updated(success: bool) -> None:
+            if success:
+                remove_toplevels(self)
+
+        # The update runs on the database worker; the refresh of the treeview
+        # is requested when it is done.
+        ReminderService.update_reminder_async(self, values, updated)
 
     def delete_item() -> Any:
         """
@@ -363,11 +374,13 @@ def create_edit_window(self, event) -> Any:
         )
         if not answer.get_response():
             return
-        # delete reminder
-        delete_reminder_success = ReminderService.delete_reminder(self, id)
-        if delete_reminder_success:
-            refresh(self)
-            remove_toplevels(self)
+
+        def deleted(success: bool) -> None:
+            if success:
+                remove_toplevels(self)
+
+        # delete reminder on the database worker
+        ReminderService.delete_reminder_async(self, id, deleted)
 
     ttk.Button(top, text="Update", command=update_item).grid(
         row=2, column=1, pady=(15, 0), sticky="w"
@@ -424,10 +437,17 @@ def create_new(self) -> Any:
             date_next,
             top.note_entry.get(),
         )
-        success = ReminderService.save_reminder(self, values)
-        if success:
+
+        def saved(success: bool) -> None:
+            if not top.winfo_exists():
+                return
             save_btn.config(state="normal")
-            top.destroy()
+            if success:
+                top.destroy()
+
+        # disable Save until the database worker has saved the reminder
+        save_btn.config(state="disabled")
+        ReminderService.save_reminder_async(self, values, saved)
 
     def cancel():
         top.destroy()
@@ -481,6 +501,9 @@ def create_tree_widget(self):
         "note",
     )
     tree["displaycolumns"] = displaycolumns
+    # Configure the row highlighting tags once for all rows.
+    for tag, color in ROW_TAG_COLORS.items():
+        tree.tag_configure(tag, background=color)
 
     tree.bind(
         "<<TreeviewSelect>>", lambda event: create_edit_window(self, event)
@@ -491,6 +514,10 @@ def create_tree_widget(self):
     scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=tree.yview)
     tree.configure(yscroll=scrollbar.set)
     scrollbar.grid(row=1, column=2, pady=(0, 0), sticky="ns")
+    # Show long lists of reminders a window at a time.
+    self.virtual_rows = VirtualRows(
+        tree, scrollbar, lambda rows: render_window(self, rows)
+    )
     return tree
 
 
@@ -534,9 +561,15 @@ def create_searchbar(self):
     self.search_next_btn.grid(
         row=0, column=1, padx=(0, 260), pady=10, sticky="se"
     )
+    # Return steps to the next match, Shift-Return to the previous one.
+    self.search_entry.bind("<Return>", lambda e: next_found(self, search_var))
+    self.search_entry.bind(
+        "<Shift-Return>", lambda e: previous_found(self, search_var)
+    )
 
     def reset():
         self.search_entry.delete(0, tk.END)
+        get_search_session(self).reset()
 
     self.search_reset_btn = Button(
         self,
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence
+
+from constants import VIRTUAL_TREE_BUFFER
+from models import Reminder
+
+if TYPE_CHECKING:
+    from tkinter import ttk
+
+
+class VirtualRows:
+    """
+    Shows a window of a long list of reminders in a treeview.
+
+    Only the visible rows plus a buffer above and below them are inserted in
+    the treeview. While active, the scrollbar is driven by the position in
+    the full list and the window is moved as the user scrolls. Rows are
+    rendered by the render callback, which brings the treeview in line with
+    the rows of the window.
+    """
+
+    def __init__(
+        self,
+        tree: ttk.Treeview,
+        scrollbar: ttk.Scrollbar,
+        render: Callable[[Sequence[Reminder]], Any],
+        buffer: int = VIRTUAL_TREE_BUFFER,
+    ):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.render = render
+        self.buffer = buffer
+        self.source: Optional[Sequence[Reminder]] = None
+        # Index in the source of the top visible row, and the range of rows
+        # currently inserted in the treeview.
+        self.first = 0
+        self.start = 0
+        self.stop = 0
+        # The iid of the selected row, remembered while the row is scrolled
+        # out of the window, so that it is selected again when it is back.
+        self.selected: Optional[str] = None
+        self._positions: Optional[Dict[str, int]] = None
+
+    @property
+    def active(self) -> bool:
+        """
+        True if the treeview is showing a window of the source.
+        """
+        return self.source is not None
+
+    @property
+    def visible(self) -> int:
+        """
+        The number of rows the treeview displays at once.
+        """
+        return int(self.tree.cget("height"))
+
+    def set_source(self, source: Optional[Sequence[Reminder]]) -> None:
+        """
+        Shows a window of source, or turns virtual mode off if it is None.
+        """
+        if source is None:
+            if self.active:
+                self.source = None
+                self.selected = None
+                self.tree.configure(yscrollcommand=self.scrollbar.set)
+                self.scrollbar.configure(command=self.tree.yview)
+            return
+        if not self.active:
+            self.tree.configure(yscrollcommand=self._on_tree_scroll)
+            self.scrollbar.configure(command=self.scroll)
+        self.source = source
+        self._positions = None
+        self._render()
+
+    def scroll(self, *args: str) -> None:
+        """
+        Scrollbar command: moves the window in the full list.
+        """
+        if not self.active:
+            return
+        if args[0] == "moveto":
+            self.first = int(float(args[1]) * len(self.source))
+        elif args[0] == "scroll":
+            step = self.visible if args[2] == "pages" else 1
+            self.first += int(args[1]) * step
+        self._render()
+
+    def see(self, iid: str) -> None:
+        """
+        Moves the window so that the row with the given iid is visible.
+        """
+        if not self.active:
+            self.tree.see(iid)
+            return
+        index = self._position(iid)
+        if index is None:
+            return
+        if not self.start <= index < self.stop:
+            self.first = index - self.visible // 2
+            self._render()
+        self.tree.see(iid)
+
+    def select_last(self) -> None:
+        """
+        Selects the row of the last reminder in the list.
+
+        In virtual mode the last reminder may not be rendered, so the window
+        is first moved to it.
+        """
+        if not self.active:
+            children = self.tree.get_children()
+            if children:
+                self.tree.selection_set(children[-1])
+            return
+        if not len(self.source):
+            return
+        iid = str(self.source[-1].id)
+        self.see(iid)
+        self.tree.selection_set(iid)
+
+    def _position(self, iid: str) -> Optional[int]:
+        if self._positions is None:
+            self._positions = {
+                str(r.id): index for index, r in enumerate(self.source)
+            }
+        return self._positions.get(iid)
+
+    def _render(self) -> None:
+        self._remember_selection()
+        count = len(self.source)
+        self.first = max(0, min(self.first, count - self.visible))
+        self.start = max(0, self.first - self.buffer)
+        self.stop = min(count, self.first + self.visible + self.buffer)
+        self.render(self.source[self.start : self.stop])
+        self._restore_selection()
+        # Put the first visible row at the top of the treeview.
+        self.tree.yview_moveto(0)
+        self.tree.yview_scroll(self.first - self.start, "units")
+        self._update_scrollbar()
+
+    def _remember_selection(self) -> None:
+        selection = self.tree.selection()
+        if selection:
+            self.selected = selection[0]
+        elif self.selected is not None and self.tree.exists(self.selected):
+            # The row is in the window but not selected, so the user cleared
+            # the selection.
+            self.selected = None
+
+    def _restore_selection(self) -> None:
+        if (
+            self.selected is not None
+            and not self.tree.selection()
+            and self.tree.exists(self.selected)
+        ):
+            self.tree.selection_set(self.selected)
+
+    def _update_scrollbar(self) -> None:
+        count = len(self.source)
+        if count:
+            last = min(count, self.first + self.visible)
+            self.scrollbar.set(self.first / count, last / count)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_tree_scroll(self, lo: str, hi: str) -> None:
+        # The treeview scrolled within the window, by mouse wheel or keyboard.
+        if not self.active:
+            return
+        size = self.stop - self.start
+        if not size:
+            return
+        self.first = self.start + round(float(lo) * size)
+        # Move the window once the top or bottom buffer runs low.
+        margin = self.buffer // 2
+        near_top = self.start > 0 and self.first - self.start < margin
+        near_bottom = (
+            self.stop < len(self.source)
+            and self.stop - (self.first + self.visible) < margin
+        )
+        if near_top or near_bottom:
+            self._render()
+        else:
+            self._update_scrollbar()